@@ -26,11 +26,14 @@ The AlignmentMapper class is at the heart of mapping between aligned sequences.
 #
 
 import math
+from collections import OrderedDict
+from threading import RLock
 
 from bioutils.coordinates import strand_int_to_pm
 
 import hgvs.location
 from hgvs import global_config
+from hgvs.decorators.lru_cache import _CacheInfo
 from hgvs.enums import Datum
 from hgvs.exceptions import (
     HGVSDataNotAvailableError,
@@ -544,6 +547,61 @@ class AlignmentMapper:
             uncertain=grs_cigar in "DI" or gre_cigar in "DI",
         )
 
+    def g_to_n_array(self, g_positions, strict_bounds: bool | None = None):
+        """convert an array of genomic (g.) positions to transcript (n.) positions
+
+        This is a vectorized equivalent of the start position returned
+        by g_to_n for single-position intervals, and requires numpy.
+
+        :param g_positions: array-like of g. positions
+        :returns: tuple of numpy arrays (n. base, n. offset, CIGAR op)
+        """
+        import numpy as np  # noqa: PLC0415
+
+        if strict_bounds is None:
+            strict_bounds = global_config.mapping.strict_bounds
+
+        grs = np.asarray(g_positions, dtype=np.int64) - 1 - self.gc_offset
+        if self.strand == -1:
+            pos, offset, ops = self.cigarmapper.map_ref_to_tgt_array(
+                grs, end="end", strict_bounds=strict_bounds
+            )
+            pos = self.tgt_len - 1 - pos
+            offset = -offset
+        else:
+            pos, offset, ops = self.cigarmapper.map_ref_to_tgt_array(
+                grs, end="start", strict_bounds=strict_bounds
+            )
+        return np.where(pos >= 0, pos + 1, pos), offset, ops
+
+    def n_to_g_array(self, n_bases, n_offsets=None, strict_bounds: bool | None = None):
+        """convert arrays of transcript (n.) positions to genomic (g.) positions
+
+        This is a vectorized equivalent of the start position returned
+        by n_to_g for single-position intervals, and requires numpy.
+
+        :param n_bases: array-like of n. bases
+        :param n_offsets: array-like of n. offsets; None means all zero
+        :returns: tuple of numpy arrays (g. position, CIGAR op)
+        """
+        import numpy as np  # noqa: PLC0415
+
+        if strict_bounds is None:
+            strict_bounds = global_config.mapping.strict_bounds
+
+        n_bases = np.asarray(n_bases, dtype=np.int64)
+        n_offsets = (
+            np.zeros_like(n_bases) if n_offsets is None else np.asarray(n_offsets, dtype=np.int64)
+        )
+        frs = np.where(n_bases >= 1, n_bases - 1, n_bases)
+        if self.strand == -1:
+            frs = self.tgt_len - 1 - frs
+            n_offsets = -n_offsets
+        grs, _, ops = self.cigarmapper.map_tgt_to_ref_array(
+            frs, end="start", strict_bounds=strict_bounds
+        )
+        return grs + self.gc_offset + 1 + n_offsets, ops
+
     def n_to_c(
         self,
         n_interval: Interval,
@@ -906,6 +964,66 @@ class AlignmentMapper:
         )
 
 
+class AlignmentMapperCache:
+    """Least-recently-used cache of AlignmentMapper instances, keyed by
+    (tx_ac, alt_ac, alt_aln_method)
+
+    Building an AlignmentMapper requires fetching and sorting exons
+    and parsing the transcript CIGAR, so mappers are worth keeping
+    for reuse.  A cache is bound to a single data provider and may be
+    shared by a VariantMapper and the AssemblyMapper, Normalizer, and
+    Validator instances that it uses or that use it.
+
+    :param hdp: HGVS Data Provider Interface-compliant instance (see :class:`hgvs.dataproviders.interface.Interface`)
+    :param int maxsize: maximum number of mappers to retain; None means unbounded
+
+    """
+
+    def __init__(self, hdp, maxsize=global_config.lru_cache.alignment_mapper_maxsize):
+        self.hdp = hdp
+        self.maxsize = maxsize
+        self._mappers = OrderedDict()
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.cache_info()})"
+
+    def get(self, tx_ac, alt_ac, alt_aln_method):
+        """return the AlignmentMapper for the given alignment, building
+        (and caching) it if necessary"""
+        key = (tx_ac, alt_ac, alt_aln_method)
+        with self._lock:
+            am = self._mappers.get(key)
+            if am is not None:
+                self._mappers.move_to_end(key)
+                self._hits += 1
+                return am
+        am = AlignmentMapper(self.hdp, tx_ac=tx_ac, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
+        with self._lock:
+            self._misses += 1
+            if self.maxsize == 0:
+                return am
+            self._mappers[key] = am
+            self._mappers.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._mappers) > self.maxsize:
+                    self._mappers.popitem(last=False)
+        return am
+
+    def cache_info(self):
+        """report cache statistics as (hits, misses, maxsize, currsize)"""
+        with self._lock:
+            return _CacheInfo(self._hits, self._misses, self.maxsize, len(self._mappers))
+
+    def cache_clear(self):
+        """clear the cache and cache statistics"""
+        with self._lock:
+            self._mappers.clear()
+            self._hits = self._misses = 0
+
+
 # <LICENSE>
 # Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
 #
@@ -11,6 +11,7 @@ from hgvs.exceptions import (
     HGVSUnsupportedOperationError,
 )
 from hgvs.utils.position import get_start_end
+from hgvs.utils.reftranscriptdata import RefTranscriptData
 from hgvs.variantmapper import VariantMapper
 
 _logger = logging.getLogger(__name__)
@@ -45,6 +46,8 @@ class AssemblyMapper(VariantMapper):
     NC_000006.11). It does not support contigs or other genomic
     sequences (e.g., NT_167249.1).
 
+    Like VariantMapper, an AssemblyMapper may be shared among threads.
+
     """
 
     def __init__(
@@ -90,6 +93,7 @@ class AssemblyMapper(VariantMapper):
                 replace_reference=replace_reference,
                 prevalidation_level=prevalidation_level,
                 add_gene_symbol=add_gene_symbol,
+                alignment_mapper_cache=self.alignment_mapper_cache,
             )
             self._norm = hgvs.normalizer.Normalizer(
                 hdp,
@@ -97,10 +101,22 @@ class AssemblyMapper(VariantMapper):
                 validate=False,
                 variantmapper=vm,
             )
-        self._assembly_map = {
-            k: v for k, v in hdp.get_assembly_map(self.assembly_name).items() if k.startswith("NC_")
-        }
-        self._assembly_accessions = set(self._assembly_map.keys())
+        self._lazy_assembly_map = None
+
+    @property
+    def _assembly_map(self):
+        """chromosomal accession -> name for assembly_name, loaded on first use"""
+        if self._lazy_assembly_map is None:
+            self._lazy_assembly_map = {
+                k: v
+                for k, v in self.hdp.get_assembly_map(self.assembly_name).items()
+                if k.startswith("NC_")
+            }
+        return self._lazy_assembly_map
+
+    @property
+    def _assembly_accessions(self):
+        return self._assembly_map.keys()
 
     def __repr__(self):
         return (
@@ -176,6 +192,97 @@ class AssemblyMapper(VariantMapper):
         )
         return self._maybe_normalize(var_out)
 
+    # ############################################################################
+    # batch mapping
+
+    def g_to_c_many(self, var_g_tx_acs):
+        """Map many g. variants to c. variants
+
+        :param var_g_tx_acs: iterable of (var_g, tx_ac) pairs
+        :returns: list, in input order, of c. variants or, for variants
+            that could not be mapped, the HGVSError instance raised
+
+        Inputs are grouped by (tx_ac, alt_ac, alt_aln_method) and
+        mapped group by group, so that the AlignmentMapper for each
+        group is built once and then served from the alignment
+        mapper cache.
+
+        """
+
+        def map_one(item, key, _):
+            var_g, _ = item
+            var_out = VariantMapper.g_to_c(self, var_g, key[0], alt_aln_method=key[2])
+            return self._maybe_normalize(var_out)
+
+        return self._map_many(
+            var_g_tx_acs,
+            key_fn=lambda item: (item[1], item[0].ac, self.alt_aln_method),
+            map_fn=map_one,
+        )
+
+    def c_to_g_many(self, var_cs):
+        """Map many c. variants to g. variants
+
+        :param var_cs: iterable of c. variants
+        :returns: list, in input order, of g. variants or, for variants
+            that could not be mapped, the HGVSError instance raised
+
+        Inputs are grouped by (tx_ac, alt_ac, alt_aln_method) and
+        mapped group by group, so that the AlignmentMapper for each
+        group is built once and then served from the alignment
+        mapper cache.
+
+        """
+
+        def map_one(var_c, key, _):
+            var_out = VariantMapper.c_to_g(self, var_c, key[1], alt_aln_method=key[2])
+            return self._maybe_normalize(var_out)
+
+        return self._map_many(
+            var_cs,
+            key_fn=self._tx_alignment_key,
+            map_fn=map_one,
+        )
+
+    def c_to_p_many(self, var_cs, translation_table=TranslationTable.standard):
+        """Map many c. variants to p. variants
+
+        :param var_cs: iterable of c. variants
+        :returns: list, in input order, of p. variants or, for variants
+            that could not be mapped, the HGVSError instance raised
+
+        Inputs are grouped by (tx_ac, alt_ac, alt_aln_method) so that
+        RefTranscriptData is built once per transcript.
+
+        """
+
+        def key_fn(var_c):
+            # checked before grouping, so that, e.g., a non-c. variant fails
+            # as in c_to_p rather than when building RefTranscriptData
+            self._check_c_to_p_input(var_c)
+            return self._tx_alignment_key(var_c)
+
+        def map_one(var_c, key, reference_data):
+            _, alt_ac, alt_aln_method = key
+            var_c = self._fill_ref(var_c, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
+            var_out = self._c_to_p_with_reference_data(
+                var_c,
+                reference_data,
+                pro_ac=None,
+                alt_ac=alt_ac,
+                alt_aln_method=alt_aln_method,
+            )
+            return self._maybe_normalize(var_out)
+
+        return self._map_many(
+            var_cs,
+            key_fn=key_fn,
+            setup_fn=lambda key: RefTranscriptData(
+                self.hdp, key[0], None, translation_table=translation_table
+            ),
+            map_fn=map_one,
+        )
+
     def relevant_transcripts(self, var_g):
         """return list of transcripts accessions (strings) for given variant,
         selected by genomic overlap"""
@@ -235,6 +342,44 @@ class AssemblyMapper(VariantMapper):
         assert len(alt_acs) == 1, "Should have exactly one alignment at this point"
         return alt_acs[0]
 
+    def _tx_alignment_key(self, var_t):
+        """return (tx_ac, alt_ac, alt_aln_method) for a transcript variant"""
+        return (var_t.ac, self._alt_ac_for_tx_ac(var_t.ac), self.alt_aln_method)
+
+    @staticmethod
+    def _map_many(items, key_fn, map_fn, setup_fn=None):
+        """map items in groups that share expensive setup
+
+        key_fn(item) returns the group key for an item, setup_fn(key)
+        returns the context shared by a group (None if setup_fn is
+        None), and map_fn(item, key, context) maps one item.
+        HGVSErrors raised for a group or an item are returned in place
+        of the result for the affected items.  Results are returned in
+        input order.
+
+        """
+        items = list(items)
+        results = [None] * len(items)
+        groups = {}
+        for i, item in enumerate(items):
+            try:
+                groups.setdefault(key_fn(item), []).append(i)
+            except HGVSError as e:
+                results[i] = e
+        for key, idxs in groups.items():
+            try:
+                context = setup_fn(key) if setup_fn is not None else None
+            except HGVSError as e:
+                for i in idxs:
+                    results[i] = e
+                continue
+            for i in idxs:
+                try:
+                    results[i] = map_fn(items[i], key, context)
+                except HGVSError as e:
+                    results[i] = e
+        return results
+
     def _fetch_AlignmentMapper(self, tx_ac, alt_ac=None, alt_aln_method=None):
         """convenience version of VariantMapper._fetch_AlignmentMapper that
         derives alt_ac from transcript, assembly, and alt_aln_method
@@ -0,0 +1,320 @@
+"""map many variants in parallel processes
+
+:func:`run` applies an operation (e.g., mapping to the genome) to each
+record in a stream of HGVS strings or VCF data lines, and yields a
+:class:`Result` for each record, in input order.  Records are sent in
+chunks to a pool of worker processes, each of which has its own data
+provider and mappers.  Only a bounded number of chunks are in
+progress at a time, so a large input is processed in bounded memory
+and as fast as the results are consumed.  An error for a record is
+returned in its result, and does not stop the batch; an
+HGVSUsageError (e.g., a cache mode without a cache file) is raised
+instead, because it would recur for every record.  For example::
+
+    >> import hgvs.batch
+    >> records = ["NM_000551.3:c.1A>G", "NM_000551.3:c.bogus"]
+    >> for result in hgvs.batch.run(records, "to_g", processes=4):
+    ..     print(result.record, result.value, result.error)
+    NM_000551.3:c.1A>G NC_000003.12:g.10141848A>G None
+    NM_000551.3:c.bogus None HGVSParseError: NM_000551.3:c.bogus: char 15: ...
+
+The same is available from the command line::
+
+    $ hgvs-batch to_g variants.txt > variants.tsv
+
+Each worker connects with
+``hgvs.dataproviders.uta.connect(**connect_kwargs)``, so it honors
+UTA_DB_URL and HGVS_SEQREPO_DIR.  Workers that connect with
+``mode="shared"`` and the same cache file share query results (see
+:func:`hgvs.dataproviders.uta.connect`).
+
+Operations are the names in :data:`OPERATIONS`, or any picklable
+function that takes a :class:`Context` and a record and returns a
+string or list of strings.
+
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import functools
+import itertools
+import logging
+import os
+import sys
+
+import attr
+
+import hgvs
+from hgvs.exceptions import HGVSUsageError
+
+_logger = logging.getLogger(__name__)
+
+# state of a worker process; see _init_worker
+_worker = None
+
+
+@attr.s(slots=True, frozen=True)
+class Result:
+    """the result of an operation on one record
+
+    value is the value returned by the operation, or None if the
+    operation raised an exception, in which case error is the
+    exception as a string.
+    """
+
+    record = attr.ib()
+    value = attr.ib(default=None)
+    error = attr.ib(default=None)
+
+
+class Context:
+    """a data provider and the hgvs objects that operations use,
+    created on first use"""
+
+    def __init__(self, assembly_name=hgvs.global_config.mapping.assembly, connect_kwargs=None):
+        self.assembly_name = assembly_name
+        self.connect_kwargs = connect_kwargs or {}
+
+    @functools.cached_property
+    def hdp(self):
+        import hgvs.dataproviders.uta  # noqa: PLC0415
+
+        return hgvs.dataproviders.uta.connect(**self.connect_kwargs)
+
+    @functools.cached_property
+    def parser(self):
+        import hgvs.parsers  # noqa: PLC0415
+
+        return hgvs.parsers.Parser()
+
+    @functools.cached_property
+    def am(self):
+        import hgvs.assemblymapper  # noqa: PLC0415
+
+        return hgvs.assemblymapper.AssemblyMapper(self.hdp, assembly_name=self.assembly_name)
+
+    @functools.cached_property
+    def normalizer(self):
+        import hgvs.normalizer  # noqa: PLC0415
+
+        return hgvs.normalizer.Normalizer(self.hdp)
+
+    @functools.cached_property
+    def babelfish(self):
+        import hgvs.extras.babelfish  # noqa: PLC0415
+
+        return hgvs.extras.babelfish.Babelfish(self.hdp, assembly_name=self.assembly_name)
+
+
+############################################################################
+# Operations
+
+
+def normalize(ctx, record):
+    """normalize an HGVS variant"""
+    return str(ctx.normalizer.normalize(ctx.parser.parse(record)))
+
+
+def to_g(ctx, record):
+    """map a c., n., or g. variant to the assembly"""
+    var = ctx.parser.parse(record)
+    if var.type == "g":
+        return str(var)
+    return str(ctx.am.t_to_g(var))
+
+
+def to_t(ctx, record):
+    """map a g. variant to each of its relevant transcripts"""
+    var_g = ctx.parser.parse(record)
+    return [str(ctx.am.g_to_t(var_g, tx_ac)) for tx_ac in ctx.am.relevant_transcripts(var_g)]
+
+
+def to_p(ctx, record):
+    """map a c. variant to its protein consequence"""
+    return str(ctx.am.c_to_p(ctx.parser.parse(record)))
+
+
+def to_vcf(ctx, record):
+    """convert a g. variant to a variant id of the form chrom-pos-ref-alt"""
+    chrom, pos, ref, alt, _ = ctx.babelfish.hgvs_to_vcf(ctx.parser.parse(record))
+    return f"{chrom}-{pos}-{ref}-{alt}"
+
+
+def vcf_to_g(ctx, record):
+    """convert a VCF data line to a g. variant for each ALT allele"""
+    try:
+        chrom, pos, _, ref, alts = record.split("\t")[:5]
+    except ValueError:
+        msg = f"Expected at least 5 tab-separated VCF fields: {record!r}"
+        raise ValueError(msg) from None
+    return [str(ctx.babelfish.vcf_to_g_hgvs(chrom, int(pos), ref, alt)) for alt in alts.split(",")]
+
+
+OPERATIONS = {fn.__name__: fn for fn in (normalize, to_g, to_t, to_p, to_vcf, vcf_to_g)}
+
+
+############################################################################
+# Driver
+
+
+def run(
+    records,
+    operation,
+    *,
+    assembly_name=hgvs.global_config.mapping.assembly,
+    connect_kwargs=None,
+    processes=None,
+    chunk_size=100,
+    max_pending=None,
+):
+    """apply operation to each of records in parallel processes, and
+    yield a Result for each record, in input order
+
+    :param records: HGVS strings or VCF data lines
+    :type records: iterable of str
+    :param operation: name of an operation in OPERATIONS, or a
+        picklable function of a Context and a record
+    :param str assembly_name: assembly used for mapping (e.g., GRCh38)
+    :param dict connect_kwargs: keyword arguments to
+        hgvs.dataproviders.uta.connect for each worker
+    :param int processes: number of worker processes (default:
+        os.cpu_count()); 0 applies the operation in this process
+    :param int chunk_size: number of records sent to a worker at once
+    :param int max_pending: maximum number of chunks in progress
+        (default: 2 * processes); records are read from records only
+        as results are consumed
+
+    """
+    if isinstance(operation, str) and operation not in OPERATIONS:
+        msg = f"Unknown operation {operation!r}; expected one of {', '.join(OPERATIONS)}"
+        raise ValueError(msg)
+    if chunk_size < 1:
+        msg = f"chunk_size must be positive; got {chunk_size}"
+        raise ValueError(msg)
+    records = iter(records)
+    chunks = iter(lambda: list(itertools.islice(records, chunk_size)), [])
+    initargs = (operation, assembly_name, connect_kwargs)
+    if processes == 0:
+        fn, ctx = _make_worker(*initargs)
+        return itertools.chain.from_iterable(_apply(fn, ctx, chunk) for chunk in chunks)
+    processes = processes or os.cpu_count()
+    return _run_parallel(chunks, initargs, processes, max_pending or 2 * processes)
+
+
+def _run_parallel(chunks, initargs, processes, max_pending):
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=processes, initializer=_init_worker, initargs=initargs
+    )
+    pending = collections.deque()
+    try:
+        for chunk in chunks:
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_run_chunk, chunk))
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # also reached if the caller stops iterating early
+        executor.shutdown(cancel_futures=True)
+
+
+def _make_worker(operation, assembly_name, connect_kwargs):
+    fn = OPERATIONS[operation] if isinstance(operation, str) else operation
+    return fn, Context(assembly_name=assembly_name, connect_kwargs=connect_kwargs)
+
+
+def _init_worker(*args):
+    global _worker  # noqa: PLW0603
+    _worker = _make_worker(*args)
+
+
+def _run_chunk(records):
+    return _apply(*_worker, records)
+
+
+def _apply(fn, ctx, records):
+    results = []
+    for record in records:
+        try:
+            results.append(Result(record, value=fn(ctx, record)))
+        except HGVSUsageError:
+            raise
+        except Exception as e:
+            _logger.debug("%s: %s", record, e, exc_info=True)
+            results.append(Result(record, error=f"{type(e).__name__}: {e}"))
+    return results
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(
+        description="map HGVS variants or VCF records in parallel processes",
+        epilog="Output is tab-separated: record, result, error.  A result"
+        " with several values (e.g., from to_t) is space-separated.",
+    )
+    ap.add_argument("operation", choices=OPERATIONS, help="operation to apply to each record")
+    ap.add_argument(
+        "input",
+        nargs="?",
+        type=argparse.FileType("r"),
+        default=sys.stdin,
+        help="file of HGVS strings or VCF data lines, one per line (default: stdin)",
+    )
+    ap.add_argument(
+        "--assembly",
+        "-a",
+        default=hgvs.global_config.mapping.assembly,
+        help="assembly name (default: %(default)s)",
+    )
+    ap.add_argument("--processes", "-p", type=int, help="worker processes (default: all cores)")
+    ap.add_argument(
+        "--chunk-size", type=int, default=100, help="records per chunk (default: %(default)s)"
+    )
+    ap.add_argument("--db-url", help="UTA database URL (default: UTA_DB_URL or configured)")
+    ap.add_argument(
+        "--cache-mode", choices=["learn", "run", "shared"], help="data provider cache mode"
+    )
+    ap.add_argument("--cache", help="data provider cache file")
+    opts = ap.parse_args(argv)
+    if opts.cache_mode and not opts.cache:
+        ap.error(f"--cache-mode={opts.cache_mode} requires --cache")
+
+    connect_kwargs = {"db_url": opts.db_url, "mode": opts.cache_mode, "cache": opts.cache}
+    records = (
+        line.rstrip("\r\n") for line in opts.input if line.strip() and not line.startswith("#")
+    )
+    if opts.operation == "vcf_to_g":
+        # only CHROM, POS, ID, REF, and ALT are used
+        records = ("\t".join(record.split("\t")[:5]) for record in records)
+    for result in run(
+        records,
+        opts.operation,
+        assembly_name=opts.assembly,
+        connect_kwargs=connect_kwargs,
+        processes=opts.processes,
+        chunk_size=opts.chunk_size,
+    ):
+        value = " ".join(result.value) if isinstance(result.value, list) else result.value
+        record = result.record.replace("\t", " ")
+        print(record, value or "", result.error or "", sep="\t")
+
+
+if __name__ == "__main__":
+    main()
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
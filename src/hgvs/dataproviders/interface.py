@@ -6,11 +6,41 @@ import os
 
 import hgvs
 
-from ..decorators.lru_cache import LEARN, RUN, VERIFY, lru_cache
+from ..decorators.lru_cache import LEARN, RUN, SHARED, VERIFY, lru_cache
+from ..exceptions import HGVSUsageError
 from ..utils.PersistentDict import PersistentDict
+from ..utils.sqlitedict import SQLiteDict, is_sqlite_file
 
 _logger = logging.getLogger(__name__)
 
+SQLITE_CACHE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# Interface methods whose results are cached by lru_cache.  The size of
+# each cache is configured in the [lru_cache] section of the config
+# with <method>_maxsize (default: maxsize) and <method>_maxbytes.
+_CACHED_METHODS = (
+    "data_version",
+    "schema_version",
+    "get_acs_for_protein_seq",
+    "get_gene_info",
+    "get_pro_ac_for_tx_ac",
+    "get_seq",
+    "get_similar_transcripts",
+    "get_tx_exons",
+    "get_tx_for_gene",
+    "get_tx_for_region",
+    "get_tx_identity_info",
+    "get_tx_info",
+    "get_tx_mapping_options",
+)
+
+
+def _get_option(config_group, name, default):
+    try:
+        return config_group[name]
+    except KeyError:
+        return default
+
 
 class Interface(metaclass=abc.ABCMeta):
     """Variant mapping and validation requires access to external data,
@@ -40,10 +70,18 @@ class Interface(metaclass=abc.ABCMeta):
 
     def __init__(self, mode=None, cache=None):
         """
-        :param mode: cache mode (None[default lru cache], 'learn', 'run', 'verify')
+        :param mode: cache mode (None[default lru cache], 'learn', 'run', 'verify', 'shared')
         :type mode: str
-        :param cache: local cache file name
+        :param cache: local cache file name; sqlite databases (and new
+            files named *.sqlite or *.db) are opened as SQLiteDict,
+            other files as PersistentDict.  In 'shared' mode, cache is
+            always a sqlite database that is read and written by all
+            processes that use it, so that, e.g., workers in a
+            multiprocessing pool fetch each result from the database
+            only once.
         :type cache: str
+
+        HGVSUsageError is raised if mode is not None and cache is None.
         """
         self.mode = None
         if mode == "learn":
@@ -52,56 +90,50 @@ class Interface(metaclass=abc.ABCMeta):
             self.mode = RUN
         elif mode == "verify":
             self.mode = VERIFY
+        elif mode == "shared":
+            self.mode = SHARED
 
         self.cache = None
         if self.mode is not None:
-            if self.mode == LEARN:
-                self.cache = PersistentDict(cache, flag="c")
+            if cache is None:
+                msg = f"cache mode {mode!r} requires a cache file"
+                raise HGVSUsageError(msg)
+            flag = "c" if self.mode in (LEARN, SHARED) else "r"
+            if (
+                self.mode == SHARED
+                or is_sqlite_file(cache)
+                or str(cache).endswith(SQLITE_CACHE_SUFFIXES)
+            ):
+                self.cache = SQLiteDict(cache, flag=flag)
             else:
-                self.cache = PersistentDict(cache, flag="r")
+                self.cache = PersistentDict(cache, flag=flag)
 
-        maxsize = hgvs.global_config.lru_cache.maxsize
-        if "PYTEST_CURRENT_TEST" in os.environ:
-            maxsize = None
+        lru_cache_config = hgvs.global_config.lru_cache
+        unlimited = "PYTEST_CURRENT_TEST" in os.environ
+        if unlimited:
             _logger.info("%s: Using unlimited cache size", __file__)
 
-        self.data_version = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.data_version
-        )
-        self.schema_version = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.schema_version
-        )
-        self.get_acs_for_protein_seq = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_acs_for_protein_seq
-        )
-        self.get_gene_info = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_gene_info
-        )
-        self.get_pro_ac_for_tx_ac = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_pro_ac_for_tx_ac
-        )
-        self.get_seq = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(self.get_seq)
-        self.get_similar_transcripts = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_similar_transcripts
-        )
-        self.get_tx_exons = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_exons
-        )
-        self.get_tx_for_gene = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_for_gene
-        )
-        self.get_tx_for_region = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_for_region
-        )
-        self.get_tx_identity_info = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_identity_info
-        )
-        self.get_tx_info = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_info
-        )
-        self.get_tx_mapping_options = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_mapping_options
-        )
+        for method_name in _CACHED_METHODS:
+            maxsize = _get_option(
+                lru_cache_config, method_name + "_maxsize", lru_cache_config.maxsize
+            )
+            maxbytes = _get_option(lru_cache_config, method_name + "_maxbytes", None)
+            if unlimited:
+                maxsize = maxbytes = None
+            method = getattr(self, method_name)
+            setattr(
+                self,
+                method_name,
+                lru_cache(maxsize=maxsize, maxbytes=maxbytes, mode=self.mode, cache=self.cache)(
+                    method
+                ),
+            )
+
+        self._check_schema_version()
+
+    def _check_schema_version(self):
+        """raise RuntimeError unless the data source provides a schema
+        version compatible with required_version"""
 
         def _split_version_string(v):
             versions = list(map(int, v.split(".")))
@@ -126,6 +158,21 @@ class Interface(metaclass=abc.ABCMeta):
     # schema_version, which must be implemented by the class.
     required_version = None
 
+    def cache_stats(self):
+        """return cache statistics for each cached data provider method
+
+        :returns: dict of method name to dict with keys hits, misses,
+          maxsize, currsize, and currbytes (None unless the cache is
+          limited by <method>_maxbytes)
+        """
+        stats = {}
+        for method_name in _CACHED_METHODS:
+            method = getattr(self, method_name)
+            stats[method_name] = dict(
+                method.cache_info()._asdict(), currbytes=method.cache_nbytes()
+            )
+        return stats
+
     @abc.abstractmethod
     def data_version(self):
         pass
@@ -5,7 +5,10 @@ import os
 
 import bioutils.seqfetcher
 
+import hgvs
+
 from ..exceptions import HGVSDataNotAvailableError
+from ..utils.seqspancache import SeqSpanCache
 
 _logger = logging.getLogger(__name__)
 
@@ -21,6 +24,12 @@ class SeqFetcher:
     >> sf.fetch_seq('NP_056374.2',0,10)
     'MESRETLSSS'
 
+    Fetched sequences are cached by span in memory (see
+    hgvs.utils.seqspancache), so that subsequences of previously
+    fetched regions are served without refetching.  The cache size is
+    set by seq_span_cache_maxbytes in the [lru_cache] config section;
+    0 disables the cache.
+
     """
 
     def __init__(self):
@@ -53,13 +62,25 @@ class SeqFetcher:
             self.fetcher = bioutils.seqfetcher.fetch_seq
             self.source = "bioutils.seqfetcher (network fetching)"
         _logger.info("Fetching sequences with %s", self.source)
+        maxbytes = hgvs.global_config.lru_cache.seq_span_cache_maxbytes
+        self.seq_cache = SeqSpanCache(maxbytes=maxbytes) if maxbytes else None
 
     def fetch_seq(self, ac, start_i=None, end_i=None):
+        if self.seq_cache is not None:
+            seq = self.seq_cache.get(ac, start_i, end_i)
+            if seq is not None:
+                return seq
         try:
-            return self.fetcher(ac, start_i, end_i)
+            seq = self.fetcher(ac, start_i, end_i)
         except Exception as ex:
             msg = f"Failed to fetch {ac} from {self.source} ({ex})"
             raise HGVSDataNotAvailableError(msg) from ex
+        if self.seq_cache is not None:
+            # a sequence shorter than requested ends at the end of ac
+            start = start_i or 0
+            complete = end_i is None or len(seq) < end_i - start
+            self.seq_cache.add(ac, start, seq, complete=complete)
+        return seq
 
 
 # <LICENSE>
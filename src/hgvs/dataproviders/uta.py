@@ -4,29 +4,37 @@
 """
 
 import contextlib
+import datetime
 import inspect
+import itertools
+import json
 import logging
 import os
 import re
+import sqlite3
+import threading
 import weakref
 from pathlib import Path
 from typing import ClassVar
 from urllib import parse as urlparse
 
-import psycopg
-import psycopg.rows
-from bioutils.assemblies import make_ac_name_map
 from bioutils.digests import seq_md5
-from psycopg_pool import ConnectionPool
 
 import hgvs
 
 from ..dataproviders.interface import Interface
+from ..decorators.lru_cache import RUN
 from ..exceptions import HGVSDataNotAvailableError, HGVSError
 from .seqfetcher import SeqFetcher
 
 _logger = logging.getLogger(__name__)
 
+# sqlite snapshot columns declared with this type are decoded from JSON
+_SQLITE_JSON_TYPE = "json"
+_SNAPSHOT_BATCH_SIZE = 10000
+
+sqlite3.register_converter(_SQLITE_JSON_TYPE, json.loads)
+
 
 def _stage_from_version(version):
     """return "prd", "stg", or "dev" for the given version string.  A value is always returned"""
@@ -58,6 +66,17 @@ def _get_uta_db_url():
     return hgvs.global_config["uta"][url_key]
 
 
+def _hashable(value):
+    """return value with lists (e.g., query parameters) converted to tuples"""
+    if isinstance(value, list | tuple):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+def _prefetch_key(sql, params=()):
+    return (sql, _hashable(params))
+
+
 def connect(
     db_url=None,
     pooling=hgvs.global_config.uta.pooling,
@@ -73,6 +92,10 @@ def connect(
     :type pooling: bool
     :param application_name: log application name in connection (useful for debugging; PostgreSQL only)
     :type application_name: str
+    :param mode: cache mode; see :class:`hgvs.dataproviders.interface.Interface`
+    :type mode: str
+    :param cache: cache file name; see :class:`hgvs.dataproviders.interface.Interface`
+    :type cache: str
 
     When called with an explicit db_url argument, that db_url is used for connecting.
 
@@ -93,8 +116,20 @@ def connect(
     A local postgresql database:
         postgresql://localhost/uta_dev/uta_20170707
 
+    A local sqlite snapshot (see export_sqlite_snapshot), with a
+    relative or absolute path, respectively:
+        sqlite:///uta_20210129b.sqlite3
+        sqlite:////data/uta/uta_20210129b.sqlite3
+
     For postgresql db_urls, pooling=True causes connect to use a
     psycopg_pool.ConnectionPool.
+
+    Worker processes (e.g., in a multiprocessing.Pool) that each
+    connect with mode="shared" and the same sqlite cache file share
+    query results, so that each is fetched from UTA only once per
+    host rather than once per worker:
+
+        hdp = connect(mode="shared", cache="/tmp/hgvs-cache.sqlite")
     """
 
     _logger.debug("connecting to %s...", db_url)
@@ -102,14 +137,16 @@ def connect(
     if db_url is None:
         db_url = _get_uta_db_url()
 
-    if "PYTEST_CURRENT_TEST" in os.environ and "localhost" not in db_url:
+    url = _parse_url(db_url)
+    if "PYTEST_CURRENT_TEST" in os.environ and url.scheme != "sqlite" and "localhost" not in db_url:
         _logger.warning("You are executing tests using remote data (%s)", db_url)
 
-    url = _parse_url(db_url)
     if url.scheme == "postgresql":
         conn = UTA_postgresql(
             url=url, pooling=pooling, application_name=application_name, mode=mode, cache=cache
         )
+    elif url.scheme == "sqlite":
+        conn = UTA_sqlite(url=url, mode=mode, cache=cache)
     else:
         # fell through connection scheme cases
         msg = f"{url.scheme} in {url} is not currently supported"
@@ -183,11 +220,43 @@ class UTABase(Interface):
         "tx_to_pro": """
             select * from associated_accessions where tx_ac = ? order by pro_ac desc
             """,
+        # set-based variants of the above, used by prefetch()
+        "tx_exons_for_txs": """
+            select *
+            from tx_exon_aln_v
+            where tx_ac = any(?)
+            order by alt_start_i
+            """,
+        "tx_identity_info_for_txs": """
+            select distinct(tx_ac), alt_ac, alt_aln_method, cds_start_i, cds_end_i, lengths, hgnc
+            from tx_def_summary_v
+            where tx_ac = any(?)
+            """,
+        "tx_info_for_txs": """
+            select hgnc, cds_start_i, cds_end_i, tx_ac, alt_ac, alt_aln_method
+            from transcript T
+            join exon_set ES on T.ac=ES.tx_ac
+            where tx_ac = any(?)
+            """,
+        "tx_mapping_options_for_txs": """
+            select distinct tx_ac,alt_ac,alt_aln_method
+            from tx_exon_aln_v where tx_ac = any(?) and exon_aln_id is not NULL
+            """,
+        "tx_seq_for_acs": """
+            select ac, seq
+            from seq S
+            join seq_anno SA on S.seq_id=SA.seq_id
+            where ac = any(?)
+            """,
+        "tx_to_pro_for_txs": """
+            select * from associated_accessions where tx_ac = any(?) order by pro_ac desc
+            """,
     }
 
     def __init__(self, url, mode=None, cache=None):
         self.url = url
         self.seqfetcher = SeqFetcher()
+        self._prefetch_local = threading.local()
         if mode != "run":
             self._connect()
         super().__init__(mode, cache)
@@ -198,12 +267,24 @@ class UTABase(Interface):
             f" url={self.url}; sequences-from={self.sequence_source()}>"
         )
 
+    @property
+    def _prefetched(self):
+        """(sql, params) -> rows staged by prefetch() in the calling thread"""
+        try:
+            return self._prefetch_local.rows
+        except AttributeError:
+            self._prefetch_local.rows = {}
+            return self._prefetch_local.rows
+
     def _fetchone(self, sql, *args):
         with self._get_cursor() as cur:
             cur.execute(sql, *args)
             return cur.fetchone()
 
     def _fetchall(self, sql, *args):
+        rows = self._prefetched.pop(_prefetch_key(sql, *args), None)
+        if rows is not None:
+            return rows
         with self._get_cursor() as cur:
             cur.execute(sql, *args)
             return cur.fetchall()
@@ -487,8 +568,133 @@ class UTABase(Interface):
 
     def get_assembly_map(self, assembly_name):
         """return a list of accessions for the specified assembly name (e.g., GRCh38.p5)"""
+        from bioutils.assemblies import make_ac_name_map  # noqa: PLC0415
+
         return make_ac_name_map(assembly_name)
 
+    def prefetch(
+        self, tx_acs, alt_ac=None, alt_aln_method=hgvs.global_config.mapping.alt_aln_method
+    ):
+        """fetch data for many transcripts with a few set-based queries and
+        add them to the method caches
+
+        :param tx_acs: transcript accessions with version (e.g., ['NM_000051.3'])
+        :type tx_acs: iterable of str
+        :param alt_ac: genomic sequence to which alignments are
+            fetched (e.g., NC_000011.10), or None for all
+        :type alt_ac: str
+        :param alt_aln_method: alignment method (e.g., splign), or None for all
+        :type alt_aln_method: str
+
+        Each of get_tx_identity_info, get_tx_mapping_options, and
+        get_pro_ac_for_tx_ac is warmed for every transcript, get_seq
+        for every transcript with a sequence in UTA, and get_tx_info
+        and get_tx_exons for every selected alignment.  Subsequent
+        calls to these methods for these transcripts are served from
+        the cache.  Errors for individual transcripts (e.g.,
+        incomplete alignments) are not cached and are raised when the
+        method is called.
+
+        Prefetching does nothing in "run" mode, in which all data come
+        from the persistent cache.
+
+        >> hdp.prefetch(["NM_000051.3", "NM_000059.3"], alt_ac="NC_000011.10")
+        """
+        if self.mode == RUN:
+            return
+        tx_acs = sorted(set(tx_acs))
+        if not tx_acs:
+            return
+
+        def _group(rows, key_fn):
+            groups = {}
+            for row in rows:
+                groups.setdefault(key_fn(row), []).append(row)
+            return groups
+
+        def _tx_key(row):
+            return row["tx_ac"]
+
+        def _aln_key(row):
+            return (row["tx_ac"], row["alt_ac"], row["alt_aln_method"])
+
+        mapping_options = _group(
+            self._fetchall(self._queries["tx_mapping_options_for_txs"], [tx_acs]), _tx_key
+        )
+        alignments = [
+            _aln_key(row)
+            for tx_ac in tx_acs
+            for row in mapping_options.get(tx_ac, [])
+            if (alt_ac is None or row["alt_ac"] == alt_ac)
+            and (alt_aln_method is None or row["alt_aln_method"] == alt_aln_method)
+        ]
+        identity_info = _group(
+            self._fetchall(self._queries["tx_identity_info_for_txs"], [tx_acs]), _tx_key
+        )
+        pro_acs = _group(self._fetchall(self._queries["tx_to_pro_for_txs"], [tx_acs]), _tx_key)
+        seqs = {
+            row["ac"]: row["seq"]
+            for row in self._fetchall(self._queries["tx_seq_for_acs"], [tx_acs])
+        }
+        tx_info = tx_exons = {}
+        if alignments:
+            tx_info = _group(self._fetchall(self._queries["tx_info_for_txs"], [tx_acs]), _aln_key)
+            tx_exons = _group(self._fetchall(self._queries["tx_exons_for_txs"], [tx_acs]), _aln_key)
+
+        # Stage rows as the results of the corresponding single-transcript
+        # queries, then call the cached methods so that results are
+        # validated and cached exactly as if they had been queried
+        # individually.
+        staged = [
+            (name, [tx_ac], groups.get(tx_ac, []))
+            for tx_ac in tx_acs
+            for name, groups in (
+                ("tx_mapping_options", mapping_options),
+                ("tx_identity_info", identity_info),
+                ("tx_to_pro", pro_acs),
+            )
+        ] + [
+            (name, list(aln), groups.get(aln, []))
+            for aln in alignments
+            for name, groups in (("tx_info", tx_info), ("tx_exons", tx_exons))
+        ]
+        # Staged rows are visible only to this thread, and only those
+        # staged by this call are removed, so that concurrent (or
+        # nested) prefetches don't consume or discard each other's rows.
+        prefetched = self._prefetched
+        keys = []
+        for name, params, rows in staged:
+            key = _prefetch_key(self._queries[name], params)
+            if key not in prefetched:
+                prefetched[key] = rows
+                keys.append(key)
+        if self.seqfetcher.seq_cache is not None:
+            for ac, seq in seqs.items():
+                self.seqfetcher.seq_cache.add(ac, 0, seq, complete=True)
+
+        calls = [
+            (method, [tx_ac])
+            for tx_ac in tx_acs
+            for method in (
+                self.get_tx_mapping_options,
+                self.get_tx_identity_info,
+                self.get_pro_ac_for_tx_ac,
+            )
+        ]
+        calls += [(self.get_seq, [ac]) for ac in seqs]
+        calls += [
+            (method, list(aln))
+            for aln in alignments
+            for method in (self.get_tx_info, self.get_tx_exons)
+        ]
+        try:
+            for method, args in calls:
+                with contextlib.suppress(HGVSError):
+                    method(*args)
+        finally:
+            for key in keys:
+                prefetched.pop(key, None)
+
 
 class UTA_postgresql(UTABase):
     def __init__(
@@ -506,6 +712,9 @@ class UTA_postgresql(UTABase):
         self.pooling = pooling
         self._conn = None
         self._pool = None
+        # serializes reconnection of the single (non-pooled) connection,
+        # which threads share
+        self._reconnect_lock = threading.RLock()
         # If we're using connection pooling, track the set of DB
         # connections we've seen; on first use we set the schema
         # search path. Use weak references to avoid keeping connection
@@ -524,17 +733,12 @@ class UTA_postgresql(UTABase):
             self._conn.close()
 
     def _connect(self):
-        if self.application_name is None:
-            st = inspect.stack()
-            self.application_name = Path(st[-1][1]).name
-        conn_args = {
-            "host": self.url.hostname,
-            "port": self.url.port,
-            "dbname": self.url.database,
-            "user": urlparse.unquote(self.url.username),
-            "password": urlparse.unquote(self.url.password),
-            "application_name": self.application_name + "/" + hgvs.__version__,
-        }
+        # psycopg is imported only when connecting to postgresql, so that
+        # using hgvs with a sqlite snapshot doesn't pay its import cost
+        import psycopg  # noqa: PLC0415
+        from psycopg_pool import ConnectionPool  # noqa: PLC0415
+
+        conn_args = self._conn_args()
         if self.pooling:
             _logger.info("Using UTA ConnectionPool")
             self._pool = ConnectionPool(
@@ -555,6 +759,20 @@ class UTA_postgresql(UTABase):
         # remap sqlite's ? placeholders to psycopg's %s
         self._queries = {k: v.replace("?", "%s") for k, v in self._queries.items()}
 
+    def _conn_args(self):
+        """return psycopg connection arguments for self.url"""
+        if self.application_name is None:
+            st = inspect.stack()
+            self.application_name = Path(st[-1][1]).name
+        return {
+            "host": self.url.hostname,
+            "port": self.url.port,
+            "dbname": self.url.database,
+            "user": urlparse.unquote(self.url.username),
+            "password": urlparse.unquote(self.url.password),
+            "application_name": self.application_name + "/" + hgvs.__version__,
+        }
+
     def _ensure_schema_exists(self):
         # N.B. On AWS RDS, information_schema.schemata always returns zero rows
         r = self._fetchone(
@@ -573,7 +791,9 @@ class UTA_postgresql(UTABase):
 
         Although *connections* are threadsafe, *cursors* are bound to
         connections and are *not* threadsafe. Do not share cursors
-        across threads.
+        across threads.  Without pooling, threads share the single
+        connection, on which queries are serialized; use pooling for
+        concurrent queries.
 
         Use this funciton like this::
 
@@ -584,6 +804,8 @@ class UTA_postgresql(UTABase):
 
         """
 
+        import psycopg.rows  # noqa: PLC0415
+
         n_tries_rem = n_retries + 1
         while n_tries_rem > 0:
             try:
@@ -614,8 +836,7 @@ class UTA_postgresql(UTABase):
                     self._pool.putconn(conn)
                     _logger.warning("Put away pool connection from %s", self.url)
                 else:
-                    self._connect()
-                    _logger.warning("Reconnected to %s", self.url)
+                    self._reconnect(conn)
 
             n_tries_rem -= 1
 
@@ -624,10 +845,165 @@ class UTA_postgresql(UTABase):
             msg = f"Permanently lost connection to {self.url} ({n_retries} retries)"
             raise HGVSError(msg)
 
+    def _reconnect(self, conn):
+        """replace the single connection conn, which failed, unless
+        another thread has already replaced it"""
+        with self._reconnect_lock:
+            if self._conn is conn:
+                self._connect()
+                _logger.warning("Reconnected to %s", self.url)
+
     def _set_search_path(self, cur):
         cur.execute(f"set search_path = {self.url.schema},public;")
 
 
+class UTA_sqlite(UTABase):
+    """UTA data provider for a local, read-only sqlite snapshot of
+    the UTA tables used by UTABase queries
+
+    Snapshots are created from a UTA PostgreSQL database with
+    export_sqlite_snapshot() (or sbin/export-uta-snapshot).  Mapping
+    with a snapshot requires no database server or network access
+    for transcript data; set HGVS_SEQREPO_DIR to use a local SeqRepo
+    for sequences as well.
+
+    """
+
+    def __init__(self, url, mode=None, cache=None):
+        self.application_name = None
+        self._conn = None
+        self._pid = None
+        self._lock = threading.RLock()
+        super().__init__(url, mode, cache)
+
+    def __del__(self):
+        self.close()
+
+    @property
+    def filename(self):
+        # sqlite:///relative/path, sqlite:////absolute/path
+        return self.url.path[1:]
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+    def _connect(self):
+        if not Path(self.filename).exists():
+            msg = f"UTA snapshot {self.filename} does not exist (url={self.url})"
+            raise HGVSDataNotAvailableError(msg)
+        uri = Path(self.filename).resolve().as_uri() + "?mode=ro"
+        self._conn = sqlite3.connect(
+            uri, uri=True, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False
+        )
+        self._conn.row_factory = _dict_row_factory
+        self._pid = os.getpid()
+
+    @contextlib.contextmanager
+    def _get_cursor(self):
+        with self._lock:
+            if self._conn is None or self._pid != os.getpid():
+                # connections are not shared with forked processes
+                self._connect()
+            cur = self._conn.cursor()
+            try:
+                yield cur
+            finally:
+                cur.close()
+
+    def data_version(self):
+        return self._fetchone("select value from meta where key = 'data_version'")["value"]
+
+    def prefetch(self, tx_acs, alt_ac=None, alt_aln_method=None):
+        """no-op; snapshot data are local and are cached as they are used"""
+
+
+def _dict_row_factory(cur, row):
+    return {d[0]: v for d, v in zip(cur.description, row, strict=True)}
+
+
+# (table or view, columns, indexed columns) exported to sqlite snapshots
+_SNAPSHOT_TABLES = (
+    ("meta", "*", ()),
+    ("gene", "*", ("hgnc",)),
+    ("transcript", "*", ("ac", "hgnc")),
+    ("exon_set", "*", ("tx_ac", "alt_ac", "exon_set_id")),
+    ("exon", "*", ("exon_set_id",)),
+    ("seq_anno", "seq_id, ac", ("seq_id", "ac")),
+    ("associated_accessions", "*", ("tx_ac",)),
+    ("tx_exon_aln_v", "*", ("tx_ac",)),
+    ("tx_def_summary_v", "*", ("tx_ac",)),
+    ("tx_similarity_v", "*", ("tx_ac1",)),
+)
+
+
+def export_sqlite_snapshot(hdp, filename):
+    """export the UTA tables and views used by UTABase queries from a
+    UTA PostgreSQL database to a new sqlite snapshot for use with
+    UTA_sqlite
+
+    :param hdp: UTA_postgresql instance (not in "run" mode)
+    :param filename: snapshot file name; must not exist
+
+    Views are exported as tables; array columns are stored as JSON
+    and decoded when read.  Sequences (seq) are not exported.
+
+    """
+    if Path(filename).exists():
+        msg = f"{filename} exists; will not overwrite"
+        raise FileExistsError(msg)
+    with contextlib.closing(sqlite3.connect(filename)) as db:
+        for table, columns, index_columns in _SNAPSHOT_TABLES:
+            _logger.info("Exporting %s", table)
+            sql = f"select {columns} from {table}"  # noqa: S608
+            with hdp._get_cursor() as cur:
+                cur.execute(sql + " limit 0")
+                column_names = [d.name for d in cur.description]
+                json_columns = {d.name for d in cur.description if _is_pg_array(d.type_code)}
+                _write_snapshot_table(
+                    db,
+                    table,
+                    cur.stream(sql),
+                    column_names=column_names,
+                    json_columns=json_columns,
+                    index_columns=index_columns,
+                )
+        db.execute("insert into meta (key, value) values ('data_version', ?)", [hdp.data_version()])
+        db.commit()
+
+
+def _is_pg_array(type_code):
+    import psycopg  # noqa: PLC0415
+
+    info = psycopg.postgres.types.get(type_code)
+    return info is not None and info.array_oid == type_code
+
+
+def _write_snapshot_table(db, table, rows, *, column_names, json_columns, index_columns=()):
+    """create table in sqlite db and insert rows (dicts)"""
+
+    def _encode(column_name, v):
+        if v is None:
+            return None
+        if column_name in json_columns or isinstance(v, (list, dict)):
+            return json.dumps(v)
+        if isinstance(v, datetime.date):
+            return v.isoformat()
+        return v
+
+    column_defs = ", ".join(
+        f"{c} {_SQLITE_JSON_TYPE}" if c in json_columns else c for c in column_names
+    )
+    db.execute(f"create table {table} ({column_defs})")
+    insert_sql = f"insert into {table} values ({', '.join('?' * len(column_names))})"  # noqa: S608
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, _SNAPSHOT_BATCH_SIZE)):
+        db.executemany(insert_sql, [[_encode(c, row[c]) for c in column_names] for row in batch])
+    for c in index_columns:
+        db.execute(f"create index {table}_{c}_idx on {table} ({c})")
+
+
 _SCHEMA_PATH_ELEM_COUNT = 2
 
 
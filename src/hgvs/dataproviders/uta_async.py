@@ -0,0 +1,242 @@
+"""implements an asyncio counterpart of the UTA PostgreSQL data provider
+
+UTA_postgresql_async executes queries with a
+psycopg_pool.AsyncConnectionPool, so that an asyncio application does
+not block its event loop while waiting for UTA.
+
+The mapping code in hgvs is synchronous.  It is run with
+:meth:`UTA_postgresql_async.call`, which calls a function (e.g.,
+VariantMapper.g_to_c) and, whenever the function needs data that the
+data provider has not cached, awaits the query (or, for sequences, a
+fetch in a worker thread) and calls the function again.  Results are
+cached by the data provider exactly as for UTA_postgresql, so once the
+data for a transcript are cached, calls for it make no queries at all.
+Concurrent requests for the same data share a single query.
+
+VariantMapper provides async variants of its hot methods (e.g.,
+g_to_c_async) that use call().  Other hgvs functions may be called
+with call() directly.  For example::
+
+    hdp = await hgvs.dataproviders.uta_async.connect()
+    vm = hgvs.variantmapper.VariantMapper(hdp)
+    var_c = await vm.g_to_c_async(var_g, "NM_000551.3")
+    var_n = await hdp.call(vm.c_to_n, var_c)
+    await hdp.call(hdp.prefetch, ["NM_000551.3", "NM_000059.3"])
+    await hdp.close()
+
+Calling a data provider method outside call() for data that are not
+cached raises HGVSUsageError.
+
+"""
+
+import asyncio
+import contextvars
+import logging
+
+import hgvs
+
+from ..exceptions import HGVSError, HGVSUsageError
+from .uta import UTA_postgresql, _get_uta_db_url, _hashable, _parse_url, _prefetch_key
+
+_logger = logging.getLogger(__name__)
+
+# results awaited by the innermost UTA_postgresql_async.call(), keyed
+# by query; each call (and so each asyncio task) has its own
+_awaited = contextvars.ContextVar("hgvs_uta_async_awaited", default=None)
+
+
+async def connect(db_url=None, application_name=None, mode=None, cache=None):
+    """Connect to a UTA PostgreSQL database and return an open
+    UTA_postgresql_async instance.
+
+    Arguments are as for :func:`hgvs.dataproviders.uta.connect`, except
+    that connections are always pooled.  Close the data provider with
+    ``await hdp.close()``, or use it as an async context manager.
+    """
+    if db_url is None:
+        db_url = _get_uta_db_url()
+    url = _parse_url(db_url)
+    if url.scheme != "postgresql":
+        msg = f"{url.scheme} in {url} is not supported for asyncio; use postgresql"
+        raise RuntimeError(msg)
+    hdp = UTA_postgresql_async(url=url, application_name=application_name, mode=mode, cache=cache)
+    await hdp.open()
+    _logger.info("connected to %s...", db_url)
+    return hdp
+
+
+class _DataRequired(BaseException):
+    """raised by data provider methods for data that must be awaited
+
+    Like asyncio.CancelledError, this is a BaseException so that
+    ``except Exception`` clauses in hgvs do not intercept it.
+    """
+
+    def __init__(self, key, fetch):
+        super().__init__(key)
+        self.key = key
+        self.fetch = fetch
+
+
+class UTA_postgresql_async(UTA_postgresql):
+    """UTA data provider for asyncio applications; see module documentation"""
+
+    def __init__(self, url, application_name=None, mode=None, cache=None):
+        self._inflight = {}  # key -> asyncio.Task for queries in progress
+        super().__init__(
+            url=url, pooling=True, application_name=application_name, mode=mode, cache=cache
+        )
+
+    def __del__(self):
+        # the pool can only be closed by awaiting close()
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def open(self):
+        """open the connection pool and check the UTA schema"""
+        if self._pool is not None:
+            await self._pool.open(wait=True)
+            await self.call(self._ensure_schema_exists)
+        await self.call(super()._check_schema_version)
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+
+    async def call(self, fn, /, *args, **kwargs):
+        """return fn(*args, **kwargs), awaiting the data that it requires
+
+        fn is called again after each query that it requires, so fn
+        should not have side effects other than those of hgvs mapping
+        functions (which may, e.g., fill in reference sequences of
+        their arguments).  HGVSErrors raised by data provider methods
+        are raised from within fn, as they are for a synchronous data
+        provider.
+        """
+        token = _awaited.set({})
+        try:
+            while True:
+                try:
+                    return fn(*args, **kwargs)
+                except _DataRequired as e:
+                    result = await self._fetch_shared(e.key, e.fetch)
+                    _awaited.get()[e.key] = result
+        finally:
+            _awaited.reset(token)
+
+    def get_seq(self, ac, start_i=None, end_i=None):
+        # sequences are fetched in a worker thread
+        seq_cache = self.seqfetcher.seq_cache
+        if seq_cache is not None:
+            seq = seq_cache.get(ac, start_i, end_i)
+            if seq is not None:
+                return seq
+        return self._get_awaited(
+            ("get_seq", ac, start_i, end_i),
+            lambda: asyncio.to_thread(self.seqfetcher.fetch_seq, ac, start_i, end_i),
+        )
+
+    ############################################################################
+    # Internal methods
+
+    def _connect(self):
+        from psycopg_pool import AsyncConnectionPool  # noqa: PLC0415
+
+        _logger.info("Using UTA AsyncConnectionPool")
+        self._pool = AsyncConnectionPool(
+            min_size=hgvs.global_config.uta.pool_min,
+            max_size=hgvs.global_config.uta.pool_max,
+            kwargs={**self._conn_args(), "autocommit": True},
+            configure=self._configure_connection,
+            open=False,
+        )
+
+        # remap sqlite's ? placeholders to psycopg's %s
+        self._queries = {k: v.replace("?", "%s") for k, v in self._queries.items()}
+
+    async def _configure_connection(self, conn):
+        await conn.execute(f"set search_path = {self.url.schema},public;")
+
+    def _check_schema_version(self):
+        # deferred to open(), which can await the query
+        pass
+
+    def _fetchone(self, sql, *args):
+        return self._get_awaited(
+            ("fetchone", sql, _hashable(args)), lambda: self._execute(sql, args, fetchone=True)
+        )
+
+    def _fetchall(self, sql, *args):
+        rows = self._prefetched.pop(_prefetch_key(sql, *args), None)
+        if rows is not None:
+            return rows
+        return self._get_awaited(
+            ("fetchall", sql, _hashable(args)), lambda: self._execute(sql, args, fetchone=False)
+        )
+
+    def _get_awaited(self, key, fetch):
+        """return the awaited result for key, or raise _DataRequired so
+        that call() awaits fetch()"""
+        awaited = _awaited.get()
+        if awaited is None:
+            msg = (
+                f"{type(self).__name__}: data are not cached;"
+                " call hgvs functions with `await hdp.call(fn, ...)`"
+            )
+            raise HGVSUsageError(msg)
+        try:
+            result = awaited[key]
+        except KeyError:
+            raise _DataRequired(key, fetch) from None
+        if isinstance(result, HGVSError):
+            raise result
+        return result
+
+    async def _fetch_shared(self, key, fetch):
+        """return the result of fetch(), or the HGVSError that it raises;
+        concurrent requests for the same key share one fetch"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(_result_or_hgvs_error(fetch))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield so that cancelling one caller doesn't cancel the fetch for others
+        return await asyncio.shield(task)
+
+    async def _execute(self, sql, args, *, fetchone):
+        import psycopg.rows  # noqa: PLC0415
+
+        async with (
+            self._pool.connection() as conn,
+            conn.cursor(row_factory=psycopg.rows.dict_row) as cur,
+        ):
+            await cur.execute(sql, *args)
+            return await (cur.fetchone() if fetchone else cur.fetchall())
+
+
+async def _result_or_hgvs_error(fetch):
+    try:
+        return await fetch()
+    except HGVSError as e:
+        return e
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
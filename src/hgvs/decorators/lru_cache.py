@@ -71,14 +71,21 @@ def _make_key(
 LEARN = 1
 RUN = 2
 VERIFY = 3
+SHARED = 4
 
 
-def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
+def lru_cache(maxsize=100, typed=False, mode=None, cache=None, *, maxbytes=None, sizeof=len):
     """Least-recently-used cache decorator.
 
     If *maxsize* is set to None, the LRU features are disabled and the cache
     can grow without bound.
 
+    If *maxbytes* is set, least-recently-used results are also evicted
+    while the total size of cached results, as measured by *sizeof*
+    (len by default; None results have size 0), exceeds maxbytes.
+    Results larger than maxbytes are not cached.  View the total size
+    with f.cache_nbytes().
+
     If *typed* is True, arguments of different types will be cached separately.
     For example, f(3.0) and f(3) will be treated as distinct calls with
     distinct results.
@@ -98,7 +105,9 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
                 in the event of a miss, the novel query and results would be written to cache, then returned.
         RUN:    queries are executed against caches; misses result in DataNotLocallyAvailableError
         VERIFY: always execute the function; if persistent cache value and returned value are different, raise VerifyFailedError
-    :param cache: PersistentDict object or None;
+        SHARED: as LEARN, but intended for a cache that is shared among processes (e.g., SQLiteDict);
+                results written by any process are available to all others
+    :param cache: PersistentDict or SQLiteDict object or None;
 
     """
 
@@ -119,6 +128,7 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
             _maxsize = None
 
         stats = [0, 0]  # make statistics updateable non-locally
+        nbytes = [0]  # total size of cached results when maxbytes is set
         HITS, MISSES = 0, 1  # names for the stats fields
         make_key = _make_key
         cache_get = _cache.get  # bound method to lookup key or return None
@@ -137,6 +147,31 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
                 stats[MISSES] += 1
                 return result
 
+        elif maxbytes is not None and mode is None:
+
+            def wrapper(*args, **kwds):
+                # caching that tracks accesses by recency and limits the total size of results
+                key = make_key(user_function.__name__, args, kwds, typed, ())
+                with lock:
+                    result = _cache.pop(key, root)
+                    if result is not root:
+                        _cache[key] = result  # (re)insert as most recently used
+                        stats[HITS] += 1
+                        return result
+                result = user_function(*args, **kwds)
+                size = 0 if result is None else sizeof(result)
+                with lock:
+                    if key not in _cache and size <= maxbytes:
+                        _cache[key] = result
+                        nbytes[0] += size
+                        while nbytes[0] > maxbytes or (
+                            _maxsize is not None and _len(_cache) > _maxsize
+                        ):
+                            oldresult = _cache.pop(next(iter(_cache)))
+                            nbytes[0] -= 0 if oldresult is None else sizeof(oldresult)
+                    stats[MISSES] += 1
+                return result
+
         elif _maxsize is None:
 
             def wrapper(*args, **kwds):
@@ -168,7 +203,7 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
                     )
                 result = user_function(*args, **kwds)
                 _cache[key] = result
-                if mode == LEARN:
+                if mode in (LEARN, SHARED):
                     _cache.sync()
                 stats[MISSES] += 1
                 return result
@@ -226,6 +261,11 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
             with lock:
                 return _CacheInfo(stats[HITS], stats[MISSES], _maxsize, len(_cache))
 
+        def cache_nbytes():
+            """Report total size of cached results, or None if maxbytes is not set"""
+            with lock:
+                return nbytes[0] if maxbytes is not None and mode is None else None
+
         def cache_clear():
             """Clear the cache and cache statistics"""
             with lock:
@@ -233,9 +273,11 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
                 root = nonlocal_root[0]
                 root[:] = [root, root, None, None]
                 stats[:] = [0, 0]
+                nbytes[0] = 0
 
         wrapper.__wrapped__ = user_function
         wrapper.cache_info = cache_info
+        wrapper.cache_nbytes = cache_nbytes
         wrapper.cache_clear = cache_clear
         return update_wrapper(wrapper, user_function)
 
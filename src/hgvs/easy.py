@@ -24,6 +24,10 @@ For example::
     SequenceVariant(ac=NM_007294.3, type=c, posedit=3844del)
 
 
+Objects are created when first used, so importing hgvs.easy is
+cheap.  For example, `parse` does not connect to the database, but
+`normalize` does.
+
 NOTE: A consequence of making imports easy is a loss of
 configurability by the caller.  The database connection is made with
 no arguments (i.e., `connect()`), so it honors the UTA_DB_URL and
@@ -32,6 +36,8 @@ configurable by the caller.
 
 """
 
+import threading
+
 from hgvs import __version__, global_config  # noqa: F401
 from hgvs.assemblymapper import AssemblyMapper
 from hgvs.dataproviders.uta import connect
@@ -41,34 +47,95 @@ from hgvs.pretty.prettyprint import PrettyPrint
 from hgvs.validator import Validator
 from hgvs.variantmapper import VariantMapper
 
-# provide standard abbreviated, short, and long names for instances
-hp = parser = hgvs_parser = Parser()
-hdp = hgvs_data_provider = connect()
-vm = variant_mapper = hgvs_variant_mapper = VariantMapper(hgvs_data_provider)
-am37 = hgvs_assembly_mapper_37 = AssemblyMapper(hgvs_data_provider, assembly_name="GRCh37")
-am38 = projector = hgvs_assembly_mapper_38 = AssemblyMapper(
-    hgvs_data_provider, assembly_name="GRCh38"
-)
-hn = normalizer = hgvs_normalizer = Normalizer(hgvs_data_provider)
-hv = validator = hgvs_validator = Validator(hgvs_data_provider)
-
-# functionalized forms of common methods
-parse = parser.parse
-normalize = normalizer.normalize
-validate = validator.validate
-c_to_g = projector.c_to_g
-c_to_n = projector.c_to_n
-c_to_p = projector.c_to_p
-g_to_c = projector.g_to_c
-g_to_n = projector.g_to_n
-g_to_t = projector.g_to_t
-n_to_c = projector.n_to_c
-n_to_g = projector.n_to_g
-t_to_g = projector.t_to_g
-t_to_p = projector.t_to_p
-get_relevant_transcripts = am38.relevant_transcripts
-pretty37 = PrettyPrint(hdp, am37, use_color=True, show_legend=True)
-pretty38 = PrettyPrint(hdp, am38, use_color=True, show_legend=True)
+# Instances are created on first access (see __getattr__), so that
+# importing hgvs.easy is cheap and the database connection is made
+# only when something that needs it is used.
+_FACTORIES = {
+    "parser": Parser,
+    "hdp": connect,
+    "vm": lambda: VariantMapper(__getattr__("hdp")),
+    "am37": lambda: AssemblyMapper(__getattr__("hdp"), assembly_name="GRCh37"),
+    "am38": lambda: AssemblyMapper(__getattr__("hdp"), assembly_name="GRCh38"),
+    "normalizer": lambda: Normalizer(__getattr__("hdp")),
+    "validator": lambda: Validator(__getattr__("hdp")),
+    "pretty37": lambda: PrettyPrint(
+        __getattr__("hdp"), __getattr__("am37"), use_color=True, show_legend=True
+    ),
+    "pretty38": lambda: PrettyPrint(
+        __getattr__("hdp"), __getattr__("am38"), use_color=True, show_legend=True
+    ),
+}
+
+# standard abbreviated, short, and long names for instances
+_ALIASES = {
+    "hp": "parser",
+    "hgvs_parser": "parser",
+    "hgvs_data_provider": "hdp",
+    "variant_mapper": "vm",
+    "hgvs_variant_mapper": "vm",
+    "hgvs_assembly_mapper_37": "am37",
+    "projector": "am38",
+    "hgvs_assembly_mapper_38": "am38",
+    "hn": "normalizer",
+    "hgvs_normalizer": "normalizer",
+    "hv": "validator",
+    "hgvs_validator": "validator",
+}
+
+# functionalized methods: name -> (instance name, method name)
+_METHODS = {
+    "parse": ("parser", "parse"),
+    "normalize": ("normalizer", "normalize"),
+    "validate": ("validator", "validate"),
+    "c_to_g": ("am38", "c_to_g"),
+    "c_to_n": ("am38", "c_to_n"),
+    "c_to_p": ("am38", "c_to_p"),
+    "g_to_c": ("am38", "g_to_c"),
+    "g_to_n": ("am38", "g_to_n"),
+    "g_to_t": ("am38", "g_to_t"),
+    "n_to_c": ("am38", "n_to_c"),
+    "n_to_g": ("am38", "n_to_g"),
+    "t_to_g": ("am38", "t_to_g"),
+    "t_to_p": ("am38", "t_to_p"),
+    "get_relevant_transcripts": ("am38", "relevant_transcripts"),
+}
+
+__all__ = [
+    "AssemblyMapper",
+    "Normalizer",
+    "Parser",
+    "PrettyPrint",
+    "Validator",
+    "VariantMapper",
+    "connect",
+    "global_config",
+]
+__all__ += list(_FACTORIES) + list(_ALIASES) + list(_METHODS)
+
+_lock = threading.RLock()
+
+
+def __getattr__(name):
+    with _lock:
+        if name in globals():
+            return globals()[name]
+        if name in _FACTORIES:
+            value = _FACTORIES[name]()
+        elif name in _ALIASES:
+            value = __getattr__(_ALIASES[name])
+        elif name in _METHODS:
+            instance_name, method_name = _METHODS[name]
+            value = getattr(__getattr__(instance_name), method_name)
+        else:
+            msg = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        globals()[name] = value
+        return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 # <LICENSE>
 # Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
@@ -15,10 +15,13 @@ from bioutils.sequences import aa1_to_aa3, aa_to_aa1
 
 import hgvs
 from hgvs.exceptions import HGVSError, HGVSUnsupportedOperationError
+from hgvs.utils.structcopy import structcopy
 
 
 @attr.s(slots=True)
 class Edit(abc.ABC):
+    __deepcopy__ = structcopy
+
     def format(self, conf=None):
         return str(self)
 
@@ -13,6 +13,7 @@ from hgvs.normalizer import Normalizer
 from hgvs.posedit import PosEdit
 from hgvs.sequencevariant import SequenceVariant
 from hgvs.utils.position import get_start_end_interbase
+from hgvs.utils.seqspancache import ReferenceWindows
 
 
 class Babelfish:
@@ -22,6 +23,7 @@ class Babelfish:
         self.hn = hgvs.normalizer.Normalizer(
             hdp, cross_boundaries=False, shuffle_direction=5, validate=False
         )
+        self._vcf_to_g_normalizer = Normalizer(hdp)
         self.ac_to_name_map = make_ac_name_map(assembly_name)
         self.name_to_ac_map = make_name_ac_map(assembly_name)
         # We need to accept accessions as chromosome names, so add them pointing at themselves
@@ -113,5 +115,41 @@ class Babelfish:
                 NARefAlt(ref=ref or None, alt=alt or None, uncertain=False),
             ),
         )
-        n = Normalizer(self.hdp)
-        return n.normalize(var_g)
+        return self._vcf_to_g_normalizer.normalize(var_g)
+
+    def hgvs_to_vcf_records(self, variants, window_size=100_000):
+        """**EXPERIMENTAL**
+
+        for each g. variant in variants, yield (chr, pos, ref, alt, type)
+        as from hgvs_to_vcf
+
+        Reference sequence is fetched in windows of window_size bases
+        around the variants; see vcf_records_to_hgvs.
+        """
+        windows = ReferenceWindows(self.hdp, window_size)
+        for var_g in variants:
+            start_i, end_i = get_start_end_interbase(var_g.posedit.pos)
+            windows.prefetch(var_g.ac, start_i, end_i)
+            yield self.hgvs_to_vcf(var_g)
+
+    def vcf_records_to_hgvs(self, records, window_size=100_000):
+        """**EXPERIMENTAL**
+
+        for each (chrom, position, ref, alt) record in records, yield
+        a list of g. variants, one for each allele in alt
+
+        alt is a sequence of alleles or, as in VCF, a comma-separated
+        string of them.
+
+        Reference sequence is fetched in windows of window_size bases,
+        so that sequence for nearby records is served from memory (see
+        hgvs.utils.seqspancache).  Records sorted by position within
+        each chromosome, as in a sorted VCF file, require one fetch per
+        window; unsorted records are converted correctly, but with
+        more fetches.
+        """
+        windows = ReferenceWindows(self.hdp, window_size)
+        for chrom, position, ref, alt in records:
+            alts = alt.split(",") if isinstance(alt, str) else alt
+            windows.prefetch(self.name_to_ac_map[chrom], position - 1, position - 1 + len(ref))
+            yield [self.vcf_to_g_hgvs(chrom, position, ref, a) for a in alts]
@@ -23,6 +23,7 @@ from bioutils.sequences import aa1_to_aa3
 import hgvs
 from hgvs.enums import Datum, ValidationLevel
 from hgvs.exceptions import HGVSInvalidIntervalError, HGVSUnsupportedOperationError
+from hgvs.utils.structcopy import structcopy
 
 
 @attr.s(slots=True, repr=False, cmp=False)
@@ -31,6 +32,8 @@ class SimplePosition:
     base = attr.ib(default=None)
     uncertain = attr.ib(default=False)
 
+    __deepcopy__ = structcopy
+
     def __str__(self):
         self.validate()
         s = "?" if self.base is None else str(self.base)
@@ -137,6 +140,8 @@ class BaseOffsetPosition:
     datum = attr.ib(default=Datum.SEQ_START)
     uncertain = attr.ib(default=False)
 
+    __deepcopy__ = structcopy
+
     def validate(self):
         if self.base is not None and self.base == 0:
             return (ValidationLevel.ERROR, "BaseOffsetPosition base may not be 0")
@@ -256,6 +261,8 @@ class AAPosition:
     aa = attr.ib(default=None)
     uncertain = attr.ib(default=False)
 
+    __deepcopy__ = structcopy
+
     def validate(self):
         if self.base is not None and self.base != "" and self.base < 1:
             return (ValidationLevel.ERROR, "AAPosition location must be >=1")
@@ -364,6 +371,8 @@ class Interval:
     end = attr.ib(default=None)  # Interval or SimplePosition or BaseOffsetPosition
     uncertain = attr.ib(default=False)
 
+    __deepcopy__ = structcopy
+
     def __attrs_post_init__(self):
         if self.end is None:
             self.end = copy.deepcopy(self.start)
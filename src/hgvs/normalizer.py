@@ -1,6 +1,5 @@
 """hgvs.normalizer"""
 
-import copy
 import logging
 
 from bioutils.sequences import reverse_complement
@@ -14,13 +13,19 @@ from hgvs.exceptions import (
     HGVSUnsupportedOperationError,
 )
 from hgvs.utils.norm import normalize_alleles
-from hgvs.utils.position import get_start_end
+from hgvs.utils.position import get_start_end, get_start_end_interbase
+from hgvs.utils.seqspancache import ReferenceWindows
+from hgvs.utils.structcopy import structcopy
 
 _logger = logging.getLogger(__name__)
 
 
 class Normalizer:
-    """Perform variant normalization"""
+    """Perform variant normalization
+
+    normalize() does not modify its argument, so a Normalizer may be
+    shared among threads, as a VariantMapper may.
+    """
 
     def __init__(
         self,
@@ -30,6 +35,7 @@ class Normalizer:
         alt_aln_method=hgvs.global_config.mapping.alt_aln_method,
         validate=hgvs.global_config.normalizer.validate,
         variantmapper=None,
+        incremental_shuffle=hgvs.global_config.normalizer.incremental_shuffle,
     ):
         """Initialize and configure the normalizer
 
@@ -39,6 +45,11 @@ class Normalizer:
         :param shuffle_direction: shuffling direction
         :param alt_aln_method: sequence alignment method (e.g., splign, blat)
         :param validate: whether validating the input variant before normalizing
+        :param incremental_shuffle: whether to grow the shuffle window by
+            fetching only new sequence, in chunks of doubling size,
+            rather than by refetching a window of window_size bases for
+            each step; this takes far fewer fetches to shuffle across
+            long repeats
 
         """
         if shuffle_direction not in {3, 5}:
@@ -48,6 +59,7 @@ class Normalizer:
         self.shuffle_direction = shuffle_direction
         self.cross_boundaries = cross_boundaries
         self.alt_aln_method = alt_aln_method
+        self.incremental_shuffle = incremental_shuffle
         self.validator = None
         if validate:
             self.validator = hgvs.validator.IntrinsicValidator(strict=False)
@@ -82,10 +94,10 @@ class Normalizer:
             msg = f"Unsupported normalization of conversion variants: {var}"
             raise HGVSUnsupportedOperationError(msg)
 
-        var.fill_ref(self.hdp)
+        var = self.vm._fill_ref(var)
 
         if var.posedit.edit.type == "identity":
-            var_norm = copy.deepcopy(var)
+            var_norm = structcopy(var)
             return var_norm
 
         # For c. variants normalization, first convert to n. variant
@@ -198,7 +210,7 @@ class Normalizer:
             ref_start = tgt_len
             ref_end = tgt_len
 
-        var_norm = copy.deepcopy(var)
+        var_norm = structcopy(var)
         s_norm, e_norm = get_start_end(var_norm)
         var_norm.posedit.edit = edit
         s_norm.base = ref_start
@@ -209,6 +221,31 @@ class Normalizer:
 
         return var_norm
 
+    def normalize_many(self, variants, window_size=100_000):
+        """Normalize each of variants, and return the normalized
+        variants in input order
+
+        Variants are normalized in order of accession and position.
+        Reference sequence is fetched in windows of window_size bases,
+        so that sequence for nearby variants is served from memory (see
+        hgvs.utils.seqspancache) rather than fetched for each variant.
+        Sequence is prefetched for g., m., n., and r. variants that
+        aren't intronic.
+        """
+        variants = list(variants)
+        windows = ReferenceWindows(self.hdp, window_size)
+        spans = [_sequence_span(var) for var in variants]
+        order = sorted(
+            range(len(variants)),
+            key=lambda i: (variants[i].ac or "", spans[i] or (-1, -1)),
+        )
+        normalized = [None] * len(variants)
+        for i in order:
+            if spans[i] is not None:
+                windows.prefetch(variants[i].ac, *spans[i])
+            normalized[i] = self.normalize(variants[i])
+        return normalized
+
     def _get_boundary(self, var):
         """Get the position of exon-intron boundary for current variant"""
         if var.type in {"r", "n"}:
@@ -366,6 +403,7 @@ class Normalizer:
         win_size = hgvs.global_config.normalizer.window_size
 
         s, e = get_start_end(var)
+        n_fetches = 0
 
         if self.shuffle_direction == 3:
             if var.posedit.edit.type == "ins":
@@ -381,10 +419,14 @@ class Normalizer:
                 start = 0
                 stop = e.base - base + 1
 
+            if self.incremental_shuffle:
+                return self._shuffle_right_incremental(var, boundary, base, start, stop, ref, alt)
+
             while True:
                 ref_seq = self._fetch_bounded_seq(
                     var, base - 1, base + stop - 1 + win_size, win_size, boundary
                 )
+                n_fetches += 1
                 if ref_seq == "":
                     break
                 orig_start, orig_stop = start, stop
@@ -412,12 +454,16 @@ class Normalizer:
                 start = s.base - base
                 stop = e.base - base + 1
 
+            if self.incremental_shuffle:
+                return self._shuffle_left_incremental(var, boundary, base, start, stop, ref, alt)
+
             while True:
                 if base < boundary[0] + 1:
                     start -= boundary[0] + 1 - base
                     stop -= boundary[0] + 1 - base
                     base = boundary[0] + 1
                 ref_seq = self._fetch_bounded_seq(var, base - 1, base + stop - 1, start, boundary)
+                n_fetches += 1
                 if ref_seq == "":
                     break
                 orig_start, orig_stop = start, stop
@@ -431,9 +477,100 @@ class Normalizer:
                 start += orig_stop - stop
                 stop = orig_stop
 
+        _logger.debug("%s: shuffled with %d sequence fetches", var, n_fetches)
+        return base + start, base + stop, (ref, alt)
+
+    def _shuffle_right_incremental(self, var, boundary, base, start, stop, ref, alt):
+        """Shuffle alleles to the right, as _normalize_alleles does, but
+        fetch only new sequence as the window grows
+
+        Each chunk of sequence is twice the size of the previous one,
+        so shuffling across a repeat of length n takes O(log n)
+        fetches of O(n) bases in all.
+        """
+        win_size = hgvs.global_config.normalizer.window_size
+        n_fetches = 1
+        fetch_end = base + stop - 1 + win_size
+        ref_seq = self._fetch_bounded_seq(var, base - 1, fetch_end, win_size, boundary)
+        chunk_size = win_size
+        while ref_seq:
+            orig_start = start
+            start, stop, (ref, alt) = normalize_alleles(
+                ref_seq, start, stop, (ref, alt), len(ref_seq), win_size, False
+            )
+            if stop < len(ref_seq) or start == orig_start:
+                break
+            # if stop at the end of the window, try to extend the shuffling to the
+            # right, unless the window already reaches the end of the sequence
+            chunk_start = base - 1 + len(ref_seq)
+            if chunk_start < min(fetch_end, boundary[1]):
+                break
+            chunk_size *= 2
+            fetch_end = chunk_start + chunk_size
+            chunk = self._fetch_bounded_seq(var, chunk_start, fetch_end, chunk_size, boundary)
+            n_fetches += 1
+            if not chunk:
+                break
+            ref_seq += chunk
+
+        _logger.debug("%s: shuffled with %d sequence fetches", var, n_fetches)
+        return base + start, base + stop, (ref, alt)
+
+    def _shuffle_left_incremental(self, var, boundary, base, start, stop, ref, alt):
+        """Shuffle alleles to the left, as _normalize_alleles does, but
+        fetch only new sequence as the window grows; see
+        _shuffle_right_incremental"""
+        win_size = hgvs.global_config.normalizer.window_size
+        if base < boundary[0] + 1:
+            start -= boundary[0] + 1 - base
+            stop -= boundary[0] + 1 - base
+            base = boundary[0] + 1
+        n_fetches = 1
+        ref_seq = self._fetch_bounded_seq(var, base - 1, base + stop - 1, start, boundary)
+        chunk_size = win_size
+        while ref_seq:
+            orig_stop = stop
+            start, stop, (ref, alt) = normalize_alleles(
+                ref_seq, start, stop, (ref, alt), 0, win_size, True
+            )
+            if start > 0 or stop == orig_stop:
+                break
+            # if stop at the start of the window, try to extend the shuffling to the left
+            chunk_size *= 2
+            chunk_base = max(base - chunk_size, boundary[0] + 1)
+            if chunk_base == base:
+                break
+            chunk = self._fetch_bounded_seq(
+                var, chunk_base - 1, base - 1, base - chunk_base, boundary
+            )
+            n_fetches += 1
+            if not chunk:
+                break
+            ref_seq = chunk + ref_seq
+            start += len(chunk)
+            stop += len(chunk)
+            base -= len(chunk)
+
+        _logger.debug("%s: shuffled with %d sequence fetches", var, n_fetches)
         return base + start, base + stop, (ref, alt)
 
 
+def _sequence_span(var):
+    """return the interbase (start, end) of var on the sequence of
+    var.ac, or None if var isn't located on that sequence"""
+    if (
+        var.type not in {"g", "m", "n", "r"}
+        or var.posedit is None
+        or var.posedit.uncertain
+        or var.posedit.pos is None
+    ):
+        return None
+    s, e = get_start_end(var)
+    if getattr(s, "offset", 0) or getattr(e, "offset", 0):
+        return None
+    return get_start_end_interbase(var.posedit.pos)
+
+
 # <LICENSE>
 # Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
 #
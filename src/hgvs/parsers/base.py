@@ -7,10 +7,15 @@ dependencies and parsing internals stay isolated in their own module and are
 only imported when that backend is actually selected.
 """
 
+import copy
 import logging
 import re
+import threading
+from collections import OrderedDict
 
+import hgvs.parsers.fastpath
 import hgvs.sequencevariant
+from hgvs.exceptions import HGVSParseError
 
 #: ``grammar_fn`` value selecting the pyparsing grammar (``PyParsingParser``).
 PYPARSING_GRAMMAR = "__pyparsing__"
@@ -27,6 +32,23 @@ _EXPOSED_RULE_RE = re.compile(
     r"hgvs_(variant|position)|(c|g|m|n|p|r)" r"_(edit|hgvs_position|interval|pos|posedit|variant)"
 )
 
+_VARIANT_TYPE_RULES = {t: t + "_variant" for t in "cgmnpr"}
+
+
+def _variant_type_rule(s):
+    """return the rule for the variant type given by the `:x.` prefix
+    of s (e.g., "p_variant"), or None if s has no such prefix
+
+    The accession and gene symbol cannot contain a colon, so the first
+    colon precedes the type.
+    """
+    if not isinstance(s, str):
+        return None
+    i = s.find(":")
+    if i < 0 or s[i + 2 : i + 3] != ".":
+        return None
+    return _VARIANT_TYPE_RULES.get(s[i + 1])
+
 
 class Parser:
     """Provides comprehensive parsing of HGVS variant strings (*i.e.*,
@@ -101,6 +123,25 @@ class Parser:
     Passing any other value (a path to a custom OMeta grammar file) is
     deprecated and will be removed in a future version.
 
+    ``Parser(cache_size=n)`` memoizes the results of `parse` for the
+    n most recently parsed strings, which helps when the same variants
+    recur frequently.  Each call returns a new copy of the cached
+    variant, so callers may modify results (e.g., with `fill_ref`).
+    `parse_many` parses a sequence of strings:
+
+      >>> hp.parse_many(["NM_01234.5:c.22+1A>T", "NM_01234.5:c.22+1A>"])
+      [SequenceVariant(ac=NM_01234.5, type=c, posedit=22+1A>T, gene=None), HGVSParseError(...)]
+
+    By default, `parse_hgvs_variant` (and therefore `parse`) first
+    tries a set of precompiled regular expressions that recognize the
+    most common variant shapes (e.g., substitutions, deletions, and
+    insertions at definite positions) and build the same objects as the
+    grammar at a fraction of the cost; all other strings are parsed by
+    the grammar.  ``Parser(fast_path=False)`` always uses the grammar.
+    In either case, the type letter after the colon selects the grammar
+    rule (e.g., `p_variant`) rather than trying each variant type in
+    turn.
+
     The two backends are intended to be interchangeable, and are tested for
     equivalence (see tests/test_hgvs_grammar_equivalence.py). There is one
     deliberate difference: the OMeta grammar silently skips leading spaces and
@@ -134,16 +175,63 @@ class Parser:
 
         return super().__new__(ParsleyParser)
 
-    def __init__(self, grammar_fn=_UNSET_GRAMMAR_FN, expose_all_rules=False):
+    def __init__(
+        self, grammar_fn=_UNSET_GRAMMAR_FN, expose_all_rules=False, cache_size=0, fast_path=True
+    ):
         self._logger = logging.getLogger(__name__)
-        self._grammar = self._build_grammar(grammar_fn)
-        self._expose_rule_functions(expose_all_rules)
+        self.fast_path = fast_path
+        self.cache_size = cache_size
+        self._parse_cache = OrderedDict()  # string -> SequenceVariant
+        self._parse_cache_lock = threading.Lock()
+
+        # Importing and building a grammar takes longer than parsing
+        # thousands of variants with the fast path, so the grammar is
+        # built on first use (see _grammar).  Until then, only
+        # parse_hgvs_variant is defined.
+        self._grammar_fn = grammar_fn
+        self._expose_all_rules = expose_all_rules
+        self._lazy_grammar = None
+        self._grammar_lock = threading.Lock()
+        self.parse_hgvs_variant = self._make_parse_rule_function("hgvs_variant")
+        if grammar_fn not in (_UNSET_GRAMMAR_FN, OMETA_GRAMMAR, PYPARSING_GRAMMAR):
+            # custom grammar file: report errors (and deprecation) now
+            self._load_grammar()
+
+    @property
+    def _grammar(self):
+        """the backend grammar, built on first use"""
+        grammar = self._lazy_grammar
+        if grammar is None:
+            grammar = self._load_grammar()
+        return grammar
+
+    def _load_grammar(self):
+        with self._grammar_lock:
+            if self._lazy_grammar is None:
+                grammar = self._build_grammar(self._grammar_fn)
+                self._expose_rule_functions(grammar, self._expose_all_rules)
+                self._lazy_grammar = grammar
+        return self._lazy_grammar
+
+    def __getattr__(self, name):
+        # parse_* methods for rules other than hgvs_variant are defined
+        # when the grammar is built
+        if name.startswith("parse_") and self.__dict__.get("_lazy_grammar", False) is None:
+            self._load_grammar()
+            return getattr(self, name)
+        msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def __dir__(self):
+        self._load_grammar()
+        return super().__dir__()
 
     def _build_grammar(self, grammar_fn):
         """Build and return the backend-specific grammar object. Implemented by subclasses."""
         raise NotImplementedError
 
-    #: The backend-native exception type raised on a parse failure. Set by subclasses.
+    #: The backend-native exception type raised on a parse failure. Set
+    #: by subclasses (by _build_grammar, when the backend is imported lazily).
     _parse_error_cls = None
 
     def _translate_parse_error(self, s, exc):
@@ -157,9 +245,72 @@ class Parser:
         :rtype: SequenceVariant
 
         """
-        return self.parse_hgvs_variant(v)
+        if not self.cache_size:
+            return self.parse_hgvs_variant(v)
+        with self._parse_cache_lock:
+            var = self._parse_cache.get(v)
+            if var is not None:
+                self._parse_cache.move_to_end(v)
+        if var is None:
+            var = self.parse_hgvs_variant(v)
+            with self._parse_cache_lock:
+                self._parse_cache[v] = var
+                if len(self._parse_cache) > self.cache_size:
+                    self._parse_cache.popitem(last=False)
+        return copy.deepcopy(var)
+
+    def parse_many(self, vs, on_error="return"):
+        """parse many HGVS variants, returning a list of SequenceVariants
+
+        :param vs: iterable of HGVS-formatted variants as strings
+        :param str on_error: "return" to return the HGVSParseError
+            instance in place of the result for strings that cannot be
+            parsed, or "raise" to raise it
+        :returns: list of SequenceVariants (or HGVSParseErrors), in
+            input order
 
-    def _expose_rule_functions(self, expose_all_rules=False):
+        """
+        if on_error not in ("return", "raise"):
+            msg = f"on_error must be 'return' or 'raise' (got {on_error!r})"
+            raise ValueError(msg)
+        results = []
+        for v in vs:
+            try:
+                results.append(self.parse(v))
+            except HGVSParseError as e:
+                if on_error == "raise":
+                    raise
+                results.append(e)
+        return results
+
+    def _make_parse_rule_function(self, rule_name):
+        "builds a wrapper function that parses a string with the specified rule"
+
+        def rule_fxn(s):
+            if rule_name == "hgvs_variant":
+                if self.fast_path:
+                    var = hgvs.parsers.fastpath.parse_hgvs_variant(s)
+                    if var is not None:
+                        return var
+                grammar = self._grammar
+                # hgvs_variant tries each variant type in turn, but the
+                # type letter determines which one can match
+                type_rule = _variant_type_rule(s)
+                if type_rule is not None:
+                    try:
+                        return grammar(s).__getattr__(type_rule)()
+                    except self._parse_error_cls:
+                        pass  # parse with hgvs_variant for its error message
+            grammar = self._grammar
+            try:
+                return grammar(s).__getattr__(rule_name)()
+            except self._parse_error_cls as exc:
+                raise self._translate_parse_error(s, exc) from exc
+
+        rule_fxn.__doc__ = f"parse string s using `{rule_name}' rule"
+        return rule_fxn
+
+    def _expose_rule_functions(self, grammar, expose_all_rules=False):
         """add parse functions for public grammar rules
 
         Defines a function for each public grammar rule, based on
@@ -169,23 +320,8 @@ class Parser:
           Parser.parse_c_interval('26+2_57-3') -> Interval(...)
 
         """
-
-        def make_parse_rule_function(rule_name):
-            "builds a wrapper function that parses a string with the specified rule"
-
-            def rule_fxn(s):
-                try:
-                    return self._grammar(s).__getattr__(rule_name)()
-                except self._parse_error_cls as exc:
-                    raise self._translate_parse_error(s, exc) from exc
-
-            rule_fxn.__doc__ = f"parse string s using `{rule_name}' rule"
-            return rule_fxn
-
         exposed_rules = [
-            m.replace("rule_", "")
-            for m in dir(self._grammar._grammarClass)
-            if m.startswith("rule_")
+            m.replace("rule_", "") for m in dir(grammar._grammarClass) if m.startswith("rule_")
         ]
         if not expose_all_rules:
             exposed_rules = [
@@ -193,7 +329,7 @@ class Parser:
             ]
         for rule_name in exposed_rules:
             att_name = "parse_" + rule_name
-            rule_fxn = make_parse_rule_function(rule_name)
+            rule_fxn = self._make_parse_rule_function(rule_name)
             self.__setattr__(att_name, rule_fxn)
         self._logger.debug("Exposed %d rules (%s)", len(exposed_rules), ", ".join(exposed_rules))
 
@@ -0,0 +1,215 @@
+"""Fast path for parsing the most common shapes of HGVS variants.
+
+Most variants in bulk sources (e.g., ClinVar) are simple
+substitutions, deletions, insertions, delins, and duplications at
+definite positions.  For these, matching a precompiled regular
+expression and constructing the objects directly is an order of
+magnitude faster than either grammar backend.
+
+``parse_hgvs_variant`` returns None for anything it does not
+recognize, and the caller falls back to the full grammar.  The
+expressions mirror the rules in ``_data/hgvs.pymeta``: PEG ordered
+choices are written as atomic groups and PEG repetitions as possessive
+quantifiers, so that a string is accepted only if the grammar accepts
+it, and the resulting objects are identical to those built by the
+grammar.  Anything involving uncertainty (other than the p.(...)
+form), fs/ext, inv, con, or copy is left to the grammar.
+"""
+
+import re
+
+import bioutils.sequences
+
+import hgvs.edit
+import hgvs.enums
+import hgvs.location
+import hgvs.posedit
+import hgvs.sequencevariant
+
+_ACCN = r"[A-Za-z](?:[A-Za-z0-9]|[-_](?=[A-Za-z0-9]))*+(?:\.[0-9]++)?+"
+_GENE = r"[A-Za-z](?:[A-Za-z0-9]|[-_](?=[A-Za-z0-9]))++"
+
+_DNA = "ACGTRYMKWSBDHVNacgtrymkwsbdhvn"
+_RNA = "ACGURYMKWSBDHVNacgurymkwsbdhvn"
+
+_AA1 = "[ACDEFGHIKLMNPQRSTVWYBZXU]"
+_AA3 = "(?>Ala|Cys|Asp|Glu|Phe|Gly|His|Ile|Lys|Leu|Met|Asn|Pro|Gln|Arg|Ser|Thr|Val|Trp|Tyr|Asx|Glx|Xaa|Sec)"
+_AAT13 = rf"(?>Ter|{_AA3}|[X*]|{_AA1})"
+_AAT13_SEQ = rf"(?>(?>Ter|{_AA3}++(?:Ter)?+)|(?>[X*]|{_AA1}++[X*]?+))"
+
+
+def _bo_pos(p, cds_end):
+    """base-offset position; cds_end permits *n (c. only)"""
+    if cds_end:
+        return rf"(?P<{p}_star>\*)?+(?P<{p}_base>(?({p}_star)|[-+]?)[0-9]++)(?P<{p}_offset>[-+][0-9]++)?+"
+    return rf"(?P<{p}_base>[-+]?[0-9]++)(?P<{p}_offset>[-+][0-9]++)?+"
+
+
+def _simple_pos(p):
+    return rf"(?P<{p}_base>[0-9]++)"
+
+
+def _aa_pos(p):
+    return rf"(?P<{p}_aa>(?>Ter|[X*]|{_AA3}|{_AA1}))(?P<{p}_base>[0-9]++)"
+
+
+def _na_edit(na):
+    return (
+        rf"(?>(?P<ident>[{na}]*+)="
+        rf"|(?P<subst_ref>[{na}])>(?P<subst_alt>[{na}])"
+        rf"|del(?P<delins_ref>(?>[0-9]++|[{na}]*+))ins(?P<delins_alt>[{na}]++)"
+        rf"|ins(?P<ins_alt>[{na}]++)"
+        rf"|del(?P<del_ref>(?>[0-9]++|[{na}]*+))"
+        rf"|dup(?P<dup_ref>[{na}]*+))"
+    )
+
+
+_PRO_EDIT = (
+    rf"(?>(?P<subst_alt>{_AAT13}|\?)"
+    rf"|delins(?P<delins_alt>{_AAT13_SEQ})"
+    rf"|ins(?P<ins_alt>{_AAT13_SEQ})"
+    rf"|(?P<del>del)"
+    rf"|(?P<dup>dup)"
+    rf"|(?P<ident>=))"
+)
+
+
+def _variant_re(vtype, pos_fn, edit_re, uncertain_posedit=False):
+    posedit = rf"{pos_fn('start')}(?:_{pos_fn('end')})?+{edit_re}"
+    if uncertain_posedit:
+        posedit = rf"(?>{posedit}|\((?P<uncertain>){posedit.replace('?P<', '?P<u_')}\))"
+    return re.compile(rf"(?P<ac>{_ACCN})(?:\((?P<gene>{_GENE})\))?+:{vtype}\.{posedit}")
+
+
+_VARIANT_RES = {
+    "c": _variant_re("c", lambda p: _bo_pos(p, cds_end=True), _na_edit(_DNA)),
+    "g": _variant_re("g", _simple_pos, _na_edit(_DNA)),
+    "m": _variant_re("m", _simple_pos, _na_edit(_DNA)),
+    "n": _variant_re("n", lambda p: _bo_pos(p, cds_end=False), _na_edit(_DNA)),
+    "r": _variant_re("r", lambda p: _bo_pos(p, cds_end=False), _na_edit(_RNA)),
+    "p": _variant_re("p", _aa_pos, _PRO_EDIT, uncertain_posedit=True),
+}
+
+
+def _make_bo_pos(m, p, vtype):
+    if vtype == "c":
+        datum = hgvs.enums.Datum.CDS_END if m[p + "_star"] else hgvs.enums.Datum.CDS_START
+    else:
+        datum = hgvs.enums.Datum.SEQ_START
+    offset = m[p + "_offset"]
+    return hgvs.location.BaseOffsetPosition(
+        int(m[p + "_base"]), int(offset) if offset else 0, datum=datum
+    )
+
+
+def _make_na_edit(m):
+    if m["ident"] is not None:
+        return hgvs.edit.NARefAlt(ref=m["ident"], alt=m["ident"])
+    if m["subst_ref"] is not None:
+        return hgvs.edit.NARefAlt(ref=m["subst_ref"], alt=m["subst_alt"])
+    if m["delins_alt"] is not None:
+        return hgvs.edit.NARefAlt(ref=m["delins_ref"], alt=m["delins_alt"])
+    if m["ins_alt"] is not None:
+        return hgvs.edit.NARefAlt(ref=None, alt=m["ins_alt"])
+    if m["del_ref"] is not None:
+        return hgvs.edit.NARefAlt(ref=m["del_ref"], alt=None)
+    return hgvs.edit.Dup(ref=m["dup_ref"])
+
+
+def _make_pro_edit(m):
+    if m["subst_alt"] is not None:
+        return hgvs.edit.AASub(ref="", alt=m["subst_alt"])
+    if m["delins_alt"] is not None:
+        return hgvs.edit.AARefAlt(ref="", alt=m["delins_alt"])
+    if m["ins_alt"] is not None:
+        return hgvs.edit.AARefAlt(ref=None, alt=m["ins_alt"])
+    if m["del"] is not None:
+        return hgvs.edit.AARefAlt(ref="", alt=None)
+    if m["dup"] is not None:
+        return hgvs.edit.Dup(ref="")
+    return hgvs.edit.AARefAlt(ref="", alt="")
+
+
+class _UncertainMatch:
+    """view of the u_-prefixed groups of a p.(...) match"""
+
+    def __init__(self, m):
+        self._m = m
+
+    def __getitem__(self, k):
+        return self._m["u_" + k]
+
+
+def parse_hgvs_variant(s):
+    """return a SequenceVariant for s if it has one of the common
+    shapes handled here, or None otherwise
+
+    >>> parse_hgvs_variant("NM_01234.5:c.22+1A>T")
+    SequenceVariant(ac=NM_01234.5, type=c, posedit=22+1A>T, gene=None)
+    >>> parse_hgvs_variant("NM_01234.5:c.(22+1A>T)") is None
+    True
+
+    """
+    if not isinstance(s, str):
+        return None
+    i = s.find(":")
+    if i < 0:
+        return None
+    vtype = s[i + 1 : i + 2]
+    variant_re = _VARIANT_RES.get(vtype)
+    if variant_re is None:
+        return None
+    m = variant_re.fullmatch(s)
+    if m is None:
+        return None
+
+    posedit_uncertain = vtype == "p" and m["uncertain"] is not None
+    pm = _UncertainMatch(m) if posedit_uncertain else m
+    if vtype == "p":
+        start = hgvs.location.AAPosition(
+            int(pm["start_base"]), bioutils.sequences.aa_to_aa1(pm["start_aa"])
+        )
+        end = None
+        if pm["end_base"] is not None:
+            end = hgvs.location.AAPosition(
+                int(pm["end_base"]), bioutils.sequences.aa_to_aa1(pm["end_aa"])
+            )
+        pos = hgvs.location.Interval(start, end)
+        edit = _make_pro_edit(pm)
+    elif vtype in "gm":
+        end = None
+        if m["end_base"] is not None:
+            end = hgvs.location.SimplePosition(int(m["end_base"]))
+        pos = hgvs.location.Interval(hgvs.location.SimplePosition(int(m["start_base"])), end)
+        edit = _make_na_edit(m)
+    else:
+        # as in the grammar, r. intervals are Intervals of BaseOffsetPositions
+        interval_cls = hgvs.location.Interval if vtype == "r" else hgvs.location.BaseOffsetInterval
+        end = _make_bo_pos(m, "end", vtype) if m["end_base"] is not None else None
+        pos = interval_cls(_make_bo_pos(m, "start", vtype), end)
+        edit = _make_na_edit(m)
+
+    if posedit_uncertain:
+        posedit = hgvs.posedit.PosEdit(pos=pos, edit=edit, uncertain=True)
+    else:
+        posedit = hgvs.posedit.PosEdit(pos=pos, edit=edit)
+    return hgvs.sequencevariant.SequenceVariant(
+        ac=m["ac"], gene=m["gene"], type=vtype, posedit=posedit
+    )
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -0,0 +1,185 @@
+"""On-disk cache of compiled OMeta grammars for the parsley backend
+
+Building the parsley grammar requires compiling Python source: either
+the bundled, pre-generated ``hgvs_grammar.py`` (~190 KB) or, for a
+custom grammar file, code generated from the OMeta grammar itself (which
+takes seconds).  Python caches bytecode for the former only when it can
+write ``__pycache__`` (not, for example, with PYTHONDONTWRITEBYTECODE or
+a read-only installation) and never for the latter.
+
+This module caches the compiled code, marshalled, in a cache directory.
+Entries are keyed by a hash of the grammar source, the hgvs and parsley
+versions, and the Python bytecode tag, so a stale entry is never used.
+Failures to read or write the cache are logged (at INFO and DEBUG
+level) and otherwise ignored.
+
+The cache directory is ``$HGVS_GRAMMAR_CACHE_DIR`` if set, otherwise
+``$XDG_CACHE_HOME/hgvs`` (default ``~/.cache/hgvs``).  Set
+``HGVS_GRAMMAR_CACHE_DIR`` to an empty string to disable the cache.
+
+To pre-build the cache (e.g., at install or image build time)::
+
+  $ python -m hgvs.parsers.grammar_cache [grammar_fn ...]
+
+"""
+
+import argparse
+import hashlib
+import logging
+import marshal
+import os
+import sys
+import tempfile
+from importlib.resources import files as resources_files
+from pathlib import Path
+
+import ometa.builder
+import ometa.grammar
+import parsley
+
+import hgvs
+
+_logger = logging.getLogger(__name__)
+
+#: filename for code generated from custom grammars; the same as parsley uses
+_GENERATED_FILENAME = "/pymeta_generated_code/pymeta_grammar__Grammar.py"
+
+
+def cache_dir():
+    """return the grammar cache directory as a Path, or None if caching is disabled"""
+    dir_ = os.environ.get("HGVS_GRAMMAR_CACHE_DIR")
+    if dir_ is None:
+        return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "hgvs"
+    return Path(dir_) if dir_ else None
+
+
+def load_parser_class_factory(grammar_fn=None):
+    """return the createParserClass function for an OMeta grammar
+
+    :param grammar_fn: path to an OMeta grammar file, or None for the
+        bundled, pre-generated grammar
+
+    Compiled code is read from the cache if possible; otherwise, it is
+    compiled and written to the cache.
+    """
+    code = _load_code(*_grammar_source(grammar_fn))
+    namespace = {}
+    exec(code, namespace)  # noqa: S102
+    return namespace["createParserClass"]
+
+
+def build(grammar_fns=(None,)):
+    """compile grammars and write them to the cache; returns paths of cache entries
+
+    :param grammar_fns: iterable of grammar paths (None for the bundled grammar)
+    """
+    dir_ = cache_dir()
+    if dir_ is None:
+        msg = "grammar cache is disabled (HGVS_GRAMMAR_CACHE_DIR is empty)"
+        raise ValueError(msg)
+    paths = []
+    for grammar_fn in grammar_fns:
+        source, filename, generate = _grammar_source(grammar_fn)
+        path = _cache_path(dir_, source)
+        if not path.exists():
+            _write(path, compile(generate(source), filename, "exec"))
+        paths.append(path)
+    return paths
+
+
+def _grammar_source(grammar_fn):
+    """return (source, filename, generate) for a grammar, where generate
+    translates source into Python source"""
+    if grammar_fn is None:
+        path = resources_files("hgvs.parsers.generated") / "hgvs_grammar.py"
+        return path.read_text(), str(path), lambda source: source
+    return Path(grammar_fn).read_text(), _GENERATED_FILENAME, _generate_python
+
+
+def _generate_python(grammar):
+    """translate OMeta grammar source into Python source, as parsley.makeGrammar does"""
+    tree = ometa.grammar.OMeta(grammar).parseGrammar("Grammar")
+    return ometa.builder.writePython(tree, grammar)
+
+
+def _cache_path(dir_, source):
+    key = hashlib.sha256(
+        "\0".join([
+            hgvs.__version__,
+            parsley.__version__,
+            sys.implementation.cache_tag,
+            source,
+        ]).encode()
+    ).hexdigest()
+    return dir_ / f"hgvs_grammar-{key}.marshal"
+
+
+def _load_code(source, filename, generate):
+    dir_ = cache_dir()
+    if dir_ is None:
+        return compile(generate(source), filename, "exec")
+    path = _cache_path(dir_, source)
+    try:
+        return marshal.loads(path.read_bytes())  # noqa: S302 (entries are written by _write)
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        _logger.info("%s: ignoring unreadable grammar cache entry (%s)", path, e)
+    code = compile(generate(source), filename, "exec")
+    try:
+        _write(path, code)
+    except OSError as e:
+        _logger.debug("%s: failed to write grammar cache entry (%s)", path, e)
+    return code
+
+
+def _write(path, code):
+    """write code to path atomically, so that concurrent readers never see a partial entry"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_fn = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    tmp_path = Path(tmp_fn)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(marshal.dumps(code))
+        tmp_path.chmod(0o644)  # mkstemp creates files readable only by the owner
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _logger.info("%s: wrote grammar cache entry", path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(
+        description="pre-build the on-disk cache of compiled OMeta grammars",
+    )
+    ap.add_argument(
+        "grammar_fns",
+        metavar="grammar_fn",
+        nargs="*",
+        help="OMeta grammar files to compile in addition to the bundled grammar",
+    )
+    opts = ap.parse_args(argv)
+    for path in build([None, *opts.grammar_fns]):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -2,11 +2,8 @@
 
 import copy
 import warnings
-from pathlib import Path
 
 import bioutils
-import ometa.runtime
-import parsley
 
 import hgvs
 import hgvs.edit
@@ -20,18 +17,24 @@ import hgvs.posedit
 import hgvs.sequencevariant
 from hgvs.exceptions import HGVSParseError
 from hgvs.parsers.base import _UNSET_GRAMMAR_FN, OMETA_GRAMMAR, Parser
-from hgvs.parsers.generated.hgvs_grammar import createParserClass
 
 
 class ParsleyParser(Parser):
     """The traditional OMeta/parsley grammar backend. See ``Parser`` for the public API."""
 
-    _parse_error_cls = ometa.runtime.ParseError
-
     def _build_grammar(self, grammar_fn):
+        # parsley, ometa, and the compiled grammar are loaded when the
+        # grammar is first needed (see Parser._grammar)
+        import ometa.runtime  # noqa: PLC0415
+        import parsley  # noqa: PLC0415
+
+        from hgvs.parsers import grammar_cache  # noqa: PLC0415
+
+        self._parse_error_cls = ometa.runtime.ParseError
+        bindings = {"hgvs": hgvs, "bioutils": bioutils, "copy": copy}
         if grammar_fn is _UNSET_GRAMMAR_FN or grammar_fn == OMETA_GRAMMAR:
             # Default (1.x): the bundled, pre-generated grammar.
-            bindings = {"hgvs": hgvs, "bioutils": bioutils, "copy": copy}
+            createParserClass = grammar_cache.load_parser_class_factory()  # noqa: N806
             return parsley.wrapGrammar(createParserClass(ometa.runtime.OMetaGrammarBase, bindings))
         # Deprecated escape hatch: a path to a custom OMeta grammar file.
         warnings.warn(
@@ -40,11 +43,10 @@ class ParsleyParser(Parser):
             "to select the pyparsing grammar or grammar_fn='__ometa__' for the "
             "traditional grammar.",
             DeprecationWarning,
-            stacklevel=3,
+            stacklevel=4,
         )
-        bindings = {"hgvs": hgvs, "bioutils": bioutils, "copy": copy}
-        with Path(grammar_fn).open() as grammar_file:
-            return parsley.makeGrammar(grammar_file.read(), bindings)
+        createParserClass = grammar_cache.load_parser_class_factory(grammar_fn)  # noqa: N806
+        return parsley.wrapGrammar(createParserClass(ometa.runtime.OMetaBase, bindings))
 
     def _translate_parse_error(self, s, exc):
         return HGVSParseError(f"{s}: char {exc.position}: {exc.formatReason()}")
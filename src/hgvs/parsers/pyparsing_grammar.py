@@ -8,6 +8,8 @@ cf. hgvs.pymeta for the original OMeta grammar and line references.
 """
 
 import contextlib
+import re
+import threading
 
 import bioutils.sequences
 import pyparsing as pp
@@ -53,6 +55,13 @@ class _NoneResult:
 
 _NONE_RESULT = _NoneResult()
 
+# Rules that alternative branches re-enter at the same location: the
+# accession prefix is tried once per variant type, and positions,
+# intervals, and edits once per uncertain/definite alternative.
+# Memoizing the other (mostly single-token) rules costs more than
+# re-parsing them.
+_MEMOIZED_RULE_RE = re.compile(r"accn|opt_gene_expr|\w+_(pos|interval|edit|posedit)")
+
 
 def _s(val):
     """Unwrap a single-element ParseResults to a plain Python value."""
@@ -71,9 +80,19 @@ class HGVSGrammar:
       basic types -> locations -> edits -> posedits -> variants
     Each public attribute that is a ParserElement is collected into
     ``self.rules`` for name-based lookup.
+
+    Rules that are re-parsed at the same location by alternative
+    branches are memoized ("packrat" parsing) for the duration of each
+    call to ``parse``, in a cache of at most ``packrat_cache_size``
+    entries; 0 disables memoization.  Unlike
+    ``pp.ParserElement.enable_packrat()``, which is process-global,
+    the cache belongs to this grammar instance (and to the calling
+    thread), and other pyparsing grammars are unaffected.
     """
 
-    def __init__(self):
+    def __init__(self, packrat_cache_size=1000):
+        self.packrat_cache_size = packrat_cache_size
+        self._packrat = threading.local()
         with _hgvs_whitespace():
             # Forward reference needed by dna_con/rna_con -> hgvs_position
             self.hgvs_position = pp.Forward()
@@ -87,11 +106,17 @@ class HGVSGrammar:
             self._build_variants()
             self._collect_rules()
             self._anchor_rules()
+        if packrat_cache_size:
+            self._memoize_rules()
 
     def parse(self, rule_name, input_string):
         """Parse *input_string* using the named rule. Returns the domain object."""
         rule = self._anchored_rules[rule_name]
-        result = rule.parse_string(input_string)
+        self._packrat.cache = {} if self.packrat_cache_size else None
+        try:
+            result = rule.parse_string(input_string)
+        finally:
+            self._packrat.cache = None
         rv = result[0]
         return None if isinstance(rv, _NoneResult) else rv
 
@@ -723,6 +748,47 @@ class HGVSGrammar:
         """
         self._anchored_rules = {name: rule + pp.StringEnd() for name, rule in self.rules.items()}
 
+    def _memoize_rules(self):
+        """Replace _parse of the rules matching _MEMOIZED_RULE_RE with a memoizing version.
+
+        pyparsing calls ``element._parse`` for every subexpression, so an
+        instance attribute overrides the (class-level, possibly
+        process-globally memoized) method for this grammar's elements only.
+        As with pyparsing's own packrat cache, results and exceptions are
+        keyed on (element, location, ...) and results are stored as copies.
+        """
+        for name, rule in self.rules.items():
+            if _MEMOIZED_RULE_RE.fullmatch(name):
+                rule._parse = self._make_memoized_parse(rule)
+
+    def _make_memoized_parse(self, rule):
+        parse_no_cache = rule._parseNoCache
+        packrat = self._packrat
+        cache_size = self.packrat_cache_size
+
+        def _parse(instring, loc, do_actions=True, callPreParse=True):  # noqa: N803
+            cache = getattr(packrat, "cache", None)
+            if cache is None:
+                # not called from HGVSGrammar.parse (e.g., rule used directly)
+                return parse_no_cache(instring, loc, do_actions, callPreParse)
+            key = (rule, loc, do_actions, callPreParse)
+            value = cache.get(key)
+            if value is None:
+                try:
+                    value = parse_no_cache(instring, loc, do_actions, callPreParse)
+                except pp.ParseBaseException as pe:
+                    if len(cache) < cache_size:
+                        cache[key] = pe.__class__(*pe.args)
+                    raise
+                if len(cache) < cache_size:
+                    cache[key] = (value[0], value[1].copy())
+                return value
+            if isinstance(value, pp.ParseBaseException):
+                raise value.__class__(*value.args)
+            return value[0], value[1].copy()
+
+        return _parse
+
 
 # <LICENSE>
 # Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
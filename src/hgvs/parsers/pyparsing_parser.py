@@ -1,8 +1,5 @@
 """pyparsing backend for the HGVS parser (see hgvs.parsers.pyparsing_grammar)."""
 
-from pyparsing import ParseBaseException
-
-import hgvs.parsers.pyparsing_grammar
 from hgvs.exceptions import HGVSParseError
 from hgvs.parsers.base import Parser
 
@@ -42,11 +39,15 @@ class _GrammarCallable:
 class PyParsingParser(Parser):
     """The newer pyparsing grammar backend. See ``Parser`` for the public API."""
 
-    # ParseBaseException rather than ParseException: ParseFatalException and
-    # ParseSyntaxException are siblings of ParseException, not subclasses of it.
-    _parse_error_cls = ParseBaseException
-
     def _build_grammar(self, grammar_fn):
+        # pyparsing is imported when the grammar is first needed (see Parser._grammar)
+        from pyparsing import ParseBaseException  # noqa: PLC0415
+
+        import hgvs.parsers.pyparsing_grammar  # noqa: PLC0415
+
+        # ParseBaseException rather than ParseException: ParseFatalException and
+        # ParseSyntaxException are siblings of ParseException, not subclasses of it.
+        self._parse_error_cls = ParseBaseException
         self._grammar_obj = hgvs.parsers.pyparsing_grammar.HGVSGrammar()
         return _GrammarCallable(self._grammar_obj)
 
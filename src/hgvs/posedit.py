@@ -5,6 +5,7 @@ import attr
 from hgvs.enums import ValidationLevel
 from hgvs.exceptions import HGVSUnsupportedOperationError
 from hgvs.location import Interval
+from hgvs.utils.structcopy import structcopy
 
 
 @attr.s(slots=True, repr=False)
@@ -17,6 +18,8 @@ class PosEdit:
     edit = attr.ib(default=None)
     uncertain = attr.ib(default=False)
 
+    __deepcopy__ = structcopy
+
     def format(self, conf=None):
         """Formatting the string of PosEdit"""
         if self.pos is None:
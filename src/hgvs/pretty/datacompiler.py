@@ -14,6 +14,10 @@ from hgvs.sequencevariant import SequenceVariant
 from hgvs.utils import altseq_to_hgvsp, altseqbuilder
 from hgvs.utils.reftranscriptdata import RefTranscriptData
 
+# bases of reference on each side of a variant that are initially
+# fetched for shuffling; see DataCompiler._normalize_in_window
+_SHUFFLE_FLANK = 128
+
 
 class DataCompiler:
     """
@@ -41,6 +45,44 @@ class DataCompiler:
 
     def __init__(self, config: PrettyConfig):
         self.config = config
+        # data fetched for this compiler, shared by the variants it compiles
+        self._seq_windows = {}
+        self._tx_exons = {}
+        self._reference_data = {}
+
+    def prefetch(self, ac: str, start: int, end: int) -> None:
+        """Fetches, in one request, the sequence of ac needed to compile
+        variants between start and end (interbase), including padding
+        and the flanks used for shuffling.  Later sequence lookups within
+        the fetched range are served from it."""
+        start = max(0, start - max(self.config.padding_left, _SHUFFLE_FLANK))
+        end = end + max(self.config.padding_right, _SHUFFLE_FLANK)
+        self._seq_windows[ac] = (start, self.config.hdp.get_seq(ac, start, end))
+
+    def _get_seq(self, ac: str, start: int | None = None, end: int | None = None) -> str:
+        """Returns the sequence of ac from start to end, from a prefetched
+        window if it contains that range."""
+        if ac in self._seq_windows and start is not None and end is not None:
+            w_start, w_seq = self._seq_windows[ac]
+            if w_start <= start and end <= w_start + len(w_seq):
+                return w_seq[start - w_start : end - w_start]
+        seq = self.config.hdp.get_seq(ac, start, end)
+        if start is None and end is None:
+            self._seq_windows[ac] = (0, seq)
+        return seq
+
+    def _get_tx_exons(self, tx_ac: str, alt_ac: str, alt_aln_method: str) -> list:
+        key = (tx_ac, alt_ac, alt_aln_method)
+        if key not in self._tx_exons:
+            tx_exons = self.config.hdp.get_tx_exons(tx_ac, alt_ac, alt_aln_method)
+            self._tx_exons[key] = sorted(tx_exons, key=lambda e: e["ord"])
+        return self._tx_exons[key]
+
+    def _get_reference_data(self, tx_ac: str) -> RefTranscriptData:
+        if tx_ac not in self._reference_data:
+            # we don't know the protein ac, get it looked up:
+            self._reference_data[tx_ac] = RefTranscriptData(self.config.hdp, tx_ac, None)
+        return self._reference_data[tx_ac]
 
     def get_shuffled_variant(self, var_g: SequenceVariant, direction: int) -> VariantCoords:
         """Takes a sequence variant and returns VariantCoords that have been shuffled accordingly."""
@@ -53,18 +95,13 @@ class DataCompiler:
         else:
             shuffle_direction = "EXPAND"
 
-        chrom_seq = self.config.hdp.get_seq(var_g.ac)
-
         start, end, ref, alt = self.get_position_and_state(var_g)
 
         if var_g.posedit.edit.type == "identity":
             return VariantCoords(start, end, ref, alt)
 
-        shuffled_interval, shuffled_alleles = normalize(
-            chrom_seq,
-            interval=(start, end),
-            alleles=(None, alt),
-            mode=shuffle_direction,
+        shuffled_interval, shuffled_alleles = self._normalize_in_window(
+            var_g.ac, start, end, alt, shuffle_direction
         )
 
         return VariantCoords(
@@ -74,6 +111,32 @@ class DataCompiler:
             shuffled_alleles[1],
         )
 
+    def _normalize_in_window(self, ac, start, end, alt, mode):
+        """normalize alt at (start, end) of ac, as bioutils.normalize
+        would with the whole sequence of ac
+
+        Only a window of the sequence around the variant is fetched.
+        The window is grown, and the variant normalized again, while
+        the normalized variant reaches an edge of the window that isn't
+        an end of the sequence.
+        """
+        flank = _SHUFFLE_FLANK
+        while True:
+            w_start = max(0, start - flank)
+            w_end = end + flank
+            seq = self._get_seq(ac, w_start, w_end)
+            (n_start, n_end), alleles = normalize(
+                seq,
+                interval=(start - w_start, end - w_start),
+                alleles=(None, alt),
+                mode=mode,
+            )
+            at_left_edge = n_start == 0 and w_start > 0
+            at_right_edge = n_end == len(seq) and len(seq) == w_end - w_start
+            if not (at_left_edge or at_right_edge):
+                return (n_start + w_start, n_end + w_start), alleles
+            flank *= 4
+
     def _get_start_end(self, var):
         if isinstance(var.posedit.pos, hgvs.location.BaseOffsetInterval):
             s = var.posedit.pos.start
@@ -124,7 +187,7 @@ class DataCompiler:
                 start = sv.posedit.pos.start.base - 1
                 end = sv.posedit.pos.end.base
             if sv.posedit.edit.type == "identity":
-                alt = self.config.hdp.get_seq(sv.ac, start, end)
+                alt = self._get_seq(sv.ac, start, end)
                 ref = alt
             else:
                 alt = sv.posedit.edit.alt or ""
@@ -134,7 +197,7 @@ class DataCompiler:
             start, end = self._get_start_end(sv)
             # start = sv.posedit.pos.start.base - 1
             # end = sv.posedit.pos.end.base
-            ref = self.config.hdp.get_seq(sv.ac, start.base - 1, end.base)
+            ref = self._get_seq(sv.ac, start.base - 1, end.base)
             alt = ref + ref
 
         else:
@@ -249,17 +312,12 @@ class DataCompiler:
         alt_ac = var_g.ac
         alt_aln_method = "splign"
 
-        if tx_ac:
-            tx_exons = self.config.hdp.get_tx_exons(tx_ac, alt_ac, alt_aln_method)
-            tx_exons = sorted(tx_exons, key=lambda e: e["ord"])
-        else:
-            tx_exons = []
+        tx_exons = self._get_tx_exons(tx_ac, alt_ac, alt_aln_method) if tx_ac else []
 
-        chrom_seq = self.config.hdp.get_seq(var_g.ac)
-        disp_seq = chrom_seq[seq_start:seq_end]
+        disp_seq = self._get_seq(var_g.ac, seq_start, seq_end)
 
         if tx_ac:
-            tx_seq = self.config.hdp.get_seq(tx_ac)
+            tx_seq = self._get_seq(tx_ac)
 
             mapper = self.config.assembly_mapper._fetch_AlignmentMapper(
                 tx_ac=tx_ac, alt_ac=var_g.ac, alt_aln_method="splign"
@@ -269,11 +327,9 @@ class DataCompiler:
             tx_seq = ""
             mapper = None
 
-        # we don't know the protein ac, get it looked up:
-        pro_ac = None
         if var_c_or_n and var_c_or_n.type == "c":
             var_p = self.config.assembly_mapper.c_to_p(var_c_or_n)
-            reference_data = RefTranscriptData(self.config.hdp, tx_ac, pro_ac)
+            reference_data = self._get_reference_data(tx_ac)
         else:
             var_p = None
             reference_data = None
@@ -291,7 +347,7 @@ class DataCompiler:
             )
             position_details.append(pdata)
 
-            pdata.ref = chrom_seq[chromosome_pos - 1]
+            pdata.ref = disp_seq[chromosome_pos - 1 - seq_start]
 
             if not mapper:
                 continue
@@ -339,7 +395,7 @@ class DataCompiler:
                     pdata.mapped_pos = prev_mapped_pos
                     pdata.mapped_pos_offset = mapped_pos_offset
                     pdata.cigar_ref = cig
-                    pdata.ref = chrom_seq[chromosome_pos - 1]
+                    pdata.ref = disp_seq[chromosome_pos - 1 - seq_start]
 
                     if mapper.strand > 0:
                         prev_c_pos += 1
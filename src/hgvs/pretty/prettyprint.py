@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 import hgvs
 from hgvs.assemblymapper import AssemblyMapper
 from hgvs.pretty.console.chromseqrenderer import ChromSeqRendered
@@ -17,6 +19,14 @@ from hgvs.pretty.datacompiler import DataCompiler
 from hgvs.pretty.models import PrettyConfig
 from hgvs.repeats import RepeatAnalyser
 from hgvs.sequencevariant import SequenceVariant
+from hgvs.utils.position import get_start_end
+
+# maximum distance between variants that display_many groups into one locus
+_LOCUS_GAP = 10_000
+
+# maximum span of a locus, so that the sequence fetched for variants that
+# are spaced evenly along a chromosome stays bounded
+_MAX_LOCUS_SPAN = 5 * _LOCUS_GAP
 
 
 class PrettyPrint:
@@ -37,6 +47,8 @@ class PrettyPrint:
             Retrieves the HGVS names for a given sequence variant.
         display(sv: SequenceVariant, tx_ac: str = None, display_start: int = None, display_end: int = None) -> str:
             Takes a variant and prints the genomic context around it.
+        display_many(variants: Iterable[SequenceVariant], tx_ac: str = None, display_start: int = None, display_end: int = None) -> List[str]:
+            Displays each of many variants, sharing the data fetched for nearby variants.
         create_repre(var_g: SequenceVariant, var_c_or_n: SequenceVariant, display_start: int, display_end: int, data_compiler: DataCompiler) -> str:
             Creates a representation of the variant with the given parameters.
     """
@@ -76,14 +88,23 @@ class PrettyPrint:
             reverse_display=reverse_display,
         )
 
-    def _get_all_transcripts(self, var_g) -> list[str]:
-        transcripts = self.config.assembly_mapper.relevant_transcripts(var_g)
+    def _get_all_transcripts(self, var_g, transcripts_cache: dict | None = None) -> list[str]:
+        if transcripts_cache is None:
+            return self.config.assembly_mapper.relevant_transcripts(var_g)
 
-        return transcripts
+        key = (var_g.ac, str(var_g.posedit.pos))
+        if key not in transcripts_cache:
+            transcripts_cache[key] = self.config.assembly_mapper.relevant_transcripts(var_g)
+        return transcripts_cache[key]
 
-    def _infer_hgvs_c(self, var_g: SequenceVariant, tx_ac: str | None = None) -> SequenceVariant:
+    def _infer_hgvs_c(
+        self,
+        var_g: SequenceVariant,
+        tx_ac: str | None = None,
+        transcripts_cache: dict | None = None,
+    ) -> SequenceVariant:
         if not tx_ac:
-            transcripts = self._get_all_transcripts(var_g)
+            transcripts = self._get_all_transcripts(var_g, transcripts_cache)
             if transcripts:
                 tx_ac = transcripts[0]
             else:
@@ -142,22 +163,95 @@ class PrettyPrint:
 
         self.data_compiler = DataCompiler(config=self.config)
 
+        return self._display(var_g, var_c_or_n, display_start, display_end, self.data_compiler)
+
+    def display_many(
+        self,
+        variants: Iterable[SequenceVariant],
+        tx_ac: str | None = None,
+        display_start: int | None = None,
+        display_end: int | None = None,
+    ) -> list[str]:
+        """Displays each of variants, as display() would, and returns the displays in input order.
+
+        Variants are grouped into loci of nearby variants on the same chromosome.  The
+        chromosome sequence of each locus is fetched once, and transcript exons and
+        transcript sequences are looked up once per locus, rather than for each variant.
+        Relevant transcripts are looked up once per distinct variant position.
+        """
+
+        names = [self.get_hgvs_names(sv, tx_ac) for sv in variants]
+        displays = [None] * len(names)
+        for ac, start, end, indexes in self._group_loci(names):
+            data_compiler = DataCompiler(config=self.config)
+            data_compiler.prefetch(ac, start, end)
+            transcripts_cache = {}
+            for i in indexes:
+                var_g, var_c_or_n = names[i]
+                displays[i] = self._display(
+                    var_g,
+                    var_c_or_n,
+                    display_start,
+                    display_end,
+                    data_compiler,
+                    transcripts_cache=transcripts_cache,
+                )
+        return displays
+
+    @staticmethod
+    def _group_loci(names):
+        """Yields (ac, start, end, indexes) for each group of variants in names whose
+        chromosome positions are within _LOCUS_GAP of each other.  A new group is
+        started where a group would span more than _MAX_LOCUS_SPAN."""
+        spans = []
+        for i, (var_g, _) in enumerate(names):
+            s, e = get_start_end(var_g)
+            spans.append((var_g.ac, s.base - 1, e.base, i))
+        spans.sort()
+
+        locus = None
+        for ac, start, end, i in spans:
+            if (
+                locus
+                and locus[0] == ac
+                and start - locus[2] <= _LOCUS_GAP
+                and max(locus[2], end) - locus[1] <= _MAX_LOCUS_SPAN
+            ):
+                locus[2] = max(locus[2], end)
+                locus[3].append(i)
+                continue
+            if locus:
+                yield tuple(locus)
+            locus = [ac, start, end, [i]]
+        if locus:
+            yield tuple(locus)
+
+    def _display(
+        self,
+        var_g: SequenceVariant,
+        var_c_or_n: SequenceVariant,
+        display_start: int,
+        display_end: int,
+        data_compiler: DataCompiler,
+        *,
+        transcripts_cache: dict | None = None,
+    ) -> str:
         if self.config.all:
             # get all overlapping transcripts
 
             response = ""
-            tx_acs = self._get_all_transcripts(var_g)
+            tx_acs = self._get_all_transcripts(var_g, transcripts_cache)
             for candidate_tx_ac in tx_acs:
                 var_c_or_n = self._infer_hgvs_c(var_g, candidate_tx_ac)
                 response += self.create_repre(
-                    var_g, var_c_or_n, display_start, display_end, self.data_compiler
+                    var_g, var_c_or_n, display_start, display_end, data_compiler
                 )
                 response += "\n---\n"
             return response
         if not var_c_or_n and self.config.infer_hgvs_c:
-            var_c_or_n = self._infer_hgvs_c(var_g)
+            var_c_or_n = self._infer_hgvs_c(var_g, transcripts_cache=transcripts_cache)
 
-        return self.create_repre(var_g, var_c_or_n, display_start, display_end, self.data_compiler)
+        return self.create_repre(var_g, var_c_or_n, display_start, display_end, data_compiler)
 
     def create_repre(
         self,
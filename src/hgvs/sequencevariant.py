@@ -2,8 +2,11 @@
 
 import attr
 
-import hgvs.variantmapper
+import hgvs
+import hgvs.edit
+import hgvs.posedit
 from hgvs.enums import ValidationLevel
+from hgvs.utils.structcopy import structcopy
 from hgvs.utils.validation import validate_type_ac_pair
 
 
@@ -20,6 +23,8 @@ class SequenceVariant:
     posedit = attr.ib()
     gene = attr.ib(default=None)
 
+    __deepcopy__ = structcopy
+
     def format(self, conf=None):
         """Formatting the stringification of sequence variants
 
@@ -50,23 +55,18 @@ class SequenceVariant:
         )
 
     def fill_ref(self, hdp, alt_ac=None, alt_aln_method=hgvs.global_config.mapping.alt_aln_method):
+        """fill in the reference sequence of this variant, in place; returns self
+
+        hgvs mappers do not call this method on their arguments, which
+        callers may share among threads; see VariantMapper._fill_ref.
+        """
         # TODO: Refactor. SVs should not operate on themselves when
         # external resources are required
-        # replace_reference should be moved outside function
+        # (variantmapper imports most of the package; import it only when needed)
+        import hgvs.variantmapper  # noqa: PLC0415
+
         vm = hgvs.variantmapper.VariantMapper(hdp)
-        edit_type = None
-        if isinstance(self.posedit, hgvs.posedit.PosEdit) and isinstance(
-            self.posedit.edit, hgvs.edit.Edit
-        ):
-            edit_type = self.posedit.edit.type
-        if (
-            edit_type in ["del", "delins", "identity", "dup", "repeat"]
-            and self.posedit.edit.ref_s is None
-        ):
-            vm._replace_reference(self, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
-        if edit_type == "identity" and isinstance(self.posedit.edit, hgvs.edit.NARefAlt):
-            self.posedit.edit.alt = self.posedit.edit.ref
-        return self
+        return vm._fill_ref(self, alt_ac=alt_ac, alt_aln_method=alt_aln_method, in_place=True)
 
     def validate(self):
         (res, msg) = (ValidationLevel.VALID, None)
@@ -5,6 +5,7 @@ Used in hgvsc to hgvsp conversion.
 """
 
 import hgvs
+import hgvs.sequencevariant
 
 from ..edit import AAExt, AAFs, AARefAlt, AASub, Dup
 from ..exceptions import HGVSError
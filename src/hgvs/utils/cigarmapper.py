@@ -16,6 +16,7 @@ The conceptual swap occurs in the _map function.
 """
 
 import re
+from bisect import bisect_right
 
 from hgvs.exceptions import HGVSInvalidIntervalError
 
@@ -72,6 +73,68 @@ class CIGARMapper:
             strict_bounds=strict_bounds,
         )
 
+    def map_ref_to_tgt_array(self, positions, end, strict_bounds=True):
+        """map an array of ref positions to tgt; see _map_array"""
+        return self._map_array(
+            from_pos=self.ref_pos,
+            to_pos=self.tgt_pos,
+            positions=positions,
+            end=end,
+            strict_bounds=strict_bounds,
+        )
+
+    def map_tgt_to_ref_array(self, positions, end, strict_bounds=True):
+        """map an array of tgt positions to ref; see _map_array"""
+        return self._map_array(
+            from_pos=self.tgt_pos,
+            to_pos=self.ref_pos,
+            positions=positions,
+            end=end,
+            strict_bounds=strict_bounds,
+        )
+
+    def _map_array(self, from_pos, to_pos, positions, end, strict_bounds):
+        """Map an array of positions between aligned segments
+
+        This is the vectorized equivalent of _map, and requires numpy.
+        Positions are 0-based, base-counting.  Returns a tuple of
+        numpy arrays (mapped positions, offsets, CIGAR ops), each
+        with the shape of positions.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        pos = np.asarray(positions, dtype=np.int64)
+        from_pos = np.asarray(from_pos, dtype=np.int64)
+        to_pos = np.asarray(to_pos, dtype=np.int64)
+
+        if strict_bounds and np.any((pos < 0) | (pos > from_pos[-1])):
+            msg = "Position is beyond the bounds of transcript record"
+            raise HGVSInvalidIntervalError(msg)
+
+        # find aligned segments as in _map
+        pos_i = np.minimum(np.searchsorted(from_pos[1:], pos, side="right"), len(self.cigar_op) - 1)
+        ops = np.asarray(self.cigar_op)[pos_i]
+        seg_from_start = from_pos[pos_i]
+        seg_from_end = from_pos[pos_i + 1]
+        seg_to_start = to_pos[pos_i]
+
+        is_gap = np.isin(ops, ("D", "I"))
+        is_intron = ops == "N"
+        near_start = pos - seg_from_start + 1 <= seg_from_end - pos
+
+        mapped_pos = np.where(
+            np.isin(ops, ("=", "M", "X")), seg_to_start + (pos - seg_from_start), seg_to_start
+        )
+        if end == "start":
+            mapped_pos = np.where(is_gap, mapped_pos - 1, mapped_pos)
+        mapped_pos = np.where(is_intron & near_start, mapped_pos - 1, mapped_pos)
+        mapped_pos_offset = np.where(
+            is_intron,
+            np.where(near_start, pos - seg_from_start + 1, -(seg_from_end - pos)),
+            0,
+        )
+        return mapped_pos, mapped_pos_offset, ops
+
     def _map(self, from_pos, to_pos, pos, end, strict_bounds):
         """Map position between aligned segments
 
@@ -82,11 +145,10 @@ class CIGARMapper:
             msg = "Position is beyond the bounds of transcript record"
             raise HGVSInvalidIntervalError(msg)
 
-        # find aligned segment to use as basis for mapping
+        # find aligned segment to use as basis for mapping, i.e., the
+        # first segment whose end is beyond pos
         # okay for pos to be before first element or after last
-        for pos_i in range(len(self.cigar_op)):
-            if pos < from_pos[pos_i + 1]:
-                break
+        pos_i = min(bisect_right(from_pos, pos, 1) - 1, len(self.cigar_op) - 1)
         if self.cigar_op[pos_i] in "=MX":
             mapped_pos = to_pos[pos_i] + (pos - from_pos[pos_i])
             mapped_pos_offset = 0
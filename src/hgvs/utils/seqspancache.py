@@ -0,0 +1,177 @@
+"""in-memory cache of sequence spans, limited by total size
+
+Sequence fetches are frequently for overlapping or nested regions of
+the same accession, e.g., the successively larger windows read by the
+normalizer and the single-base probes made during validation.  Caching
+on exact (ac, start_i, end_i) misses all of these.  SeqSpanCache
+instead stores fetched spans per accession, serves any contained
+sub-range from memory, and merges overlapping or adjacent spans.
+
+>>> cache = SeqSpanCache(maxbytes=100)
+>>> cache.add("NM_01234.5", 10, "ACGTACGTAC")
+>>> cache.get("NM_01234.5", 12, 15)
+'GTA'
+>>> cache.get("NM_01234.5", 15, 25) is None
+True
+
+"""
+
+import logging
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+
+from hgvs.decorators.lru_cache import RUN
+from hgvs.exceptions import HGVSDataNotAvailableError
+
+_logger = logging.getLogger(__name__)
+
+
+class SeqSpanCache:
+    """Cache of sequence spans by accession
+
+    :param int maxbytes: maximum total length of cached sequence;
+        the least recently used accessions are evicted to stay within
+        this limit.
+
+    Each accession holds a list of non-overlapping, non-adjacent
+    spans, sorted by start, as parallel lists of starts and sequences.
+    Once the length of an accession is known (i.e., a span that
+    extends to its end has been added), requests without end_i or with
+    end_i past the end are also served, as sequence slicing would.
+
+    """
+
+    def __init__(self, maxbytes):
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._spans = OrderedDict()  # ac -> [starts, seqs, length or None]
+        self._lock = threading.RLock()
+
+    def get(self, ac, start_i=None, end_i=None):
+        """return the sequence of ac from start_i to end_i, or None if
+        that range is not contained in a cached span
+
+        """
+        if start_i is None:
+            start_i = 0
+        with self._lock:
+            spans = self._spans.get(ac)
+            if spans is not None:
+                starts, seqs, length = spans
+                if length is not None:
+                    end_i = length if end_i is None else min(end_i, length)
+                if end_i is not None:
+                    i = bisect_right(starts, start_i) - 1
+                    if i >= 0 and end_i <= starts[i] + len(seqs[i]):
+                        self._spans.move_to_end(ac)
+                        self.hits += 1
+                        return seqs[i][start_i - starts[i] : end_i - starts[i]]
+            self.misses += 1
+            return None
+
+    def add(self, ac, start_i, seq, complete=False):
+        """add seq, which begins at start_i of ac, to the cache
+
+        If complete is True, seq extends to the end of ac.
+        """
+        if start_i is None:
+            start_i = 0
+        if len(seq) > self.maxbytes:
+            return
+        end_i = start_i + len(seq)
+        with self._lock:
+            starts, seqs, length = self._spans.pop(ac, None) or ([], [], None)
+            if complete:
+                length = end_i
+
+            # merge with spans that overlap or abut [start_i, end_i)
+            lo = bisect_right(starts, start_i) - 1
+            if lo < 0 or starts[lo] + len(seqs[lo]) < start_i:
+                lo += 1
+            hi = bisect_right(starts, end_i)
+            if lo < hi:
+                if starts[lo] < start_i:
+                    seq = seqs[lo][: start_i - starts[lo]] + seq
+                    start_i = starts[lo]
+                last_end = starts[hi - 1] + len(seqs[hi - 1])
+                if last_end > end_i:
+                    seq += seqs[hi - 1][end_i - starts[hi - 1] :]
+                self.nbytes -= sum(len(s) for s in seqs[lo:hi])
+            starts[lo:hi] = [start_i]
+            seqs[lo:hi] = [seq]
+            self.nbytes += len(seq)
+            self._spans[ac] = [starts, seqs, length]
+
+            while self.nbytes > self.maxbytes:
+                _, (_, old_seqs, _) = self._spans.popitem(last=False)
+                self.nbytes -= sum(len(s) for s in old_seqs)
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+            self.nbytes = self.hits = self.misses = 0
+
+
+class ReferenceWindows:
+    """prefetches windows of reference sequence into the span cache of
+    a data provider's SeqFetcher, from which fetches within a window
+    are then served
+
+    :param hdp: data provider; nothing is prefetched if it has no
+        seqfetcher or is in "run" mode, in which all sequence comes
+        from the persistent cache
+    :param int window_size: length of the windows; 0 prefetches nothing
+
+    Spans passed to prefetch() in order of position, as for a sorted
+    VCF file, require one fetch per window.
+    """
+
+    def __init__(self, hdp, window_size):
+        self.seqfetcher = (
+            None if getattr(hdp, "mode", None) == RUN else getattr(hdp, "seqfetcher", None)
+        )
+        self.window_size = window_size
+        # sequence fetched around a variant (e.g., by the normalizer)
+        # extends beyond it; keep variants this far inside a window
+        self.margin = window_size // 100
+        self._windows = {}  # ac -> (start_i, end_i) of current window
+
+    def prefetch(self, ac, start_i, end_i):
+        if self.seqfetcher is None or self.seqfetcher.seq_cache is None or self.window_size <= 0:
+            return
+        window = self._windows.get(ac)
+        if (
+            window is not None
+            and window[0] <= start_i - self.margin
+            and end_i + self.margin <= window[1]
+        ):
+            return
+        w_start = max(0, start_i - self.margin)
+        w_end = max(w_start + self.window_size, end_i + self.margin)
+        # recorded even if the fetch fails, so that the fetch isn't
+        # retried for every variant in the window
+        self._windows[ac] = (w_start, w_end)
+        try:
+            self.seqfetcher.fetch_seq(ac, w_start, w_end)
+        except HGVSDataNotAvailableError as e:
+            _logger.warning("%s; fetching sequence for each variant", e)
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -0,0 +1,186 @@
+"""dict-like persistent store backed by sqlite
+
+SQLiteDict is an alternative to PersistentDict for data provider
+caches (see :class:`hgvs.dataproviders.interface.Interface`).
+PersistentDict loads the entire pickle into memory when opened and
+rewrites the whole file on every sync.  SQLiteDict instead reads
+entries on demand, writes new entries incrementally, and permits
+concurrent readers (and serialized writers) in other processes.
+
+Keys must be tuples (or lists) of str, int, float, or None, such as
+the keys generated by :func:`hgvs.decorators.lru_cache.lru_cache`.
+They are stored by repr, which, unlike pickle, is deterministic for
+such values.  Values are pickled.
+
+"""
+
+import ast
+import os
+import pickle
+import sqlite3
+import threading
+from pathlib import Path
+
+protocol = 4
+
+SQLITE_MAGIC = b"SQLite format 3\x00"
+
+
+def is_sqlite_file(filename):
+    """return True if filename exists and is a sqlite database"""
+    try:
+        with Path(filename).open("rb") as f:
+            return f.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+    except OSError:
+        return False
+
+
+class SQLiteDict:
+    """Persistent dictionary stored in a sqlite database
+
+    :param str filename: path to sqlite database
+    :param str flag: "r" (read-only) or "c" (create, write, read)
+
+    As with PersistentDict, items set on a read-only instance are
+    kept in memory only.  Connections are not shared across fork();
+    a child process transparently opens its own connection.
+
+    """
+
+    def __init__(self, filename, flag="c"):
+        self.filename = str(filename)
+        self.flag = flag  # r=readonly, c=create,write,read
+        if self.flag == "r" and not Path(self.filename).exists():
+            raise OSError("Cannot open file " + self.filename)
+        self._local = {}
+        self._lock = threading.RLock()
+        self._conn = None
+        self._pid = None
+
+    def _connection(self):
+        if self._conn is None or self._pid != os.getpid():
+            if self.flag == "r":
+                uri = Path(self.filename).resolve().as_uri() + "?mode=ro"
+                conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            else:
+                conn = sqlite3.connect(self.filename, timeout=60, check_same_thread=False)
+                conn.execute("pragma journal_mode=wal")
+                conn.execute(
+                    "create table if not exists cache (key text primary key, value blob not null)"
+                )
+                conn.commit()
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    @staticmethod
+    def _encode_key(key):
+        if isinstance(key, list):
+            key = tuple(key)
+        return repr(key)
+
+    def __getitem__(self, key):
+        ekey = self._encode_key(key)
+        if ekey in self._local:
+            return self._local[ekey]
+        rows = self._query("select value from cache where key = ?", (ekey,))
+        if not rows:
+            raise KeyError(key)
+        return pickle.loads(rows[0][0])  # noqa: S301
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        ekey = self._encode_key(key)
+        if self.flag == "r":
+            self._local[ekey] = value
+            return
+        self._query(
+            "insert or replace into cache (key, value) values (?, ?)",
+            (ekey, pickle.dumps(value, protocol)),
+        )
+
+    def __delitem__(self, key):
+        ekey = self._encode_key(key)
+        if self._local.pop(ekey, KeyError) is not KeyError:
+            return
+        if self.flag == "r" or key not in self:
+            raise KeyError(key)
+        self._query("delete from cache where key = ?", (ekey,))
+
+    def __contains__(self, key):
+        ekey = self._encode_key(key)
+        return ekey in self._local or bool(
+            self._query("select 1 from cache where key = ?", (ekey,))
+        )
+
+    def __len__(self):
+        return self._query("select count(*) from cache")[0][0] + len(self._local)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        keys = [row[0] for row in self._query("select key from cache")]
+        return [ast.literal_eval(k) for k in keys + list(self._local)]
+
+    def items(self):
+        rows = self._query("select key, value from cache")
+        items = [(ast.literal_eval(k), pickle.loads(v)) for k, v in rows]  # noqa: S301
+        return items + [(ast.literal_eval(k), v) for k, v in self._local.items()]
+
+    def values(self):
+        return [v for _, v in self.items()]
+
+    def update(self, other):
+        for k, v in dict(other).items():
+            self[k] = v
+
+    def clear(self):
+        self._local.clear()
+        if self.flag != "r":
+            self._query("delete from cache")
+
+    def sync(self):
+        if self.flag == "r":
+            return
+        with self._lock:
+            self._connection().commit()
+
+    def close(self):
+        self.sync()
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
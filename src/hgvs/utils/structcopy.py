@@ -0,0 +1,80 @@
+"""fast deep copies of variants
+
+copy.deepcopy copies an object generically: it reduces and
+reconstructs each object in the tree.  The leaves of the trees of
+attrs objects that represent variants (SequenceVariant, PosEdit,
+Edit, and positions and intervals) are immutable scalars, so they may
+be copied by copying attribute values directly, which is several
+times faster.
+
+The classes of these objects use structcopy as their __deepcopy__,
+so copy.deepcopy uses it too.  Like deepcopy, structcopy records
+copied objects in a memo, so that objects referenced more than once
+(e.g., a variant listed twice) are copied once and stay shared.
+
+>>> import hgvs.location
+>>> pos = hgvs.location.SimplePosition(5)
+>>> pos_copy = structcopy(pos)
+>>> pos_copy == pos, pos_copy is pos
+(True, False)
+
+"""
+
+import copy
+import enum
+
+# values that are copied by reference
+_IMMUTABLE_TYPES = {str, int, float, bool, type(None)}
+
+# class -> names of its attrs attributes
+_attr_names = {}
+
+
+def structcopy(obj, memo=None):
+    """return a deep copy of obj, an attrs object whose attribute values
+    are immutable scalars or other such attrs objects
+
+    Other attribute values are copied with copy.deepcopy.  The object
+    is created without calling __init__, so that validation and
+    post-init processing are not repeated.  memo is the memo dict of
+    copy.deepcopy (id of original -> copy).
+
+    """
+    if memo is None:
+        memo = {}
+    new = memo.get(id(obj))
+    if new is not None:
+        return new
+    cls = type(obj)
+    names = _attr_names.get(cls)
+    if names is None:
+        names = _attr_names[cls] = tuple(a.name for a in cls.__attrs_attrs__)
+    new = memo[id(obj)] = object.__new__(cls)
+    for name in names:
+        value = getattr(obj, name)
+        value_cls = type(value)
+        if value_cls in _IMMUTABLE_TYPES or isinstance(value, enum.Enum):
+            pass
+        elif value_cls in _attr_names or hasattr(value_cls, "__attrs_attrs__"):
+            value = structcopy(value, memo)
+        else:
+            value = copy.deepcopy(value, memo)
+        object.__setattr__(new, name, value)
+    return new
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -23,12 +23,18 @@ _logger = logging.getLogger(__name__)
 
 
 class Validator:
-    """invoke intrinsic and extrinsic validation"""
+    """invoke intrinsic and extrinsic validation
 
-    def __init__(self, hdp, strict=hgvs.global_config.validator.strict):
+    Validation does not modify variants; a Validator may be shared
+    among threads.
+    """
+
+    def __init__(
+        self, hdp, strict=hgvs.global_config.validator.strict, alignment_mapper_cache=None
+    ):
         self.strict = strict
         self._ivr = IntrinsicValidator(strict)
-        self._evr = ExtrinsicValidator(hdp, strict)
+        self._evr = ExtrinsicValidator(hdp, strict, alignment_mapper_cache=alignment_mapper_cache)
 
     def validate(self, var, strict=None):
         if strict is None:
@@ -63,10 +69,14 @@ class ExtrinsicValidator:
     Attempts to determine if the HGVS name validates against external data sources
     """
 
-    def __init__(self, hdp, strict=hgvs.global_config.validator.strict):
+    def __init__(
+        self, hdp, strict=hgvs.global_config.validator.strict, alignment_mapper_cache=None
+    ):
         self.strict = strict
         self.hdp = hdp
-        self.vm = hgvs.variantmapper.VariantMapper(self.hdp, prevalidation_level=None)
+        self.vm = hgvs.variantmapper.VariantMapper(
+            self.hdp, prevalidation_level=None, alignment_mapper_cache=alignment_mapper_cache
+        )
 
     def validate(self, var, strict=None):
         if not isinstance(var, hgvs.sequencevariant.SequenceVariant):
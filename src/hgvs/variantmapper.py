@@ -1,6 +1,5 @@
 """Projects variants between sequences using AlignmentMapper."""
 
-import copy
 import logging
 
 from bioutils.sequences import TranslationTable, reverse_complement
@@ -15,16 +14,17 @@ import hgvs.normalizer
 import hgvs.posedit
 import hgvs.sequencevariant
 import hgvs.validator
-from hgvs.decorators.lru_cache import lru_cache
 from hgvs.enums import PrevalidationLevel, ShiftOverBoundaryPreference
 from hgvs.exceptions import (
     HGVSInvalidIntervalError,
     HGVSInvalidVariantError,
     HGVSUnsupportedOperationError,
+    HGVSUsageError,
 )
 from hgvs.utils import altseq_to_hgvsp, altseqbuilder
 from hgvs.utils.position import get_start_end, get_start_end_interbase
 from hgvs.utils.reftranscriptdata import RefTranscriptData
+from hgvs.utils.structcopy import structcopy
 
 _logger = logging.getLogger(__name__)
 
@@ -69,6 +69,10 @@ class VariantMapper:
     All methods require and return objects of type
     :class:`hgvs.sequencevariant.SequenceVariant`.
 
+    A VariantMapper may be shared among threads (e.g., the workers of
+    a ThreadPoolExecutor), provided that its data provider may be.
+    Methods do not modify their arguments and return new variants.
+
     """
 
     def __init__(
@@ -79,13 +83,19 @@ class VariantMapper:
         add_gene_symbol=hgvs.global_config.mapping.add_gene_symbol,
         shift_over_boundary=hgvs.global_config.mapping.shift_over_boundary,
         shift_over_boundary_preference=hgvs.global_config.mapping.shift_over_boundary_preference,
+        alignment_mapper_cache=None,
     ):
         """
         :param bool replace_reference: replace reference (entails additional network access)
         :param str prevalidation_level: None or Intrinsic or Extrinsic validation before mapping
+        :param alignment_mapper_cache: AlignmentMapperCache to use; by default, a new cache is created
+        :type alignment_mapper_cache: hgvs.alignmentmapper.AlignmentMapperCache
 
         """
         self.hdp = hdp
+        if alignment_mapper_cache is None:
+            alignment_mapper_cache = hgvs.alignmentmapper.AlignmentMapperCache(hdp)
+        self.alignment_mapper_cache = alignment_mapper_cache
         self.replace_reference = replace_reference
         self.add_gene_symbol = add_gene_symbol
         if prevalidation_level is None:
@@ -97,7 +107,9 @@ class VariantMapper:
         elif self.prevalidation_level == PrevalidationLevel.INTRINSIC:
             self._validator = hgvs.validator.IntrinsicValidator(strict=False)
         else:
-            self._validator = hgvs.validator.Validator(self.hdp, strict=False)
+            self._validator = hgvs.validator.Validator(
+                self.hdp, strict=False, alignment_mapper_cache=self.alignment_mapper_cache
+            )
         self.left_normalizer = hgvs.normalizer.Normalizer(
             hdp, shuffle_direction=5, variantmapper=self
         )
@@ -118,7 +130,7 @@ class VariantMapper:
 
         if self._validator:
             self._validator.validate(var_g)
-        var_g.fill_ref(self.hdp)
+        var_g = self._fill_ref(var_g)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=tx_ac, alt_ac=var_g.ac, alt_aln_method=alt_aln_method
         )
@@ -137,7 +149,7 @@ class VariantMapper:
             raise HGVSInvalidVariantError("Expected a c. or n. variant; got " + str(var_t))
         if self._validator:
             self._validator.validate(var_t)
-        var_t.fill_ref(self.hdp, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
+        var_t = self._fill_ref(var_t, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
         if var_t.type == "c":
             var_out = VariantMapper.c_to_g(
                 self, var_c=var_t, alt_ac=alt_ac, alt_aln_method=alt_aln_method
@@ -179,7 +191,7 @@ class VariantMapper:
             _logger.info("Renormalizing out-of-bounds minus strand variant on genomic sequence")
             var_g = self.left_normalizer.normalize(var_g)
 
-        var_g.fill_ref(self.hdp)
+        var_g = self._fill_ref(var_g)
         pos_n = mapper.g_to_n(var_g.posedit.pos)
         if not pos_n.uncertain:
             edit_n = self._convert_edit_check_strand(mapper.strand, var_g.posedit.edit)
@@ -248,7 +260,7 @@ class VariantMapper:
             raise HGVSInvalidVariantError("Expected a n. variant; got " + str(var_n))
         if self._validator:
             self._validator.validate(var_n)
-        var_n.fill_ref(self.hdp, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
+        var_n = self._fill_ref(var_n, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=var_n.ac, alt_ac=alt_ac, alt_aln_method=alt_aln_method
         )
@@ -294,7 +306,7 @@ class VariantMapper:
         if self._validator:
             self._validator.validate(var_g)
 
-        var_g.fill_ref(self.hdp)
+        var_g = self._fill_ref(var_g)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=tx_ac, alt_ac=var_g.ac, alt_aln_method=alt_aln_method
         )
@@ -363,7 +375,7 @@ class VariantMapper:
             raise HGVSInvalidVariantError("Expected a cDNA (c.); got " + str(var_c))
         if self._validator:
             self._validator.validate(var_c)
-        var_c.fill_ref(self.hdp, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
+        var_c = self._fill_ref(var_c, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=var_c.ac, alt_ac=alt_ac, alt_aln_method=alt_aln_method
         )
@@ -377,7 +389,7 @@ class VariantMapper:
                 edit_g.ref = ""
         else:
             # variant at alignment gap
-            var_n = copy.deepcopy(var_c)
+            var_n = structcopy(var_c)
             var_n.posedit.pos = mapper.c_to_n(var_c.posedit.pos)
             var_n.type = "n"
             pos_n = mapper.g_to_n(pos_g)
@@ -414,13 +426,13 @@ class VariantMapper:
             raise HGVSInvalidVariantError("Expected a cDNA (c.); got " + str(var_c))
         if self._validator:
             self._validator.validate(var_c)
-        var_c.fill_ref(self.hdp, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
+        var_c = self._fill_ref(var_c, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=var_c.ac, alt_ac=var_c.ac, alt_aln_method="transcript"
         )
         pos_n = mapper.c_to_n(var_c.posedit.pos)
         if isinstance(var_c.posedit.edit, hgvs.edit.NARefAlt | hgvs.edit.Dup | hgvs.edit.Inv):
-            edit_n = copy.deepcopy(var_c.posedit.edit)
+            edit_n = structcopy(var_c.posedit.edit)
         else:
             msg = "Only NARefAlt/Dup/Inv types are currently implemented"
             raise HGVSUnsupportedOperationError(msg)
@@ -453,13 +465,13 @@ class VariantMapper:
             raise HGVSInvalidVariantError("Expected n. variant; got " + str(var_n))
         if self._validator:
             self._validator.validate(var_n)
-        var_n.fill_ref(self.hdp, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
+        var_n = self._fill_ref(var_n, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=var_n.ac, alt_ac=var_n.ac, alt_aln_method="transcript"
         )
         pos_c = mapper.n_to_c(var_n.posedit.pos)
         if isinstance(var_n.posedit.edit, hgvs.edit.NARefAlt | hgvs.edit.Dup | hgvs.edit.Inv):
-            edit_c = copy.deepcopy(var_n.posedit.edit)
+            edit_c = structcopy(var_n.posedit.edit)
         else:
             msg = "Only NARefAlt/Dup/Inv types are currently implemented"
             raise HGVSUnsupportedOperationError(msg)
@@ -492,14 +504,32 @@ class VariantMapper:
 
         """
 
+        self._check_c_to_p_input(var_c)
+        var_c = self._fill_ref(var_c, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
+        reference_data = RefTranscriptData(
+            self.hdp, var_c.ac, pro_ac, translation_table=translation_table
+        )
+        return self._c_to_p_with_reference_data(
+            var_c, reference_data, pro_ac=pro_ac, alt_ac=alt_ac, alt_aln_method=alt_aln_method
+        )
+
+    def _check_c_to_p_input(self, var_c):
+        """Checks var_c as input to c_to_p: raises HGVSInvalidVariantError
+        unless it is a c. variant, and validates it if validation is
+        enabled
+
+        """
         if not (var_c.type == "c"):
             raise HGVSInvalidVariantError("Expected a cDNA (c.) variant; got " + str(var_c))
         if self._validator:
             self._validator.validate(var_c)
-        var_c.fill_ref(self.hdp, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
-        reference_data = RefTranscriptData(
-            self.hdp, var_c.ac, pro_ac, translation_table=translation_table
-        )
+
+    def _c_to_p_with_reference_data(self, var_c, reference_data, pro_ac, alt_ac, alt_aln_method):
+        """Projects a validated, ref-filled c. variant to p. using
+        prebuilt RefTranscriptData, which may be shared among many
+        variants on the same transcript
+
+        """
         # Use the actual translation table from reference_data (may have been auto-detected)
         builder = altseqbuilder.AltSeqBuilder(
             var_c, reference_data, translation_table=reference_data.translation_table
@@ -551,9 +581,86 @@ class VariantMapper:
 
         return var_p
 
+    ############################################################################
+    # asyncio
+    #
+    # These methods require an asynchronous data provider (see
+    # hgvs.dataproviders.uta_async), which awaits the data that the
+    # corresponding synchronous methods require.
+
+    async def g_to_c_async(
+        self, var_g, tx_ac, alt_aln_method=hgvs.global_config.mapping.alt_aln_method
+    ):
+        """as g_to_c, awaiting data from an asynchronous data provider"""
+        return await self._call_async(self.g_to_c, var_g, tx_ac, alt_aln_method=alt_aln_method)
+
+    async def c_to_g_async(
+        self, var_c, alt_ac, alt_aln_method=hgvs.global_config.mapping.alt_aln_method
+    ):
+        """as c_to_g, awaiting data from an asynchronous data provider"""
+        return await self._call_async(self.c_to_g, var_c, alt_ac, alt_aln_method=alt_aln_method)
+
+    async def c_to_p_async(
+        self,
+        var_c,
+        pro_ac=None,
+        alt_ac=None,
+        alt_aln_method=hgvs.global_config.mapping.alt_aln_method,
+        translation_table=TranslationTable.standard,
+    ):
+        """as c_to_p, awaiting data from an asynchronous data provider"""
+        return await self._call_async(
+            self.c_to_p,
+            var_c,
+            pro_ac=pro_ac,
+            alt_ac=alt_ac,
+            alt_aln_method=alt_aln_method,
+            translation_table=translation_table,
+        )
+
+    async def _call_async(self, fn, *args, **kwargs):
+        call = getattr(self.hdp, "call", None)
+        if call is None:
+            msg = f"{type(self.hdp).__name__} is not an asynchronous data provider"
+            raise HGVSUsageError(msg)
+        return await call(fn, *args, **kwargs)
+
     ############################################################################
     # Internal methods
 
+    def _fill_ref(
+        self,
+        var,
+        alt_ac=None,
+        alt_aln_method=hgvs.global_config.mapping.alt_aln_method,
+        *,
+        in_place=False,
+    ):
+        """return var with its reference sequence filled in (see
+        SequenceVariant.fill_ref)
+
+        Unless in_place is True, var is not modified: if it must be
+        filled in, a filled-in copy is returned.  Mapping methods use
+        this rather than fill_ref so that callers may share variants
+        among threads.
+        """
+        edit = var.posedit.edit if isinstance(var.posedit, hgvs.posedit.PosEdit) else None
+        if not isinstance(edit, hgvs.edit.Edit):
+            return var
+        fill_ref = (
+            edit.type in ("del", "delins", "identity", "dup", "repeat") and edit.ref_s is None
+        )
+        fill_alt = edit.type == "identity" and isinstance(edit, hgvs.edit.NARefAlt)
+        if not (fill_ref or (fill_alt and edit.alt != edit.ref)):
+            return var
+        if not in_place:
+            var = structcopy(var)
+        if fill_ref:
+            self._replace_reference(var, alt_ac=alt_ac, alt_aln_method=alt_aln_method)
+        if fill_alt:
+            var.posedit.edit.alt = var.posedit.edit.ref
+        return var
+
     def _replace_reference(
         self, var, alt_ac=None, alt_aln_method=hgvs.global_config.mapping.alt_aln_method
     ):
@@ -635,15 +742,12 @@ class VariantMapper:
 
         return var
 
-    @lru_cache(maxsize=hgvs.global_config.lru_cache.maxsize)
     def _fetch_AlignmentMapper(self, tx_ac, alt_ac, alt_aln_method):
         """
-        Get a new AlignmentMapper for the given transcript accession (ac),
-        possibly caching the result.
+        Get an AlignmentMapper for the given transcript accession (ac)
+        from this instance's AlignmentMapperCache.
         """
-        return hgvs.alignmentmapper.AlignmentMapper(
-            self.hdp, tx_ac=tx_ac, alt_ac=alt_ac, alt_aln_method=alt_aln_method
-        )
+        return self.alignment_mapper_cache.get(tx_ac, alt_ac, alt_aln_method)
 
     @staticmethod
     def _convert_edit_check_strand(strand, edit_in):
@@ -652,7 +756,7 @@ class VariantMapper:
         """
         if isinstance(edit_in, hgvs.edit.NARefAlt):
             if strand == 1:
-                edit_out = copy.deepcopy(edit_in)
+                edit_out = structcopy(edit_in)
             else:
                 try:
                     # if smells like an int, do nothing
@@ -667,12 +771,12 @@ class VariantMapper:
                 )
         elif isinstance(edit_in, hgvs.edit.Dup):
             if strand == 1:
-                edit_out = copy.deepcopy(edit_in)
+                edit_out = structcopy(edit_in)
             else:
                 edit_out = hgvs.edit.Dup(ref=reverse_complement(edit_in.ref))
         elif isinstance(edit_in, hgvs.edit.Inv):
             if strand == 1:
-                edit_out = copy.deepcopy(edit_in)
+                edit_out = structcopy(edit_in)
             else:
                 try:
                     int(edit_in.ref)
@@ -763,7 +867,7 @@ class VariantMapper:
         ref_pos = mapper.cigarmapper.ref_pos
         cigar_op = mapper.cigarmapper.cigar_op
 
-        pos_g = copy.deepcopy(var_g.posedit.pos)
+        pos_g = structcopy(var_g.posedit.pos)
 
         # Check right side: interbase end = var_g.posedit.pos.end.base - gc_offset
         end_offset = var_g.posedit.pos.end.base - gc_offset
@@ -956,7 +1060,7 @@ class VariantMapper:
             tx_ref_str, tx_alt_str
         )
 
-        adjusted_pos = copy.deepcopy(tx_pos)
+        adjusted_pos = structcopy(tx_pos)
         adjusted_pos.start.base += n_prefix
         adjusted_pos.end.base -= n_suffix
 
@@ -1014,12 +1118,15 @@ class VariantMapper:
         """Attempt to shift a variant all the way left or right. Rewrite
         duplications as insertions so that the variant is shifted farther
         than would normally be possible using the HGVS notation."""
-        var_g = copy.deepcopy(var_g)
+        var_g = structcopy(var_g)
         normalizer = hgvs.normalizer.Normalizer(
             self.hdp,
             alt_aln_method=alt_aln_method,
             validate=False,
             shuffle_direction=shuffle_direction,
+            variantmapper=VariantMapper(
+                self.hdp, alignment_mapper_cache=self.alignment_mapper_cache
+            ),
         )
         var_g = normalizer.normalize(var_g)
         if var_g.posedit.edit.type == "dup":
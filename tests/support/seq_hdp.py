@@ -0,0 +1,16 @@
+class SeqHdp:
+    """data provider that serves get_seq for any accession from a single
+    sequence, and records the fetched (start_i, end_i) ranges"""
+
+    def __init__(self, seq):
+        self.seq = seq
+        self.fetches = []
+
+    def get_seq(self, ac, start_i=None, end_i=None):  # noqa: ARG002
+        self.fetches.append((start_i, end_i))
+        return self.seq[start_i:end_i]
+
+    @property
+    def fetched_lengths(self):
+        """lengths of the fetched sequences"""
+        return [len(self.seq[start_i:end_i]) for start_i, end_i in self.fetches]
@@ -7,7 +7,8 @@ import hgvs
 import hgvs.dataproviders.uta
 import hgvs.location
 import hgvs.parsers
-from hgvs.alignmentmapper import AlignmentMapper
+from hgvs.alignmentmapper import AlignmentMapper, AlignmentMapperCache
+from hgvs.enums import Datum
 from hgvs.exceptions import HGVSDataNotAvailableError, HGVSInvalidIntervalError
 from support import CACHE
 
@@ -46,6 +47,53 @@ class Test_AlignmentMapper(unittest.TestCase):
                 self.parser.parse_c_interval("99999")
             )
 
+    def test_alignmentmapper_cache(self):
+        amc = AlignmentMapperCache(self.hdp, maxsize=2)
+        am1 = amc.get("NM_178434.2", "NC_000001.10", "splign")
+        assert amc.get("NM_178434.2", "NC_000001.10", "splign") is am1
+        amc.get("NM_178449.3", "NC_000019.9", "splign")
+        amc.get("NM_000348.3", "NC_000002.11", "splign")
+        assert amc.cache_info() == (1, 3, 2, 2)
+
+        # least recently used mapper was evicted
+        assert amc.get("NM_178434.2", "NC_000001.10", "splign") is not am1
+        assert amc.cache_info() == (1, 4, 2, 2)
+
+        # failures are not cached
+        with self.assertRaises(HGVSDataNotAvailableError):
+            amc.get("bogus", "NC_000001.10", "splign")
+        assert amc.cache_info() == (1, 4, 2, 2)
+
+        amc.cache_clear()
+        assert amc.cache_info() == (0, 0, 2, 0)
+
+    def test_alignmentmapper_arrays(self):
+        np = pytest.importorskip("numpy")
+
+        for tx_ac, alt_ac in (("NM_001164277.1", "NC_000011.10"), ("NM_015120.4", "NC_000002.12")):
+            am = AlignmentMapper(self.hdp, tx_ac, alt_ac, "splign")
+            g_positions = np.arange(am.gc_offset + 1, am.gc_offset + am.cigarmapper.ref_len + 1, 7)
+            n_bases, n_offsets, _ = am.g_to_n_array(g_positions)
+            for g, n_base, n_offset in zip(g_positions, n_bases, n_offsets, strict=True):
+                pos_g = hgvs.location.SimplePosition(int(g))
+                pos_n = am.g_to_n(hgvs.location.Interval(start=pos_g, end=pos_g)).start
+                assert (pos_n.base, pos_n.offset) == (n_base, n_offset)
+
+            n_bases = np.arange(-5, am.tgt_len + 5)
+            n_bases = n_bases[n_bases != 0]
+            g_positions, _ = am.n_to_g_array(n_bases, n_bases % 3 - 1, strict_bounds=False)
+            for n_base, g in zip(n_bases, g_positions, strict=True):
+                pos_n = hgvs.location.BaseOffsetPosition(
+                    int(n_base), int(n_base % 3 - 1), datum=Datum.SEQ_START
+                )
+                pos_g = am.n_to_g(
+                    hgvs.location.BaseOffsetInterval(start=pos_n, end=pos_n), strict_bounds=False
+                ).start
+                assert pos_g.base == g
+
+        with self.assertRaises(HGVSInvalidIntervalError):
+            am.g_to_n_array([am.gc_offset - 10], strict_bounds=True)
+
     def x_test_alignmentmapper_AlignmentMapper_LCE3C_uncertain(self):
         # ? is not yet supported
         """Use NM_178434.2 tests to test mapping with uncertain positions"""
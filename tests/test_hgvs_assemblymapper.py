@@ -8,7 +8,7 @@ import hgvs.dataproviders.uta
 import hgvs.parsers
 import hgvs.variantmapper
 from hgvs.enums import PrevalidationLevel
-from hgvs.exceptions import HGVSInvalidVariantError
+from hgvs.exceptions import HGVSError, HGVSInvalidVariantError
 from support import CACHE
 
 
@@ -202,6 +202,52 @@ class Test_VariantMapper(unittest.TestCase):
 
         assert str(var_c) == hgvs_c
 
+    def test_many(self):
+        hgvs_gs = [
+            ("NC_000007.13:g.36561662C>T", "NM_001637.3"),
+            ("NC_000002.11:g.73675227_73675228insCTC", "NM_015120.4"),
+            ("NC_000007.13:g.36561662C>T", "NM_000000.0"),
+        ]
+        var_cs = self.am37.g_to_c_many(
+            (self.hp.parse_hgvs_variant(g), tx_ac) for g, tx_ac in hgvs_gs
+        )
+        assert str(var_cs[0]) == "NM_001637.3:c.1582G>A"
+        assert str(var_cs[1]) == "NM_015120.4:c.1574_1576="
+        assert isinstance(var_cs[2], HGVSError)
+
+        hgvs_cs = [
+            "NM_080877.2:c.1733_1735delinsTTT",
+            "NM_000059.3:c.7790delAAG",
+            "NM_080877.2:c.1735A>T",
+            "NM_001637.3:c.1582G>A",
+            "NR_027676.1:n.3980del",
+        ]
+        var_ps = self.am.c_to_p_many(self.hp.parse_hgvs_variant(c) for c in hgvs_cs)
+        assert str(var_ps[0]) == "NP_543153.1:p.(Pro578_Lys579delinsLeuTer)"
+        assert isinstance(var_ps[1], HGVSInvalidVariantError)
+        assert str(var_ps[2]) == "NP_543153.1:p.(Lys579Ter)"
+        assert str(var_ps[3]) == "NP_001628.1:p.(Gly528Arg)"
+        assert isinstance(var_ps[4], HGVSInvalidVariantError)
+        assert "Expected a cDNA (c.) variant" in str(var_ps[4])
+
+        hgvs_cs = ["NM_000116.4:c.-120_-119insT", "NM_000348.3:c.88del"]
+        var_gs = self.am37.c_to_g_many(self.hp.parse_hgvs_variant(c) for c in hgvs_cs)
+        assert [str(v) for v in var_gs] == [
+            "NC_000023.10:g.153640061=",
+            "NC_000002.11:g.31805882_31805883=",
+        ]
+
+    def test_alignment_mapper_cache_is_shared(self):
+        amc = self.am37.alignment_mapper_cache
+        assert self.am37._norm.vm.alignment_mapper_cache is amc
+        assert self.am37._validator._evr.vm.alignment_mapper_cache is amc
+        assert self.am37.left_normalizer.vm is self.am37
+
+        hits = amc.cache_info().hits
+        var_c = self.hp.parse_hgvs_variant("NM_001637.3:c.1582G>A")
+        self.am37.c_to_g(var_c)
+        assert amc.cache_info().hits > hits
+
     def test_c_to_p_with_stop_gain(self):
         # issue-474
         hgvs_c = "NM_080877.2:c.1733_1735delinsTTT"
@@ -0,0 +1,103 @@
+import pytest
+
+import hgvs.batch
+from hgvs.exceptions import HGVSUsageError
+from support import CACHE
+
+CONNECT_KWARGS = {"mode": "run", "cache": CACHE}
+
+HGVS_C_TO_P = [
+    ("NM_000059.3:c.7791A>G", "NP_000050.2:p.(Lys2597=)", None),
+    ("NM_000059.3:c.7790delAAG", None, "HGVSInvalidVariantError"),
+    ("NM_000302.3:c.1594_1596del", "NP_000293.2:p.(Glu532del)", None),
+    ("NM_000302.3:c.bogus", None, "HGVSParseError"),
+    ("NM_000090.3:c.2490_2516del", "NP_000081.1:p.(Glu832_Gly840del)", None),
+    ("NM_001637.3:c.1582_1583inv", "NP_001628.1:p.(Gly528Pro)", None),
+    ("NM_025137.3:c.-20_*20inv", "NP_079413.3:p.?", None),
+]
+
+
+@pytest.mark.parametrize("processes", [0, 2])
+def test_run(processes):
+    results = hgvs.batch.run(
+        (record for record, _, _ in HGVS_C_TO_P),
+        "to_p",
+        connect_kwargs=CONNECT_KWARGS,
+        processes=processes,
+        chunk_size=2,
+        max_pending=1,
+    )
+    for result, (record, value, error) in zip(results, HGVS_C_TO_P, strict=True):
+        assert result.record == record
+        assert result.value == value
+        assert (result.error or "").partition(":")[0] == (error or "")
+
+
+def test_run_vcf_to_g():
+    results = hgvs.batch.run(
+        ["6\t49949407\t.\tA\tT,A", "6\t49949409\t.\tGA\tG", "6\t49949407"],
+        "vcf_to_g",
+        connect_kwargs=CONNECT_KWARGS,
+        processes=0,
+    )
+    assert [(r.value, r.error) for r in results] == [
+        (["NC_000006.12:g.49949407A>T", "NC_000006.12:g.49949407="], None),
+        (["NC_000006.12:g.49949414del"], None),
+        (None, "ValueError: Expected at least 5 tab-separated VCF fields: '6\\t49949407'"),
+    ]
+
+
+def test_run_invalid_arguments():
+    with pytest.raises(ValueError, match="Unknown operation"):
+        hgvs.batch.run([], "to_x")
+    with pytest.raises(ValueError, match="chunk_size"):
+        hgvs.batch.run([], "to_p", chunk_size=0)
+
+
+def test_run_usage_error():
+    with pytest.raises(HGVSUsageError, match="requires a cache file"):
+        list(
+            hgvs.batch.run(
+                ["NM_000059.3:c.7791A>G"], "to_p", connect_kwargs={"mode": "run"}, processes=1
+            )
+        )
+
+
+def test_main(tmp_path, capsys):
+    input_path = tmp_path / "variants.txt"
+    input_path.write_text("# comment\nNM_000059.3:c.7791A>G\n\nNM_000302.3:c.bogus\n")
+    hgvs.batch.main([
+        "to_p",
+        str(input_path),
+        "--processes=0",
+        "--cache-mode=run",
+        f"--cache={CACHE}",
+    ])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "NM_000059.3:c.7791A>G\tNP_000050.2:p.(Lys2597=)\t"
+    assert lines[1].startswith("NM_000302.3:c.bogus\t\tHGVSParseError: ")
+    assert len(lines) == 2
+
+
+def test_main_cache_mode_requires_cache(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        hgvs.batch.main(["to_p", "--cache-mode=run"])
+    assert excinfo.value.code == 2
+    assert "--cache-mode=run requires --cache" in capsys.readouterr().err
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
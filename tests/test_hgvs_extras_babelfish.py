@@ -1,5 +1,9 @@
 import pytest
 
+import hgvs.dataproviders.uta
+from hgvs.extras.babelfish import Babelfish
+from support import CACHE
+
 NORM_HGVS_VCF = [
     # Columns are: (normed-HGVS, non-normalized HGVS, VCF coordinates, non-norm VCF)
     # no-op
@@ -100,3 +104,56 @@ def test_vcf_to_hgvs(babelfish38):
 def test_vcf_to_hgvs_contig_chrom(babelfish38):
     hgvs_g = babelfish38.vcf_to_g_hgvs("NC_000006.12", 49949409, "GAA", "G")
     assert hgvs_g.format() == "NC_000006.12:g.49949413_49949414del"
+
+
+@pytest.fixture
+def babelfish_fetches(monkeypatch):
+    """return a Babelfish that fetches NC_000006.12:49949386-49949435
+    from sequences in the test cache, and the list of fetched ranges"""
+    hdp = hgvs.dataproviders.uta.connect(mode="run", cache=CACHE)
+    start = 49949386
+    seq = (
+        hdp.get_seq("NC_000006.12", start, 49949407)
+        + hdp.get_seq("NC_000006.12", 49949406, 49949427)[1:]
+        + hdp.get_seq("NC_000006.12", 49949413, 49949435)[14:]
+    )
+    fetches = []
+
+    def fetcher(ac, start_i, end_i):
+        assert ac == "NC_000006.12"
+        fetches.append((start_i, end_i))
+        return "".join(
+            seq[i - start] if start <= i < start + len(seq) else "N" for i in range(start_i, end_i)
+        )
+
+    monkeypatch.setattr(hdp.seqfetcher, "fetcher", fetcher)
+    # fetch all sequences with the seqfetcher, as without a persistent cache
+    monkeypatch.setattr(hdp, "get_seq", hdp.seqfetcher.fetch_seq)
+    monkeypatch.setattr(hdp, "mode", None)
+    return Babelfish(hdp, assembly_name="GRCh38"), fetches
+
+
+def test_hgvs_to_vcf_records(parser, babelfish_fetches):
+    babelfish, fetches = babelfish_fetches
+    variants = [
+        parser.parse(hgvs_string)
+        for norm_hgvs_string, alt_hgvs, _, _ in NORM_HGVS_VCF
+        for hgvs_string in [norm_hgvs_string, *alt_hgvs]
+    ]
+    expected = [
+        expected_variant_coordinate
+        for _, alt_hgvs, expected_variant_coordinate, _ in NORM_HGVS_VCF
+        for _ in range(1 + len(alt_hgvs))
+    ]
+    assert list(babelfish.hgvs_to_vcf_records(variants, window_size=10_000)) == expected
+    assert fetches == [(49949306, 49959306)]
+
+
+def test_vcf_records_to_hgvs(babelfish_fetches):
+    babelfish, fetches = babelfish_fetches
+    records = [("6", 49949407, "A", "T,A"), ("6", 49949409, "GA", ["G", "GAA"])]
+    assert [[v.format() for v in vs] for vs in babelfish.vcf_records_to_hgvs(records)] == [
+        ["NC_000006.12:g.49949407A>T", "NC_000006.12:g.49949407="],
+        ["NC_000006.12:g.49949414del", "NC_000006.12:g.49949414dup"],
+    ]
+    assert fetches == [(49948406, 50048406)]
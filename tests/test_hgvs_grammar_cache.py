@@ -0,0 +1,68 @@
+import pytest
+
+import hgvs.parsers
+from hgvs.parsers import grammar_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("HGVS_GRAMMAR_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _parse(v):
+    parser = hgvs.parsers.Parser(grammar_fn=hgvs.parsers.OMETA_GRAMMAR, fast_path=False)
+    return str(parser.parse(v))
+
+
+@pytest.mark.quick
+def test_grammar_cache(cache_dir):
+    v = "NM_01234.5:c.(22+1_23)A>T"
+    assert _parse(v) == v
+    (path,) = cache_dir.iterdir()
+    mtime = path.stat().st_mtime_ns
+
+    # subsequent loads use the cache entry
+    assert _parse(v) == v
+    assert path.stat().st_mtime_ns == mtime
+    assert grammar_cache.build() == [path]
+
+    # unreadable entries are replaced
+    path.write_bytes(b"bogus")
+    assert _parse(v) == v
+    assert list(cache_dir.iterdir()) == [path]
+    assert path.read_bytes() != b"bogus"
+
+
+@pytest.mark.quick
+def test_grammar_cache_disabled(cache_dir, monkeypatch):
+    monkeypatch.setenv("HGVS_GRAMMAR_CACHE_DIR", "")
+    assert grammar_cache.cache_dir() is None
+    assert _parse("NM_01234.5:c.22+1A>T") == "NM_01234.5:c.22+1A>T"
+    assert list(cache_dir.iterdir()) == []
+    with pytest.raises(ValueError, match="disabled"):
+        grammar_cache.build()
+
+
+@pytest.mark.quick
+def test_grammar_cache_main(cache_dir, capsys):
+    grammar_cache.main([])
+    (path,) = cache_dir.iterdir()
+    assert capsys.readouterr().out == f"{path}\n"
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
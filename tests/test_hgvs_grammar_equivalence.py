@@ -16,6 +16,7 @@ import pyparsing as pp
 
 import hgvs.parsers
 from hgvs.exceptions import HGVSParseError
+from hgvs.parsers.pyparsing_grammar import HGVSGrammar
 
 BACKENDS = (hgvs.parsers.OMETA_GRAMMAR, hgvs.parsers.PYPARSING_GRAMMAR)
 
@@ -38,8 +39,11 @@ def _parse_or_error(parser, variant):
 class TestBackendEquivalence(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.ometa = hgvs.parsers.Parser(grammar_fn=hgvs.parsers.OMETA_GRAMMAR)
-        cls.pyparsing = hgvs.parsers.Parser(grammar_fn=hgvs.parsers.PYPARSING_GRAMMAR)
+        # compare the grammars themselves, not the shared regex fast path
+        cls.ometa = hgvs.parsers.Parser(grammar_fn=hgvs.parsers.OMETA_GRAMMAR, fast_path=False)
+        cls.pyparsing = hgvs.parsers.Parser(
+            grammar_fn=hgvs.parsers.PYPARSING_GRAMMAR, fast_path=False
+        )
 
     def test_backends_agree_on_gauntlet(self):
         """both backends must return identical results for every gauntlet variant"""
@@ -81,6 +85,30 @@ class TestNoGlobalPyparsingState(unittest.TestCase):
         expr = pp.Word(pp.alphas) + pp.Word(pp.nums)
         self.assertEqual(expr.parse_string("abc 123").as_list(), ["abc", "123"])
 
+    def test_packrat_is_grammar_scoped(self):
+        """rule memoization must not enable pyparsing's process-global packrat"""
+
+        grammar = HGVSGrammar()
+        self.assertGreater(grammar.packrat_cache_size, 0)
+        self.assertFalse(pp.ParserElement._packratEnabled)
+        self.assertIn("_parse", vars(grammar.c_pos))
+        expr = pp.Word(pp.alphas)
+        self.assertNotIn("_parse", vars(expr))
+
+    def test_packrat_results_match(self):
+        memoized, plain = HGVSGrammar(), HGVSGrammar(packrat_cache_size=0)
+
+        def parse(grammar, variant):
+            try:
+                v = grammar.parse("hgvs_variant", variant)
+            except pp.ParseBaseException as e:
+                return (e.loc, e.msg)
+            return (v, v.posedit.pos if v.posedit else None)
+
+        for variant in [*_read_gauntlet(), "NM_01234.5:c.(22+1_23)A>T", "NM_01234.5:c.22+1A>"]:
+            with self.subTest(variant=variant):
+                self.assertEqual(parse(memoized, variant), parse(plain, variant))
+
     def test_grammar_is_strict_regardless_of_ambient_whitespace(self):
         """a hostile global whitespace default must not loosen the grammar"""
 
@@ -1,3 +1,5 @@
+import concurrent.futures
+import copy
 import os
 import unittest
 
@@ -13,6 +15,7 @@ from hgvs.exceptions import (
     HGVSUnsupportedOperationError,
 )
 from support import CACHE
+from support.seq_hdp import SeqHdp
 
 hdp = hgvs.dataproviders.uta.connect(mode=os.environ.get("HGVS_CACHE_MODE", "run"), cache=CACHE)
 
@@ -443,6 +446,127 @@ class Test_HGVSNormalizer(unittest.TestCase):
             "NM_212556.2:c.1401dup",
         )
 
+    def test_threads(self):
+        """normalize variants from many threads that share a Normalizer
+        and input variants, and compare with single-threaded results"""
+        variants = [
+            self.hp.parse(v)
+            for v in (
+                "NC_000001.10:g.1647893delinsCTTTCTT",
+                "NC_000006.11:g.49917098delC",
+                "NC_000006.11:g.49917122_49917123dupGA",
+                "NC_000006.11:g.49917122_49917123insA",
+                "NC_000006.11:g.49917151_49917156delinsTCTAAA",
+                "NC_000009.11:g.36233991_36233992delCAinsTG",
+                "NM_000051.3:c.-4_-3insAC",
+                "NM_000051.3:c.14_15insT",
+                "NM_000088.3:c.589_600inv",
+                "NM_001001656.1:c.935_945del",
+                "NM_001166478.1:c.2_7delinsTTTAGA",
+                "NM_001166478.1:c.36_37insTCTCTC",
+                "NM_001166478.1:c.59delG",
+                "NM_212556.2:c.1400_1401insAC",
+                "NM_212556.2:c.1delinsAA",
+            )
+        ]
+        orig_variants = copy.deepcopy(variants)
+        norm = hgvs.normalizer.Normalizer(hdp, shuffle_direction=3, cross_boundaries=True)
+        expected = [norm.normalize(v) for v in variants]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            self.assertEqual(expected * 20, list(executor.map(norm.normalize, variants * 20)))
+        self.assertEqual(orig_variants, variants)
+
+    def test_incremental_shuffle(self):
+        """shuffle across long repeats with incremental fetches, and
+        compare with the default sliding window"""
+        seq = "ACGTTGCA" * 50 + "CA" * 500 + "ACGTTGCA" * 50 + "T" * 300
+        variants = [
+            self.hp.parse(v)
+            for v in (
+                "NC_000001.11:g.700_701insCA",
+                "NC_000001.11:g.701_702del",
+                "NC_000001.11:g.1401_1402insCACA",
+                "NC_000001.11:g.1600T>C",
+                "NC_000001.11:g.1650del",
+                "NC_000001.11:g.1799_1800insT",
+                "NC_000001.11:g.1800dup",
+            )
+        ]
+        for shuffle_direction in (3, 5):
+            hdp, incr_hdp = SeqHdp(seq), SeqHdp(seq)
+            norm = hgvs.normalizer.Normalizer(hdp, shuffle_direction=shuffle_direction)
+            incr_norm = hgvs.normalizer.Normalizer(
+                incr_hdp, shuffle_direction=shuffle_direction, incremental_shuffle=True
+            )
+            for var in variants:
+                self.assertEqual(norm.normalize(var), incr_norm.normalize(var))
+
+            # shuffling the first variant across the 1 kb CA repeat
+            hdp.fetches.clear()
+            incr_hdp.fetches.clear()
+            norm.normalize(variants[0])
+            incr_norm.normalize(variants[0])
+            self.assertLessEqual(len(incr_hdp.fetches), 8)
+            self.assertLess(len(incr_hdp.fetches), len(hdp.fetches) / 2)
+
+
+def test_normalize_many(monkeypatch):
+    seq = "ACGTTGCA" * 5000 + "CA" * 500 + "ACGTTGCA" * 5000
+    run_hdp = hgvs.dataproviders.uta.connect(mode="run", cache=CACHE)
+    fetches = []
+
+    def fetcher(ac, start_i, end_i):
+        fetches.append((ac, start_i, end_i))
+        return seq[start_i:end_i]
+
+    monkeypatch.setattr(run_hdp.seqfetcher, "fetcher", fetcher)
+    # fetch all sequences with the seqfetcher, as without a persistent cache
+    monkeypatch.setattr(run_hdp, "get_seq", run_hdp.seqfetcher.fetch_seq)
+    monkeypatch.setattr(run_hdp, "mode", None)
+
+    hp = hgvs.parsers.Parser()
+    variants = [
+        hp.parse(v)
+        for v in (
+            "NC_000002.12:g.1000del",
+            "NC_000001.11:g.40500_40501insCA",
+            "NC_000001.11:g.100A>T",
+            "NC_000002.12:g.75000dup",
+            "NC_000001.11:g.79000_79001insG",
+            "NC_000001.11:g.40002_40003del",
+        )
+    ]
+    expected = [hgvs.normalizer.Normalizer(SeqHdp(seq)).normalize(var) for var in variants]
+    norm = hgvs.normalizer.Normalizer(run_hdp)
+    assert norm.normalize_many(variants, window_size=50_000) == expected
+    # one fetch per window, in order of accession and position
+    assert fetches == [
+        ("NC_000001.11", 0, 50_000),
+        ("NC_000001.11", 78_499, 128_499),
+        ("NC_000002.12", 499, 50_499),
+        ("NC_000002.12", 74_499, 124_499),
+    ]
+
+
+def test_normalize_many_run_mode(monkeypatch):
+    """in "run" mode, sequence comes from the persistent cache, so no
+    windows are prefetched"""
+    run_hdp = hgvs.dataproviders.uta.connect(mode="run", cache=CACHE)
+    fetches = []
+
+    def fetcher(ac, start_i, end_i):
+        fetches.append((ac, start_i, end_i))
+        raise AssertionError
+
+    monkeypatch.setattr(run_hdp.seqfetcher, "fetcher", fetcher)
+    hp = hgvs.parsers.Parser()
+    variants = [
+        hp.parse(v) for v in ("NC_000006.11:g.49917122_49917123insA", "NC_000006.11:g.49917098delC")
+    ]
+    norm = hgvs.normalizer.Normalizer(run_hdp)
+    assert norm.normalize_many(variants) == [norm.normalize(var) for var in variants]
+    assert fetches == []
+
 
 if __name__ == "__main__":
     unittest.main()
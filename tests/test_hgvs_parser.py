@@ -60,6 +60,66 @@ def test_parser_variants_with_no_transcript_gene_names(parser):
         parser.parse("BOGUS/EXCELLENT:c.22+1A>T")  # contains invalid character
 
 
+def test_parser_parse_many():
+    parser = hgvs.parsers.Parser()
+    vs = ["NM_01234.5:c.22+1A>T", "NM_01234.5:c.22+1A>", "NP_012345.6:p.Ala22Trp"]
+    results = parser.parse_many(vs)
+    assert [str(r) for r in results[::2]] == vs[::2]
+    assert isinstance(results[1], HGVSParseError)
+    with pytest.raises(HGVSParseError):
+        parser.parse_many(vs, on_error="raise")
+    with pytest.raises(ValueError, match="on_error"):
+        parser.parse_many(vs, on_error="ignore")
+
+
+def test_parser_parse_cache():
+    parser = hgvs.parsers.Parser(cache_size=2)
+    v = "NM_01234.5:c.22+1A>T"
+    var1 = parser.parse(v)
+    var1.posedit.edit.ref = "G"  # callers may modify results
+    var2 = parser.parse(v)
+    assert var2 is not var1
+    assert str(var2) == v
+    parser.parse("NM_01234.5:c.23A>T")
+    parser.parse("NM_01234.5:c.24A>T")
+    assert list(parser._parse_cache) == ["NM_01234.5:c.23A>T", "NM_01234.5:c.24A>T"]
+
+
+@pytest.mark.parametrize("grammar_fn", [hgvs.parsers.OMETA_GRAMMAR, hgvs.parsers.PYPARSING_GRAMMAR])
+def test_parser_variant_type_dispatch(grammar_fn):
+    parser = hgvs.parsers.Parser(grammar_fn=grammar_fn, fast_path=False)
+    for v in (
+        "NM_01234.5:c.(22+1_23)A>T",
+        "NM_01234.5(BRCA2):c.22+1A>T",
+        "NC_000007.13:g.36561662_36561663inv",
+        "NP_012345.6:p.Arg12fs",
+        "NP_012345.6:p.?",
+        "NM_01234.5:r.(22_23)del",
+    ):
+        var = parser.parse_hgvs_variant(v)
+        assert var == parser._grammar(v).hgvs_variant()
+
+    # on failure, the error is that of the full hgvs_variant rule
+    for v in ("NM_01234.5:c.22+1A>", "NM_01234.5:x.22A>T", "NM_01234.5:c22A>T"):
+        with pytest.raises(HGVSParseError) as excinfo:
+            parser.parse_hgvs_variant(v)
+        with pytest.raises(parser._parse_error_cls) as grammar_excinfo:
+            parser._grammar(v).hgvs_variant()
+        assert str(excinfo.value) == str(parser._translate_parse_error(v, grammar_excinfo.value))
+
+
+@pytest.mark.parametrize("grammar_fn", [hgvs.parsers.OMETA_GRAMMAR, hgvs.parsers.PYPARSING_GRAMMAR])
+def test_parser_lazy_grammar(grammar_fn):
+    parser = hgvs.parsers.Parser(grammar_fn=grammar_fn)
+    assert str(parser.parse("NM_01234.5:c.22+1A>T")) == "NM_01234.5:c.22+1A>T"
+    assert parser._lazy_grammar is None  # fast path does not need the grammar
+    assert str(parser.parse_c_interval("22+1_23")) == "22+1_23"
+    assert parser._lazy_grammar is not None
+    assert "parse_c_interval" in dir(hgvs.parsers.Parser(grammar_fn=grammar_fn))
+    with pytest.raises(AttributeError):
+        parser.parse_bogus_rule  # noqa: B018
+
+
 class Test_Parser(unittest.TestCase):
     longMessage = True
 
@@ -0,0 +1,133 @@
+import gzip
+import unittest
+from pathlib import Path
+
+import pytest
+
+import hgvs.parsers
+from hgvs.exceptions import HGVSParseError
+from hgvs.parsers.fastpath import parse_hgvs_variant
+
+_DATA_DIR = Path(__file__).parent / "data"
+
+
+def _read_gauntlet():
+    with (_DATA_DIR / "gauntlet").open() as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def _read_clinvar():
+    variants = []
+    with gzip.open(_DATA_DIR / "clinvar.gz", "rt") as f:
+        for line in f:
+            if line.startswith("#"):
+                continue
+            variants.extend(line.rstrip("\n").split("\t")[-1].split())
+    return variants
+
+
+@pytest.mark.quick
+class Test_FastPath(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parsers = [
+            hgvs.parsers.Parser(grammar_fn=backend, fast_path=False)
+            for backend in (hgvs.parsers.OMETA_GRAMMAR, hgvs.parsers.PYPARSING_GRAMMAR)
+        ]
+
+    def _assert_same_as_grammar(self, variants):
+        n_fast = 0
+        for s in variants:
+            var = parse_hgvs_variant(s)
+            if var is None:
+                continue
+            n_fast += 1
+            for parser in self.parsers:
+                expected = parser.parse_hgvs_variant(s)
+                with self.subTest(variant=s, parser=type(parser).__name__):
+                    self.assertEqual(var, expected)
+                    self.assertIs(type(var.posedit.pos), type(expected.posedit.pos))
+                    self.assertIs(type(var.posedit.edit), type(expected.posedit.edit))
+        return n_fast
+
+    def test_gauntlet(self):
+        self.assertGreater(self._assert_same_as_grammar(_read_gauntlet()), 0)
+
+    def test_clinvar(self):
+        variants = _read_clinvar()[:2000]
+        n_fast = self._assert_same_as_grammar(variants)
+        self.assertGreater(n_fast, 0.9 * len(variants))
+
+    def test_forms(self):
+        variants = [
+            "NM_01234.5:c.123A>G",
+            "NM_01234.5:c.123+4del",
+            "NM_01234.5:c.-12-4delA",
+            "NM_01234.5:c.*12_*14dup",
+            "NM_01234.5:c.123_124insTT",
+            "NM_01234.5:c.123_125del3insTT",
+            "NM_01234.5:c.123=",
+            "NM_01234.5(BRCA2):c.123G=",
+            "NC_000007.13:g.123_456delinsACG",
+            "NC_012920.1:m.3243A>G",
+            "NR_01234.5:n.22+1A>T",
+            "NM_01234.5:r.22_23delinsacu",
+            "NP_012345.6:p.Arg12Trp",
+            "NP_012345.6:p.(Arg12Trp)",
+            "NP_012345.6:p.R12*",
+            "NP_012345.6:p.Arg12_Gly14del",
+            "NP_012345.6:p.Arg12_Gly13insTrpTer",
+            "NP_012345.6:p.Arg12delinsTrp",
+            "NP_012345.6:p.(Arg12dup)",
+        ]
+        for s in variants:
+            self.assertIsNotNone(parse_hgvs_variant(s), s)
+        self.assertEqual(self._assert_same_as_grammar(variants), len(variants))
+
+    def test_unhandled_forms(self):
+        """forms left to the grammar"""
+        for s in (
+            "NM_01234.5:c.(123_125)del",
+            "NM_01234.5:c.123_125inv",
+            "NP_012345.6:p.Arg12fs",
+            "NP_012345.6:p.?",
+            "NM_01234.5:c.22+1A>T ",
+            " NM_01234.5:c.22+1A>T",
+            "NM_01234.5:c.22+1A>",
+        ):
+            self.assertIsNone(parse_hgvs_variant(s), s)
+
+    def test_reject(self):
+        with (_DATA_DIR / "reject").open() as f:
+            for line in f:
+                var, _ = line.strip().split("\t")
+                if var.startswith("#") or var == "":
+                    continue
+                self.assertIsNone(parse_hgvs_variant(var), var)
+
+    def test_parser_fast_path(self):
+        parser = hgvs.parsers.Parser()
+        self.assertTrue(parser.fast_path)
+        self.assertEqual(
+            str(parser.parse_hgvs_variant("NM_01234.5:c.(123_125)del")),
+            "NM_01234.5:c.(123_125)del",
+        )
+        with self.assertRaises(HGVSParseError):
+            parser.parse_hgvs_variant("NM_01234.5:c.22+1A>")
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
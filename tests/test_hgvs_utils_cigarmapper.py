@@ -93,3 +93,39 @@ def test_cigarmapper_strict_bounds():
     assert (cm.tgt_len - 1, 0, "=") == cm.map_ref_to_tgt(
         cm.ref_len - 1, "start", strict_bounds=False
     )
+
+
+def test_cigarmapper_segment_lookup():
+    """segment lookup agrees with a linear scan, including zero-length segments"""
+
+    def linear_segment(from_pos, pos):
+        for pos_i in range(len(from_pos) - 1):
+            if pos < from_pos[pos_i + 1]:
+                break
+        return pos_i
+
+    for c in [cigar, "2D3=2I=", "3=2D2D=N2=", "=I2N3=D"]:
+        m = CIGARMapper(c)
+        for from_pos, map_fn in ((m.ref_pos, m.map_ref_to_tgt), (m.tgt_pos, m.map_tgt_to_ref)):
+            for pos in range(-2, from_pos[-1] + 3):
+                _, _, op = map_fn(pos, "start", strict_bounds=False)
+                assert op == m.cigar_op[linear_segment(from_pos, pos)]
+
+
+def test_cigarmapper_arrays():
+    np = pytest.importorskip("numpy")
+
+    positions = np.arange(-2, cm.ref_len + 3)
+    for end in ("start", "end"):
+        mapped, offsets, ops = cm.map_ref_to_tgt_array(positions, end, strict_bounds=False)
+        expected = [cm.map_ref_to_tgt(int(p), end, strict_bounds=False) for p in positions]
+        assert list(zip(mapped.tolist(), offsets.tolist(), ops.tolist(), strict=True)) == expected
+
+    positions = np.arange(-2, cm.tgt_len + 3)
+    for end in ("start", "end"):
+        mapped, offsets, ops = cm.map_tgt_to_ref_array(positions, end, strict_bounds=False)
+        expected = [cm.map_tgt_to_ref(int(p), end, strict_bounds=False) for p in positions]
+        assert list(zip(mapped.tolist(), offsets.tolist(), ops.tolist(), strict=True)) == expected
+
+    with pytest.raises(HGVSInvalidIntervalError):
+        cm.map_ref_to_tgt_array([0, cm.ref_len + 1], "start", strict_bounds=True)
@@ -0,0 +1,77 @@
+import pytest
+
+from hgvs.dataproviders.seqfetcher import SeqFetcher
+from hgvs.utils.seqspancache import SeqSpanCache
+
+SEQ = "ACGTTGCAACGGTTAACCGGTTTTAAAACCCCGGGG"
+
+
+def test_seqspancache_get():
+    cache = SeqSpanCache(maxbytes=1000)
+    cache.add("NM_0", 5, SEQ[5:15])
+    assert cache.get("NM_0", 5, 15) == SEQ[5:15]
+    assert cache.get("NM_0", 7, 8) == SEQ[7:8]
+    assert cache.get("NM_0", 4, 8) is None
+    assert cache.get("NM_0", 10, 16) is None
+    assert cache.get("NM_0") is None
+    assert cache.get("NM_1", 5, 15) is None
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+@pytest.mark.parametrize(
+    "spans",
+    [
+        [(0, 10), (10, 20)],  # adjacent
+        [(10, 20), (0, 10)],
+        [(0, 12), (8, 20)],  # overlapping
+        [(5, 8), (0, 20)],  # contained
+        [(0, 20), (5, 8)],
+        [(0, 4), (16, 20), (8, 12), (2, 18)],  # bridging
+    ],
+)
+def test_seqspancache_merge(spans):
+    cache = SeqSpanCache(maxbytes=1000)
+    for start_i, end_i in spans:
+        cache.add("NM_0", start_i, SEQ[start_i:end_i])
+    assert cache.get("NM_0", 0, 20) == SEQ[0:20]
+    assert cache.nbytes == 20
+
+
+def test_seqspancache_complete():
+    cache = SeqSpanCache(maxbytes=1000)
+    cache.add("NM_0", 30, SEQ[30:], complete=True)
+    assert cache.get("NM_0", 32) == SEQ[32:]
+    assert cache.get("NM_0") is None
+    cache.add("NM_0", 0, SEQ[0:30])
+    assert cache.get("NM_0") == SEQ
+
+
+def test_seqspancache_evicts_by_bytes():
+    cache = SeqSpanCache(maxbytes=25)
+    cache.add("NM_0", 0, SEQ[0:10])
+    cache.add("NM_1", 0, SEQ[0:10])
+    assert cache.get("NM_0", 0, 5) is not None  # NM_1 is now least recently used
+    cache.add("NM_2", 0, SEQ[0:10])
+    assert cache.nbytes == 20
+    assert cache.get("NM_1", 0, 5) is None
+    assert cache.get("NM_0", 0, 5) is not None
+    cache.add("NM_3", 0, SEQ[0:30])  # larger than maxbytes; not cached
+    assert cache.get("NM_3", 0, 5) is None
+    assert cache.nbytes == 20
+
+
+def test_seqfetcher_seq_cache(monkeypatch):
+    calls = []
+
+    def fetcher(ac, start_i=None, end_i=None):
+        calls.append((ac, start_i, end_i))
+        return SEQ[start_i:end_i]
+
+    sf = SeqFetcher()
+    monkeypatch.setattr(sf, "fetcher", fetcher)
+    assert sf.fetch_seq("NM_0", 10, 20) == SEQ[10:20]
+    assert sf.fetch_seq("NM_0", 12, 13) == SEQ[12:13]
+    assert sf.fetch_seq("NM_0", 20, 100) == SEQ[20:]  # past end, so complete
+    assert sf.fetch_seq("NM_0", 15, 100) == SEQ[15:]
+    assert sf.fetch_seq("NM_0", 15) == SEQ[15:]
+    assert calls == [("NM_0", 10, 20), ("NM_0", 20, 100)]
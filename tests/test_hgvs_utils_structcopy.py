@@ -0,0 +1,91 @@
+import copy
+
+import pytest
+
+import hgvs.parsers
+from hgvs.utils.structcopy import structcopy
+
+hp = hgvs.parsers.Parser()
+
+
+def _attrs_objects(obj):
+    """yield obj and the attrs objects it contains"""
+    yield obj
+    for a in type(obj).__attrs_attrs__:
+        value = getattr(obj, a.name)
+        if hasattr(type(value), "__attrs_attrs__"):
+            yield from _attrs_objects(value)
+
+
+@pytest.mark.parametrize(
+    "hgvs_string",
+    [
+        "NC_000007.13:g.36561662_36561663insT",
+        "NM_000059.3:c.7790+5_7791-3delinsAAG",
+        "NM_000059.3:c.*5_*7dup",
+        "NM_000059.3:c.(7790+1_7791-1)_(7792+1_7793-1)del",
+        "NM_000059.3:c.7790_7792inv",
+        "NM_000059.3:c.7790_7791conNM_000060.3:c.15_16",
+        "NM_000059.3:c.7790_7791copy3",
+        "NP_000050.2:p.(Lys2597=)",
+        "NP_000050.2:p.Lys2597ArgfsTer5",
+        "NP_000050.2:p.Ter3419GlnextTer20",
+        "NP_000050.2:p.?",
+    ],
+)
+def test_structcopy(hgvs_string):
+    var = hp.parse(hgvs_string)
+    for var_copy in (structcopy(var), copy.deepcopy(var)):
+        assert var_copy == var
+        assert str(var_copy) == hgvs_string
+        assert repr(var_copy) == repr(var)
+        orig_ids = {id(obj) for obj in _attrs_objects(var)}
+        assert not orig_ids & {id(obj) for obj in _attrs_objects(var_copy)}
+
+
+def test_structcopy_is_independent():
+    var = hp.parse("NM_000059.3:c.7790+5_7791-3delinsAAG")
+    var_copy = structcopy(var)
+    var_copy.posedit.pos.start.offset = 6
+    var_copy.posedit.edit.alt = "AAGT"
+    assert str(var) == "NM_000059.3:c.7790+5_7791-3delinsAAG"
+    assert str(var_copy) == "NM_000059.3:c.7790+6_7791-3delinsAAGT"
+
+
+def test_structcopy_copies_other_values():
+    var = hp.parse("NM_000059.3:c.7790_7791delinsAAG")
+    var.gene = ["BRCA2"]
+    var_copy = structcopy(var)
+    assert var_copy.gene == ["BRCA2"]
+    assert var_copy.gene is not var.gene
+
+
+def test_structcopy_keeps_shared_references():
+    var = hp.parse("NM_000059.3:c.7790_7791delinsAAG")
+    var.gene = ["BRCA2"]
+    var.posedit.pos.end = var.posedit.pos.start
+    var_copy, var_copy2 = copy.deepcopy([var, var])
+    assert var_copy is var_copy2
+    assert var_copy is not var
+    assert var_copy.posedit.pos.end is var_copy.posedit.pos.start
+
+    gene, var_copy = copy.deepcopy([var.gene, var])
+    assert var_copy.gene is gene
+    assert gene is not var.gene
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
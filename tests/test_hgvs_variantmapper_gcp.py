@@ -1,3 +1,5 @@
+import concurrent.futures
+import copy
 import csv
 import os
 import re
@@ -121,6 +123,46 @@ class Test_VariantMapper(unittest.TestCase):
         for rec in gxp_file_reader("tests/data/gcp/noncoding.tsv"):
             self._test_gxp_mapping(rec)
 
+    def test_threads(self):
+        """map variants from many threads that share a VariantMapper and
+        input variants, and compare with single-threaded results"""
+        variants = [
+            (
+                self.hp.parse(rec["HGVSg"]),
+                self.hp.parse(rec["HGVSc"]),
+                self.hp.parse(rec["HGVSp"]).ac if rec["HGVSp"] else None,
+            )
+            for fn in (
+                "ADRA2B-dbSNP",
+                "FOLR3-dbSNP",
+                "JRK-dbSNP",
+                "ORAI1-dbSNP",
+                "real",
+                "noncoding",
+            )
+            for rec in gxp_file_reader(f"tests/data/gcp/{fn}.tsv")
+        ]
+        orig_variants = copy.deepcopy(variants)
+
+        def map_variants(executor=None):
+            hm = hgvs.variantmapper.VariantMapper(self.hdp)
+
+            def map_one(var_g, var_x, pro_ac):
+                results = [hm.g_to_t(var_g, var_x.ac), hm.t_to_g(var_x, var_g.ac)]
+                if pro_ac is not None:
+                    results.append(hm.c_to_p(var_x, pro_ac))
+                return results
+
+            if executor is None:
+                return [map_one(*vvp) for vvp in variants]
+            return list(executor.map(map_one, *zip(*variants, strict=True)))
+
+        expected = map_variants()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(3):
+                self.assertEqual(expected, map_variants(executor))
+        self.assertEqual(orig_variants, variants)
+
     def _test_gxp_mapping(self, rec):
         """given one record (row) of g, c/n/r, and p (optional) test variants, map
         g->c/n/r, c/n/r->g, and c->p and verify equivalence
@@ -151,6 +193,9 @@ class Test_VariantMapper(unittest.TestCase):
         )
 
         # c,n -> g
+        # (mapping doesn't fill in the reference of var_g; fill it in so
+        # that, e.g., a delins of the reference compares equal to "=")
+        var_g.fill_ref(self.hdp)
         if var_x.type == "c":
             var_g_test = self.hm.c_to_g(var_x, var_g.ac)
         elif var_x.type == "n":
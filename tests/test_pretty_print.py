@@ -1,10 +1,14 @@
 import unittest
 
 import pytest
+from bioutils.normalize import normalize
 
 import hgvs
 from hgvs.assemblymapper import AssemblyMapper
-from hgvs.pretty.prettyprint import PrettyPrint
+from hgvs.pretty.datacompiler import DataCompiler
+from hgvs.pretty.models import PrettyConfig
+from hgvs.pretty.prettyprint import _LOCUS_GAP, _MAX_LOCUS_SPAN, PrettyPrint
+from support.seq_hdp import SeqHdp
 
 
 @pytest.mark.skip(
@@ -173,6 +177,19 @@ class Test_SimplePosition(unittest.TestCase):
         for r, e in zip(result, expected_str, strict=False):
             self.assertEqual(e, r)
 
+    def test_display_many(self):
+        variants = [
+            self.hp.parse(hgvs_g)
+            for hgvs_g in (
+                "NC_000005.10:g.123346517_123346518insATTA",
+                "NC_000007.13:g.36561662del",
+                "NC_000005.10:g.123346510A>G",
+                "NM_198689.2:c.1=",
+            )
+        ]
+        expected = [self.pp.display(var) for var in variants]
+        self.assertEqual(expected, self.pp.display_many(variants))
+
     def test_atta_forward(self):
         """the ATTA[2]>ATTA[3] variant now displayed forward facing:"""
 
@@ -782,3 +799,70 @@ class Test_SimplePosition(unittest.TestCase):
         )
         for r, e in zip(result, expected_str, strict=False):
             self.assertEqual(e, r)
+
+
+@pytest.mark.quick
+@pytest.mark.parametrize(
+    ("hgvs_g", "n_fetches"),
+    [
+        ("NC_000001.11:g.1000_1001insA", 1),  # shuffles within a few bases
+        ("NC_000001.11:g.5500_5501insCA", 2),  # shuffles across a 1 kb repeat
+        ("NC_000001.11:g.20050_20051insCA", 1),  # shuffles to the end of the sequence
+    ],
+)
+def test_shuffled_variant_window(parser, hgvs_g, n_fetches):
+    seq = "ACGTTGCA" * 625 + "CA" * 500 + "ACGTTGCA" * 1750 + "CA" * 50
+    hdp = SeqHdp(seq)
+    dc = DataCompiler(PrettyConfig(hdp=hdp, assembly_mapper=None))
+    var_g = parser.parse(hgvs_g)
+    start, end, _, alt = dc.get_position_and_state(var_g)
+    for direction, mode in ((5, "LEFTSHUFFLE"), (3, "RIGHTSHUFFLE"), (0, "EXPAND")):
+        hdp.fetches.clear()
+        vc = dc.get_shuffled_variant(var_g, direction)
+        (n_start, n_end), (ref, alt_n) = normalize(
+            seq, interval=(start, end), alleles=(None, alt), mode=mode
+        )
+        assert (vc.start, vc.end, vc.ref, vc.alt) == (n_start, n_end, ref, alt_n)
+        assert sum(hdp.fetched_lengths) < len(seq)
+    assert len(hdp.fetches) == n_fetches
+
+
+@pytest.mark.quick
+def test_display_many(parser):
+    seq = "ACGTTGCA" * 625 + "CA" * 500 + "ACGTTGCA" * 1750 + "CA" * 50
+    hdp = SeqHdp(seq)
+    pp = PrettyPrint(hdp, None, infer_hgvs_c=False, reverse_display=False)
+    variants = [
+        parser.parse(hgvs_g)
+        for hgvs_g in (
+            "NC_000001.11:g.19000A>T",
+            "NC_000001.11:g.1000_1001insA",
+            "NC_000001.11:g.1010del",
+            "NC_000001.11:g.4990_4991insT",
+            "NC_000001.11:g.1030=",
+            "NC_000002.12:g.1005A>G",
+        )
+    ]
+    expected = [pp.display(var_g) for var_g in variants]
+
+    hdp.fetches.clear()
+    assert pp.display_many(variants) == expected
+    # one fetch for each of the three loci
+    assert len(hdp.fetches) == 3
+
+
+@pytest.mark.quick
+def test_display_many_bounded_loci(parser):
+    seq = "ACGTTGCA" * 25_000
+    hdp = SeqHdp(seq)
+    pp = PrettyPrint(hdp, None, infer_hgvs_c=False, reverse_display=False)
+    # evenly spaced variants, each within _LOCUS_GAP of the next
+    variants = [
+        parser.parse(f"NC_000001.11:g.{pos}A>T") for pos in range(1001, len(seq), _LOCUS_GAP // 2)
+    ]
+    expected = [pp.display(var_g) for var_g in variants]
+
+    hdp.fetches.clear()
+    assert pp.display_many(variants) == expected
+    assert len(hdp.fetches) > 1
+    assert max(hdp.fetched_lengths) <= _MAX_LOCUS_SPAN + 1_000